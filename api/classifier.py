@@ -1,5 +1,7 @@
 """文章分类模块"""
 
+from utils.keyword_matcher import get_matcher, rules_version
+
 # 默认分类规则
 DEFAULT_CATEGORY = "其他"
 
@@ -24,6 +26,8 @@ TAG_RULES = {
     "产品发布": ["发布", "新品", "上市", "推出"],
 }
 
+_DEFAULT_RULES_VERSION = rules_version(CATEGORY_RULES, TAG_RULES)
+
 
 def classify(text, category_rules=None, tag_rules=None):
     """
@@ -49,20 +53,14 @@ def classify(text, category_rules=None, tag_rules=None):
             "scores": {}
         }
     
-    # 使用传入的规则或默认规则
-    rules = category_rules if category_rules else CATEGORY_RULES
-    tags_rules = tag_rules if tag_rules else TAG_RULES
-    
-    text_lower = text.lower()
-    scores = {}
+    # 使用传入的规则或默认规则（默认规则的自动机只编译一次）
+    if category_rules or tag_rules:
+        matcher = get_matcher(category_rules or CATEGORY_RULES, tag_rules or TAG_RULES)
+    else:
+        matcher = get_matcher(CATEGORY_RULES, TAG_RULES, version=_DEFAULT_RULES_VERSION)
     
-    # 计算每个分类的得分
-    for category, keywords in rules.items():
-        if not keywords:  # 跳过空规则
-            continue
-        score = sum(1 for kw in keywords if kw.lower() in text_lower)
-        if score > 0:
-            scores[category] = score
+    # 一次扫描得到每个分类的得分和命中的标签
+    scores, tag_hits = matcher.count(text)
     
     # 选择最高分类
     if scores:
@@ -72,11 +70,7 @@ def classify(text, category_rules=None, tag_rules=None):
         category = DEFAULT_CATEGORY
         confidence = 0.0
     
-    # 提取标签
-    tags = []
-    for tag, keywords in tags_rules.items():
-        if any(kw.lower() in text_lower for kw in keywords):
-            tags.append(tag)
+    tags = list(tag_hits)
     
     return {
         "category": category,
@@ -23,6 +23,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 # 导入 API v2 路由
 from api.v2 import v2_router, daily_router
 from api.mcp import router as mcp_router
+from api.storage.app_storage import storage_lifespan
 
 # ==================== 限流中间件 ====================
 
@@ -85,6 +86,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # 存储适配器在启动时创建、关闭时释放，所有路由共用
+    lifespan=storage_lifespan,
 )
 
 # 注册限流中间件
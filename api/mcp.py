@@ -1,10 +1,9 @@
 """MCP (Model Context Protocol) Tools for AI Daily Collector"""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
-from config.config import get_storage_adapter
-from api.storage.dao import ArticleDAO
+from api.storage.app_storage import AppStorage, get_app_storage
 
 
 router = APIRouter(prefix="/mcp", tags=["MCP"])
@@ -309,12 +308,14 @@ async def list_tools():
 
 
 @router.post("/call")
-async def call_mcp_tool(request: MCPRequest):
+async def call_mcp_tool(
+    request: MCPRequest, app_storage: AppStorage = Depends(get_app_storage)
+):
     tool_name = request.tool
     arguments = request.arguments
 
-    storage = get_storage_adapter()
-    dao = ArticleDAO(storage) if storage else None
+    storage = app_storage.storage
+    dao = app_storage.sync_dao if storage else None
 
     if not dao:
         return {"error": "Storage not configured"}
@@ -428,10 +429,12 @@ async def call_mcp_tool(request: MCPRequest):
 
 
 @router.get("/articles/needing-processing")
-async def get_articles_needing_processing(limit: int = 10):
+async def get_articles_needing_processing(
+    limit: int = 10, app_storage: AppStorage = Depends(get_app_storage)
+):
     """获取需要处理的文章（HTTP 端点）"""
-    storage = get_storage_adapter()
-    dao = ArticleDAO(storage) if storage else None
+    storage = app_storage.storage
+    dao = app_storage.sync_dao if storage else None
 
     if not dao:
         return {"error": "Storage not configured"}
@@ -467,9 +470,11 @@ async def get_articles_needing_processing(limit: int = 10):
 
 
 @router.get("/articles/need-summary")
-async def get_articles_needing_summary(limit: int = 10):
-    storage = get_storage_adapter()
-    dao = ArticleDAO(storage) if storage else None
+async def get_articles_needing_summary(
+    limit: int = 10, app_storage: AppStorage = Depends(get_app_storage)
+):
+    storage = app_storage.storage
+    dao = app_storage.sync_dao if storage else None
 
     if not dao:
         return {"error": "Storage not configured"}
@@ -525,9 +530,13 @@ async def get_articles_needing_summary(limit: int = 10):
 
 
 @router.post("/articles/{article_id}/summarize")
-async def update_summary(article_id: str, request: ArticleSummaryRequest):
-    storage = get_storage_adapter()
-    dao = ArticleDAO(storage) if storage else None
+async def update_summary(
+    article_id: str,
+    request: ArticleSummaryRequest,
+    app_storage: AppStorage = Depends(get_app_storage),
+):
+    storage = app_storage.storage
+    dao = app_storage.sync_dao if storage else None
 
     if not dao:
         return {"error": "Storage not configured"}
@@ -2,6 +2,8 @@
 
 import json
 
+from utils.keyword_matcher import get_matcher
+
 
 class MCPTools:
     """MCP 工具注册和执行"""
@@ -231,12 +233,9 @@ def classify_text(text, category_rules=None, tag_rules=None):
     if tag_rules is None:
         tag_rules = {}
     
-    text_lower = text.lower()
-    
-    # 简单关键词匹配
-    for cat_name, keywords in category_rules.items():
-        for kw in keywords:
-            if kw.lower() in text_lower:
-                return {"category": cat_name, "tags": [], "scores": {cat_name: 1.0}}
+    # 简单关键词匹配：取规则顺序中第一个命中的分类
+    (scores,) = get_matcher(category_rules).count(text)
+    for cat_name in scores:
+        return {"category": cat_name, "tags": [], "scores": {cat_name: 1.0}}
     
     return {"category": "其他", "tags": [], "scores": {}}
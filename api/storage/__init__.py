@@ -0,0 +1,4 @@
+# API storage - DAOs, app-scoped adapters and the Workers D1 binding adapter
+from .workers_d1 import D1StorageAdapter
+
+__all__ = ["D1StorageAdapter"]
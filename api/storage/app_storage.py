@@ -0,0 +1,120 @@
+"""Application-scoped storage shared by the API routers.
+
+The adapters are created once when the app starts (``storage_lifespan``)
+and closed when it shuts down; the FastAPI dependencies below hand them to
+each request, so a request only pays for its own queries.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Request
+
+from config.config import (
+    AppConfig,
+    get_async_storage_adapter,
+    get_storage_adapter,
+    load_config_from_env,
+)
+from api.storage.dao import ArticleDAO, AsyncArticleDAO
+
+logger = logging.getLogger(__name__)
+
+
+class AppStorage:
+    """Storage adapters and DAOs for the lifetime of one app.
+
+    Attributes:
+        storage: Blocking adapter, for handlers that write (the MCP router)
+        async_storage: Adapter behind ``dao``: ``AsyncD1StorageAdapter`` for
+            D1, otherwise the same ``LocalDBAdapter`` as ``storage``
+        dao: DAO for the async read routes
+        sync_dao: Blocking DAO over ``storage``
+    """
+
+    def __init__(self, config: Optional[AppConfig] = None):
+        """Create the adapters (the local provider initializes its schema here).
+
+        Args:
+            config: Application configuration (loads from env if not provided)
+
+        Raises:
+            ValueError: If the configured provider is missing settings
+        """
+        if config is None:
+            config = load_config_from_env()
+        self.storage = get_storage_adapter(config)
+        if config.database.provider == "d1":
+            self.async_storage = get_async_storage_adapter(config, dedicated_pool=True)
+        else:
+            self.async_storage = self.storage
+        self.dao = AsyncArticleDAO(self.async_storage)
+        self.sync_dao = ArticleDAO(self.storage)
+
+    async def aclose(self) -> None:
+        """Close every adapter's connections."""
+        adapters = [self.storage]
+        if self.async_storage is not self.storage:
+            adapters.append(self.async_storage)
+        for adapter in adapters:
+            close = getattr(adapter, "aclose", None) or getattr(adapter, "close", None)
+            if close is None:
+                continue
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+
+_fallback_lock = threading.Lock()
+
+
+@asynccontextmanager
+async def storage_lifespan(app: FastAPI):
+    """FastAPI lifespan: open ``app.state.storage`` at startup, close it at shutdown.
+
+    A misconfigured provider does not stop the app from starting; requests
+    that need storage get a 503 and the health check reports the error.
+    """
+    app.state.storage_error = None
+    try:
+        app.state.storage = AppStorage()
+    except Exception as e:
+        logger.error(f"Storage unavailable: {e}")
+        app.state.storage = None
+        app.state.storage_error = str(e)
+    try:
+        yield
+    finally:
+        storage = getattr(app.state, "storage", None)
+        app.state.storage = None
+        if storage is not None:
+            await storage.aclose()
+
+
+def get_app_storage(request: Request) -> AppStorage:
+    """FastAPI dependency: the app's ``AppStorage``.
+
+    Apps whose lifespan did not run (e.g. a ``TestClient`` used without
+    ``with``) get one created on first use.
+    """
+    state = request.app.state
+    error = getattr(state, "storage_error", None)
+    if error is not None:
+        raise HTTPException(status_code=503, detail=f"Storage unavailable: {error}")
+    storage = getattr(state, "storage", None)
+    if storage is None:
+        with _fallback_lock:
+            storage = getattr(state, "storage", None)
+            if storage is None:
+                storage = state.storage = AppStorage()
+    return storage
+
+
+def get_article_dao(request: Request) -> AsyncArticleDAO:
+    """FastAPI dependency: the app-scoped ``AsyncArticleDAO``."""
+    return get_app_storage(request).dao
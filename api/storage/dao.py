@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 from typing import List, Dict, Any, Optional
 
 from shared.models import ArticleModel
@@ -76,3 +78,84 @@ class ArticleDAO:
                 sources.add(source)
 
         return {"total": len(all_articles), "sources": list(sources)}
+
+
+class AsyncArticleDAO:
+    """DAO for the async API routers.
+
+    Coroutine adapters (``AsyncD1StorageAdapter``) are awaited directly;
+    blocking adapters (``LocalDBAdapter``) run in a worker thread, so a
+    query never blocks the event loop either way.
+    """
+
+    def __init__(self, storage_adapter=None):
+        """Initialize DAO with a storage adapter.
+
+        Args:
+            storage_adapter: Async or blocking storage adapter instance
+        """
+        self.storage = storage_adapter
+
+    async def _call(self, name: str, *args, **kwargs):
+        method = getattr(self.storage, name)
+        if inspect.iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def fetch_articles(
+        self, filters: Optional[Dict[str, Any]] = None, limit: int = 50, offset: int = 0
+    ) -> List[ArticleModel]:
+        """Fetch articles with optional filtering and pagination.
+
+        Args:
+            filters: Optional filters (e.g., {'source': 'rss', 'category': 'tech'})
+            limit: Maximum number of articles to return
+            offset: Number of articles to skip
+
+        Returns:
+            List of ArticleModel instances
+        """
+        if self.storage is None:
+            return []
+
+        return await self._call("fetch_articles", filters or {}, limit=limit, offset=offset)
+
+    async def fetch_article_by_id(self, article_id: str) -> Optional[ArticleModel]:
+        """Fetch a single article by ID.
+
+        Args:
+            article_id: The unique article identifier
+
+        Returns:
+            ArticleModel instance or None if not found
+        """
+        if self.storage is None:
+            return None
+
+        articles = await self._call("fetch_articles", {"id": article_id}, limit=1)
+        if articles:
+            return articles[0]
+        return None
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get the total article count and per-source counts.
+
+        Returns:
+            Dictionary with ``total`` and a ``sources`` mapping of source to count
+        """
+        if self.storage is None:
+            return {"total": 0, "sources": {}}
+
+        return await self._call("get_stats")
+
+    def supports(self, name: str) -> bool:
+        """Whether the storage adapter implements an optional query method."""
+        return self.storage is not None and hasattr(self.storage, name)
+
+    async def get_crawl_logs(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get crawl logs, newest first."""
+        return await self._call("get_crawl_logs", limit=limit, offset=offset)
+
+    async def get_crawl_stats(self) -> Dict[str, Any]:
+        """Get crawl statistics."""
+        return await self._call("get_crawl_stats")
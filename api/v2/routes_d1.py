@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
-from fastapi import APIRouter, Query, HTTPException, Depends
+from fastapi import APIRouter, Query, HTTPException, Depends, Request
 from pydantic import BaseModel
 
-from config.config import load_config_from_env, get_storage_adapter
-from api.storage.dao import ArticleDAO
+from api.storage.app_storage import get_app_storage, get_article_dao
+from api.storage.dao import AsyncArticleDAO
 from shared.models import ArticleModel as SharedArticleModel
 
 
@@ -63,16 +64,6 @@ class HealthResponse(BaseModel):
     timestamp: str
 
 
-# ==================== Dependencies ====================
-
-
-def get_article_dao() -> ArticleDAO:
-    """Get ArticleDAO with configured storage."""
-    config = load_config_from_env()
-    storage = get_storage_adapter(config)
-    return ArticleDAO(storage_adapter=storage)
-
-
 # ==================== Router ====================
 
 router = APIRouter(prefix="/api/v2", tags=["API v2 - D1 Storage"])
@@ -84,7 +75,7 @@ async def get_articles(
     category: Optional[str] = Query(None, description="Filter by category (1-8 or new)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    dao: ArticleDAO = Depends(get_article_dao),
+    dao: AsyncArticleDAO = Depends(get_article_dao),
 ):
     """Get articles with pagination, source and category filters."""
     filters = {}
@@ -96,7 +87,11 @@ async def get_articles(
     offset = (page - 1) * page_size
 
     try:
-        articles = dao.fetch_articles(filters=filters, limit=page_size, offset=offset)
+        # The page and the total count are independent queries: run them together
+        articles, stats = await asyncio.gather(
+            dao.fetch_articles(filters=filters, limit=page_size, offset=offset),
+            dao.get_stats(),
+        )
 
         article_responses = []
         for article in articles:
@@ -115,7 +110,6 @@ async def get_articles(
                 )
             )
 
-        stats = dao.get_stats()
         total = stats.get("total", len(article_responses))
 
         return ArticleListResponse(
@@ -127,10 +121,10 @@ async def get_articles(
 
 
 @router.get("/articles/{article_id}", response_model=ArticleResponse)
-async def get_article_by_id(article_id: str, dao: ArticleDAO = Depends(get_article_dao)):
+async def get_article_by_id(article_id: str, dao: AsyncArticleDAO = Depends(get_article_dao)):
     """Get a single article by ID."""
     try:
-        article = dao.fetch_article_by_id(article_id)
+        article = await dao.fetch_article_by_id(article_id)
 
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -155,10 +149,10 @@ async def get_article_by_id(article_id: str, dao: ArticleDAO = Depends(get_artic
 
 
 @router.get("/stats", response_model=StatsResponse)
-async def get_stats(dao: ArticleDAO = Depends(get_article_dao)):
+async def get_stats(dao: AsyncArticleDAO = Depends(get_article_dao)):
     """Get database statistics."""
     try:
-        stats = dao.get_stats()
+        stats = await dao.get_stats()
 
         sources = [
             SourceStats(source=source, count=count)
@@ -179,26 +173,24 @@ async def get_stats(dao: ArticleDAO = Depends(get_article_dao)):
 
 
 @router.get("/sources", response_model=List[str])
-async def get_sources(dao: ArticleDAO = Depends(get_article_dao)):
+async def get_sources(dao: AsyncArticleDAO = Depends(get_article_dao)):
     """Get list of all sources."""
     try:
-        stats = dao.get_stats()
+        stats = await dao.get_stats()
         return list(stats.get("sources", {}).keys())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint."""
-    config = load_config_from_env()
-
     try:
-        # Try to connect to database
-        storage = get_storage_adapter(config)
-        if hasattr(storage, "get_stats"):
-            storage.get_stats()
+        # Try to query the database
+        await get_app_storage(request).dao.get_stats()
         db_status = "connected"
+    except HTTPException as e:
+        db_status = f"error: {e.detail}"
     except Exception as e:
         db_status = f"error: {str(e)}"
 
@@ -247,16 +239,15 @@ class CrawlStatsResponse(BaseModel):
 async def get_crawl_logs(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    dao: ArticleDAO = Depends(get_article_dao),
+    dao: AsyncArticleDAO = Depends(get_article_dao),
 ):
     """Get crawl logs with pagination."""
     try:
-        storage = dao.storage
-        if not hasattr(storage, "get_crawl_logs"):
+        if not dao.supports("get_crawl_logs"):
             raise HTTPException(status_code=501, detail="Crawl logs not supported")
 
         offset = (page - 1) * page_size
-        logs = storage.get_crawl_logs(limit=page_size, offset=offset)
+        logs = await dao.get_crawl_logs(limit=page_size, offset=offset)
 
         log_responses = []
         for log in logs:
@@ -287,14 +278,13 @@ async def get_crawl_logs(
 
 
 @router.get("/crawl-stats", response_model=CrawlStatsResponse)
-async def get_crawl_stats(dao: ArticleDAO = Depends(get_article_dao)):
+async def get_crawl_stats(dao: AsyncArticleDAO = Depends(get_article_dao)):
     """Get crawl statistics."""
     try:
-        storage = dao.storage
-        if not hasattr(storage, "get_crawl_stats"):
+        if not dao.supports("get_crawl_stats"):
             raise HTTPException(status_code=501, detail="Crawl stats not supported")
 
-        stats = storage.get_crawl_stats()
+        stats = await dao.get_crawl_stats()
 
         return CrawlStatsResponse(
             total_crawls=stats.get("total_crawls", 0),
@@ -8,8 +8,8 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, Query, HTTPException, Depends
 from pydantic import BaseModel
 
-from config.config import load_config_from_env, get_storage_adapter
-from api.storage.dao import ArticleDAO
+from api.storage.app_storage import get_article_dao
+from api.storage.dao import AsyncArticleDAO
 
 
 # ==================== Pydantic Models ====================
@@ -43,18 +43,11 @@ class DailyHotspotsResponse(BaseModel):
 router = APIRouter(prefix="/api/v2/daily", tags=["Daily Hotspots"])
 
 
-def get_article_dao() -> ArticleDAO:
-    """Get ArticleDAO with configured storage."""
-    config = load_config_from_env()
-    storage = get_storage_adapter(config)
-    return ArticleDAO(storage_adapter=storage)
-
-
 @router.get("/latest", response_model=DailyHotspotsResponse)
 async def get_latest_hotspots(
     limit: int = Query(20, ge=1, le=100, description="Number of hotspots to return"),
     hours: int = Query(24, ge=1, le=168, description="Hours to look back"),
-    dao: ArticleDAO = Depends(get_article_dao),
+    dao: AsyncArticleDAO = Depends(get_article_dao),
 ):
     """
     Get the latest AI hotspots from the past N hours.
@@ -66,7 +59,7 @@ async def get_latest_hotspots(
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
         # Fetch recent articles
-        articles = dao.fetch_articles(filters={}, limit=limit * 2, offset=0)
+        articles = await dao.fetch_articles(filters={}, limit=limit * 2, offset=0)
 
         # Filter and transform articles
         hotspots = []
@@ -159,7 +152,7 @@ async def get_latest_hotspots(
 @router.get("/hotspots", response_model=DailyHotspotsResponse)
 async def get_hotspots(
     limit: int = Query(20, ge=1, le=100, description="Number of hotspots"),
-    dao: ArticleDAO = Depends(get_article_dao),
+    dao: AsyncArticleDAO = Depends(get_article_dao),
 ):
     """
     Alias for /latest endpoint.
@@ -35,6 +35,12 @@ class AppConfig:
     # Ingestion settings
     max_articles_per_source: int = 50
     ingestion_timeout: int = 300  # seconds
+    ingestion_concurrency: int = 8  # sources fetched in parallel
+    ingestion_per_host_limit: int = 2  # parallel fetches against one host
+    ingestion_batch_size: int = 100  # articles per storage batch write
+    seen_index_path: str = ".ai_cache/seen_index.db"  # "" disables the seen-URL index
+    near_duplicate_index_path: str = ".ai_cache/near_duplicates.db"  # "" disables it
+    near_duplicate_threshold: float = 0.7  # title Jaccard similarity to collapse
 
     # Logging
     log_level: str = "INFO"
@@ -65,6 +71,15 @@ def load_config_from_env() -> AppConfig:
         # Ingestion
         MAX_ARTICLES_PER_SOURCE: Max articles per source (default: 50)
         INGESTION_TIMEOUT: Timeout in seconds (default: 300)
+        INGESTION_CONCURRENCY: Sources fetched in parallel (default: 8)
+        INGESTION_PER_HOST_LIMIT: Parallel fetches per host (default: 2)
+        INGESTION_BATCH_SIZE: Articles per storage batch write (default: 100)
+        SEEN_INDEX_PATH: Seen-URL index file, empty to disable
+            (default: .ai_cache/seen_index.db)
+        NEAR_DUPLICATE_INDEX_PATH: Near-duplicate index file, empty to disable
+            (default: .ai_cache/near_duplicates.db)
+        NEAR_DUPLICATE_THRESHOLD: Title similarity (0-1] at which copies of a
+            story from different sources are collapsed (default: 0.7)
 
         # Logging
         LOG_LEVEL: Logging level (default: INFO)
@@ -88,6 +103,14 @@ def load_config_from_env() -> AppConfig:
     # Ingestion settings
     config.max_articles_per_source = int(os.getenv("MAX_ARTICLES_PER_SOURCE", "50"))
     config.ingestion_timeout = int(os.getenv("INGESTION_TIMEOUT", "300"))
+    config.ingestion_concurrency = int(os.getenv("INGESTION_CONCURRENCY", "8"))
+    config.ingestion_per_host_limit = int(os.getenv("INGESTION_PER_HOST_LIMIT", "2"))
+    config.ingestion_batch_size = int(os.getenv("INGESTION_BATCH_SIZE", "100"))
+    config.seen_index_path = os.getenv("SEEN_INDEX_PATH", ".ai_cache/seen_index.db")
+    config.near_duplicate_index_path = os.getenv(
+        "NEAR_DUPLICATE_INDEX_PATH", ".ai_cache/near_duplicates.db"
+    )
+    config.near_duplicate_threshold = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.7"))
 
     # Logging
     config.log_level = os.getenv("LOG_LEVEL", "INFO")
@@ -96,6 +119,17 @@ def load_config_from_env() -> AppConfig:
     return config
 
 
+def _require_d1_settings(config: AppConfig) -> None:
+    """Raise ValueError unless the D1 credentials are configured."""
+    if not all(
+        [config.database.account_id, config.database.database_id, config.database.api_token]
+    ):
+        raise ValueError(
+            "D1 provider requires CF_ACCOUNT_ID, CF_D1_DATABASE_ID, "
+            "and CF_API_TOKEN environment variables"
+        )
+
+
 def get_storage_adapter(config: Optional[AppConfig] = None):
     """Get appropriate storage adapter based on configuration.
 
@@ -112,13 +146,7 @@ def get_storage_adapter(config: Optional[AppConfig] = None):
         from ingestor.storage.d1_adapter import D1StorageAdapter
 
         # Validate required D1 config
-        if not all(
-            [config.database.account_id, config.database.database_id, config.database.api_token]
-        ):
-            raise ValueError(
-                "D1 provider requires CF_ACCOUNT_ID, CF_D1_DATABASE_ID, "
-                "and CF_API_TOKEN environment variables"
-            )
+        _require_d1_settings(config)
 
         return D1StorageAdapter(
             account_id=config.database.account_id,
@@ -129,3 +157,47 @@ def get_storage_adapter(config: Optional[AppConfig] = None):
         from ingestor.storage.db import LocalDBAdapter
 
         return LocalDBAdapter(connection_string=config.database.connection_string)
+
+
+def get_async_storage_adapter(
+    config: Optional[AppConfig] = None, dedicated_pool: bool = False
+):
+    """Get a storage adapter for asyncio code (the FastAPI routers).
+
+    For the D1 provider this is an ``AsyncD1StorageAdapter`` whose queries
+    are coroutines. The local SQLite provider has no async driver, so the
+    blocking ``LocalDBAdapter`` is returned; ``AsyncArticleDAO`` runs its
+    queries in a worker thread.
+
+    Args:
+        config: Application configuration (loads from env if not provided)
+        dedicated_pool: Give a D1 adapter its own connection pool, closed by
+            its ``aclose()``, instead of the event loop's shared pool
+
+    Returns:
+        AsyncD1StorageAdapter or LocalDBAdapter instance
+    """
+    if config is None:
+        config = load_config_from_env()
+
+    if config.database.provider == "d1":
+        from ingestor.storage.async_d1_adapter import AsyncD1StorageAdapter
+        from ingestor.storage.d1_adapter import d1_http_settings
+
+        _require_d1_settings(config)
+
+        pool_options = {}
+        if dedicated_pool:
+            settings = d1_http_settings()
+            pool_options = {
+                "pool_size": settings["max_connections_per_host"],
+                "timeout": settings["timeout"],
+                "keepalive_expiry": settings["keepalive_expiry"],
+            }
+        return AsyncD1StorageAdapter(
+            account_id=config.database.account_id,
+            database_id=config.database.database_id,
+            api_token=config.database.api_token,
+            **pool_options,
+        )
+    return get_storage_adapter(config)
@@ -25,9 +25,10 @@ from typing import Any, Dict, List, Optional
 def extract_article(context: OpExecutionContext, url: str) -> Dict[str, Any]:
     """Extract article content from URL."""
     try:
+        from scripts.components import shared
         from scripts.extractors import TrafilaturaExtractor
 
-        extractor = TrafilaturaExtractor()
+        extractor = shared(TrafilaturaExtractor)
         content = extractor.extract(url)
     except Exception as e:
         context.log.warning(f"Extraction failed for {url}: {e}")
@@ -54,9 +55,10 @@ def generate_summary(context: OpExecutionContext, article: Dict[str, Any]) -> Di
         return article
 
     try:
+        from scripts.components import shared
         from scripts.summarizers import OllamaSummarizer
 
-        summarizer = OllamaSummarizer()
+        summarizer = shared(OllamaSummarizer)
         content = article.get("content", "")
         summary = summarizer.summarize(content[:3000])
     except Exception as e:
@@ -79,12 +81,13 @@ def classify_article(context: OpExecutionContext, article: Dict[str, Any]) -> Di
         return article
 
     try:
+        from scripts.components import shared
         from scripts.classifiers import BGEClassifier
 
-        classifier = BGEClassifier()
+        classifier = shared(BGEClassifier)
         title = article.get("title", "")
         summary = article.get("summary", "")
-        result = classifier.classify(title + " " + summary)
+        result = classifier.classify_many([title + " " + summary])[0]
     except Exception as e:
         context.log.error(f"Classification failed: {e}")
         result = {"category": "new", "tags": []}
@@ -96,6 +99,41 @@ def classify_article(context: OpExecutionContext, article: Dict[str, Any]) -> Di
     }
 
 
+@solid(
+    name="classify_articles",
+    description="Classify a batch of articles using BGE",
+)
+def classify_articles(
+    context: OpExecutionContext, articles: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Classify many articles with one batched encode and one matrix multiply."""
+    pending = [a for a in articles if a.get("success")]
+    if not pending:
+        return articles
+
+    try:
+        from scripts.components import shared
+        from scripts.classifiers import BGEClassifier
+
+        classifier = shared(BGEClassifier)
+        results = classifier.classify_many(
+            [a.get("title", "") + " " + a.get("summary", "") for a in pending]
+        )
+    except Exception as e:
+        context.log.error(f"Batch classification failed: {e}")
+        results = [{"category": "new", "tags": []} for _ in pending]
+
+    classified = {
+        id(article): {
+            **article,
+            "category": result.get("category", "new"),
+            "tags": result.get("tags", []),
+        }
+        for article, result in zip(pending, results)
+    }
+    return [classified.get(id(a), a) for a in articles]
+
+
 @solid(
     name="persist_article",
     description="Save processed article to storage",
@@ -4,10 +4,14 @@
 from __future__ import annotations
 
 import argparse
+import logging
 import time
 import re
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, NamedTuple, Optional
 from datetime import datetime
+from urllib.parse import urlparse
 
 try:
     import yaml
@@ -23,8 +27,11 @@ from ingestor.scrapers import (
     fetch_reddit,
     fetch_arxiv,
 )
+from ingestor.scrapers.feed_cache import PendingValidators
 from ingestor.transformers.article_transformer import transform
 from shared.models import ArticleModel
+from ingestor.storage.near_duplicates import NearDuplicateIndex
+from ingestor.storage.seen_index import SeenIndex, article_key
 from config.config import load_config_from_env, get_storage_adapter
 from utils.logging_config import (
     setup_logging,
@@ -33,6 +40,26 @@ from utils.logging_config import (
     log_ingestion_error,
 )
 
+# Hosts for source types whose config carries no fetchable URL
+_SOURCE_TYPE_HOSTS = {
+    "newsnow": "newsnow.busiyi.world",
+    "hackernews": "hacker-news.firebaseio.com",
+    "devto": "dev.to",
+    "v2ex": "www.v2ex.com",
+    "reddit": "www.reddit.com",
+    "arxiv": "export.arxiv.org",
+    "youtube": "www.youtube.com",
+}
+
+
+class SourceResult(NamedTuple):
+    """Outcome of ingesting one source."""
+
+    written: int
+    skipped: int
+    collapsed: int
+    error: Optional[Exception]
+
 
 def _load_sources_config(path: str) -> List[Dict[str, Any]]:
     """Load sources configuration from YAML file."""
@@ -78,15 +105,26 @@ def _filter_by_keyword(items: List[Dict[str, Any]], keyword: str) -> List[Dict[s
     return filtered
 
 
-def _fetch_from_source(src: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Fetch articles from a single source based on its type."""
+def _fetch_from_source(
+    src: Dict[str, Any],
+    use_feed_cache: bool = True,
+    pending_validators: Optional[List[PendingValidators]] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch articles from a single source based on its type.
+
+    ``use_feed_cache`` enables conditional GETs for feed sources; unchanged
+    feeds then yield no items. With ``pending_validators`` the feed's new
+    validators are collected there instead of being stored (see ``fetch_rss``).
+    """
     source_type = src.get("type", "rss")
     filters = src.get("filters", {})
 
     if source_type == "rss":
         url = src.get("url")
         if url:
-            items = fetch_rss(url)
+            items = fetch_rss(
+                url, use_cache=use_feed_cache, pending_validators=pending_validators
+            )
             keyword = filters.get("keyword", "")
             return _filter_by_keyword(items, keyword)
 
@@ -127,7 +165,9 @@ def _fetch_from_source(src: Dict[str, Any]) -> List[Dict[str, Any]]:
     elif source_type in ("ai_blogs", "tech_media", "podcast", "producthunt"):
         url = src.get("url")
         if url:
-            items = fetch_rss(url)
+            items = fetch_rss(
+                url, use_cache=use_feed_cache, pending_validators=pending_validators
+            )
             keyword = filters.get("keyword", "")
             return _filter_by_keyword(items, keyword)
 
@@ -135,13 +175,279 @@ def _fetch_from_source(src: Dict[str, Any]) -> List[Dict[str, Any]]:
         channel_id = src.get("channel_id")
         if channel_id:
             url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-            items = fetch_rss(url)
+            items = fetch_rss(
+                url, use_cache=use_feed_cache, pending_validators=pending_validators
+            )
             keyword = filters.get("keyword", "")
             return _filter_by_keyword(items, keyword)
 
     return []
 
 
+def _source_host(src: Dict[str, Any]) -> str:
+    """Return the host a source is fetched from, used for per-host limiting."""
+    url = src.get("url")
+    if url:
+        host = urlparse(url).netloc.lower()
+        if host:
+            return host
+    source_type = src.get("type", "rss")
+    return _SOURCE_TYPE_HOSTS.get(source_type, source_type)
+
+
+def _article_field(article: Any, name: str) -> Any:
+    if isinstance(article, dict):
+        return article.get(name)
+    return getattr(article, name, None)
+
+
+def _record_written(
+    articles: List[ArticleModel],
+    seen_index: Optional[SeenIndex],
+    near_duplicates: Optional[NearDuplicateIndex],
+) -> None:
+    """Record stored articles in the dedup indexes so later items skip them."""
+    if not articles:
+        return
+    if seen_index is not None:
+        seen_index.add_many(
+            (
+                _article_field(article, "url"),
+                _article_field(article, "id"),
+                _article_field(article, "title"),
+            )
+            for article in articles
+        )
+    if near_duplicates is not None:
+        near_duplicates.add_many(
+            (
+                article_key(_article_field(article, "url"), _article_field(article, "id")),
+                _article_field(article, "title"),
+                _article_field(article, "content"),
+            )
+            for article in articles
+        )
+
+
+def _flush_articles(
+    storage: Any,
+    buffer: List[ArticleModel],
+    logger: logging.Logger,
+    on_written: Optional[Callable[[List[ArticleModel]], None]] = None,
+) -> int:
+    """Write buffered articles in one batch, returning how many were stored.
+
+    If the batch is rejected, fall back to per-article upserts so a single bad
+    row does not drop the rest of the buffer. ``on_written`` is called with
+    the articles that actually reached storage.
+    """
+    try:
+        count = storage.upsert_articles(buffer)
+        if on_written is not None:
+            on_written(buffer)
+        return count
+    except Exception as e:
+        logger.warning(f"Batch upsert of {len(buffer)} articles failed, retrying one by one: {e}")
+
+    written = []
+    for article_obj in buffer:
+        try:
+            storage.upsert_article(article_obj)
+            written.append(article_obj)
+        except Exception as e:
+            logger.warning(f"Failed to process article: {e}")
+    if on_written is not None:
+        on_written(written)
+    return len(written)
+
+
+def _ingest_source(
+    src: Dict[str, Any],
+    storage: Any,
+    dry_run: bool,
+    logger: logging.Logger,
+    batch_size: int = 100,
+    seen_index: Optional[SeenIndex] = None,
+    near_duplicates: Optional[NearDuplicateIndex] = None,
+) -> SourceResult:
+    """Fetch, transform and store a single source, then record its crawl log.
+
+    Items already recorded in ``seen_index`` (same normalized URL and title)
+    are dropped before ``transform``, and items ``near_duplicates`` matches
+    to a known story from any source are collapsed into it. Transformed
+    articles are buffered and written ``batch_size`` at a time through
+    ``storage.upsert_articles``.
+
+    Safe to call from worker threads: every storage call opens its own
+    connection/request.
+
+    Returns:
+        SourceResult with articles written, items skipped as already ingested,
+        items collapsed as near-duplicates, and the error (None on success)
+    """
+    source_name = src.get("name", "unknown")
+    source_type = src.get("type", "unknown")
+
+    source_start_time = time.time()
+    log_ingestion_start(logger, source_name)
+
+    # Near-duplicate claims of items that may not reach storage
+    claimed: List[str] = []
+    try:
+        # Dry runs must not record feed validators, or the next real run skips them
+        pending_validators: List[PendingValidators] = []
+        items = _fetch_from_source(
+            src, use_feed_cache=not dry_run, pending_validators=pending_validators
+        )
+
+        skipped = 0
+        if seen_index is not None:
+            items, skipped = seen_index.filter_new(items)
+            if skipped:
+                logger.info(f"{source_name}: skipped {skipped} already-ingested articles")
+
+        collapsed = 0
+        if near_duplicates is not None:
+            items, collapsed = near_duplicates.filter_new(
+                items, lambda item: article_key(item.get("url"), item.get("id"))
+            )
+            claimed = [article_key(item.get("url"), item.get("id")) for item in items]
+            if collapsed:
+                logger.info(f"{source_name}: collapsed {collapsed} near-duplicate articles")
+
+        def on_written(articles: List[ArticleModel]) -> None:
+            _record_written(articles, seen_index, near_duplicates)
+
+        count = 0
+        buffered = 0
+        buffer: List[ArticleModel] = []
+        for it in items:
+            try:
+                article = transform(it)
+                article_obj = (
+                    article if isinstance(article, ArticleModel) else ArticleModel(**article)
+                )
+
+                if not dry_run:
+                    buffer.append(article_obj)
+                    buffered += 1
+                    if len(buffer) >= batch_size:
+                        count += _flush_articles(storage, buffer, logger, on_written)
+                        buffer = []
+
+            except Exception as e:
+                logger.warning(f"Failed to process article: {e}")
+                continue
+
+        if buffer:
+            count += _flush_articles(storage, buffer, logger, on_written)
+
+        # Only now is it safe to let the next run skip this feed's content
+        if count == buffered:
+            for validators in pending_validators:
+                validators.commit()
+
+        source_duration = (time.time() - source_start_time) * 1000
+
+        log_ingestion_complete(logger, source_name, count, source_duration)
+
+        # Log to D1 if supported
+        if hasattr(storage, "write_crawl_log") and not dry_run:
+            try:
+                storage.write_crawl_log(
+                    source_name=source_name,
+                    source_type=source_type,
+                    articles_count=count,
+                    duration_ms=int(source_duration),
+                    status="success",
+                )
+            except Exception as e:
+                logger.warning(f"Failed to write crawl log: {e}")
+
+        return SourceResult(count, skipped, collapsed, None)
+
+    except Exception as e:
+        log_ingestion_error(logger, source_name, e)
+
+        # Log failure to D1 if supported
+        if hasattr(storage, "write_crawl_log") and not dry_run:
+            try:
+                source_duration = (time.time() - source_start_time) * 1000
+                storage.write_crawl_log(
+                    source_name=source_name,
+                    source_type=source_type,
+                    articles_count=0,
+                    duration_ms=int(source_duration),
+                    status="failed",
+                    error_message=str(e),
+                )
+            except Exception as log_error:
+                logger.warning(f"Failed to write crawl log: {log_error}")
+
+        return SourceResult(0, 0, 0, e)
+
+    finally:
+        # Stored articles were persisted by on_written; free the rest
+        if near_duplicates is not None and claimed:
+            near_duplicates.release(claimed)
+
+
+def _ingest_sources(
+    sources: List[Dict[str, Any]],
+    storage: Any,
+    dry_run: bool,
+    logger: logging.Logger,
+    concurrency: int = 1,
+    per_host_limit: int = 1,
+    batch_size: int = 100,
+    seen_index: Optional[SeenIndex] = None,
+    near_duplicates: Optional[NearDuplicateIndex] = None,
+) -> List[SourceResult]:
+    """Ingest many sources on a bounded worker pool.
+
+    Sources are grouped by host and each host gets at most ``per_host_limit``
+    lanes; a lane pulls that host's sources one after another, so no worker
+    ever sits blocked waiting for a busy host while other hosts have work.
+
+    Returns:
+        One ``_ingest_source`` result per source, in the order given
+    """
+    if concurrency <= 1:
+        return [
+            _ingest_source(
+                src, storage, dry_run, logger, batch_size, seen_index, near_duplicates
+            )
+            for src in sources
+        ]
+
+    results: List[SourceResult] = [SourceResult(0, 0, 0, None)] * len(sources)
+
+    by_host: Dict[str, deque] = {}
+    for index, src in enumerate(sources):
+        by_host.setdefault(_source_host(src), deque()).append(index)
+
+    def _lane(pending: deque) -> None:
+        while True:
+            try:
+                index = pending.popleft()
+            except IndexError:
+                return
+            results[index] = _ingest_source(
+                sources[index], storage, dry_run, logger, batch_size, seen_index, near_duplicates
+            )
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ingest") as executor:
+        futures = [
+            executor.submit(_lane, pending)
+            for pending in by_host.values()
+            for _ in range(min(per_host_limit, len(pending)))
+        ]
+        for future in futures:
+            future.result()
+
+    return results
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         prog="ingest", description="Production ingestion pipeline with D1 support"
@@ -155,6 +461,31 @@ def main() -> int:
     parser.add_argument("--dry-run", action="store_true", help="Run without persisting data")
     parser.add_argument("--source-type", type=str, help="Only process specific source type")
     parser.add_argument("--log-file", type=str, help="Optional log file path")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Number of sources fetched in parallel (default: INGESTION_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--per-host-limit",
+        type=int,
+        help="Max parallel fetches against one host (default: INGESTION_PER_HOST_LIMIT)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Articles written per storage batch (default: INGESTION_BATCH_SIZE)",
+    )
+    parser.add_argument(
+        "--no-seen-index",
+        action="store_true",
+        help="Re-ingest every fetched article instead of skipping already-stored ones",
+    )
+    parser.add_argument(
+        "--no-near-duplicates",
+        action="store_true",
+        help="Keep copies of the same story published by several sources",
+    )
     args = parser.parse_args()
 
     app_config = load_config_from_env()
@@ -196,79 +527,74 @@ def main() -> int:
         logger.error(f"Failed to initialize storage: {e}")
         return 1
 
+    seen_index: Optional[SeenIndex] = None
+    if app_config.seen_index_path and not args.no_seen_index:
+        try:
+            seen_index = SeenIndex(app_config.seen_index_path)
+            warmed = seen_index.warm_from_storage(storage)
+            if warmed:
+                logger.info(f"Seen-URL index warmed with {warmed} stored articles")
+        except Exception as e:
+            logger.warning(f"Seen-URL index unavailable, ingesting everything: {e}")
+            seen_index = None
+
+    near_duplicates: Optional[NearDuplicateIndex] = None
+    if app_config.near_duplicate_index_path and not args.no_near_duplicates:
+        try:
+            near_duplicates = NearDuplicateIndex(
+                app_config.near_duplicate_index_path, app_config.near_duplicate_threshold
+            )
+            warmed = near_duplicates.warm_from_storage(storage)
+            if warmed:
+                logger.info(f"Near-duplicate index warmed with {warmed} stored articles")
+        except Exception as e:
+            logger.warning(f"Near-duplicate index unavailable, keeping all copies: {e}")
+            near_duplicates = None
+
     articles_written = 0
+    articles_skipped = 0
+    articles_collapsed = 0
     source_stats: Dict[str, int] = {}
     failed_sources: List[str] = []
 
-    ingestion_start_time = time.time()
+    enabled_sources = [src for src in sources if src.get("enabled", True)]
+    concurrency = max(1, args.concurrency or app_config.ingestion_concurrency)
+    per_host_limit = max(1, args.per_host_limit or app_config.ingestion_per_host_limit)
+    batch_size = max(1, args.batch_size or app_config.ingestion_batch_size)
 
-    for src in sources:
-        if not src.get("enabled", True):
-            continue
+    logger.info(
+        f"Fetching {len(enabled_sources)} sources "
+        f"(concurrency={concurrency}, per_host_limit={per_host_limit})"
+    )
 
-        source_name = src.get("name", "unknown")
-        source_type = src.get("type", "unknown")
+    ingestion_start_time = time.time()
 
-        source_start_time = time.time()
-        log_ingestion_start(logger, source_name)
+    results = _ingest_sources(
+        enabled_sources,
+        storage,
+        args.dry_run,
+        logger,
+        concurrency,
+        per_host_limit,
+        batch_size,
+        seen_index,
+        near_duplicates,
+    )
 
-        try:
-            items = _fetch_from_source(src)
-
-            count = 0
-            for it in items:
-                try:
-                    article = transform(it)
-                    article_obj = (
-                        article if isinstance(article, ArticleModel) else ArticleModel(**article)
-                    )
-
-                    if not args.dry_run:
-                        storage.upsert_article(article_obj)
-                        articles_written += 1
-                        count += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to process article: {e}")
-                    continue
-
-            source_duration = (time.time() - source_start_time) * 1000
-            source_stats[source_name] = count
-
-            log_ingestion_complete(logger, source_name, count, source_duration)
-
-            # Log to D1 if supported
-            if hasattr(storage, "write_crawl_log") and not args.dry_run:
-                try:
-                    storage.write_crawl_log(
-                        source_name=source_name,
-                        source_type=source_type,
-                        articles_count=count,
-                        duration_ms=int(source_duration),
-                        status="success",
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to write crawl log: {e}")
+    for index in (seen_index, near_duplicates):
+        if index is not None:
+            index.close()
 
-        except Exception as e:
+    # Aggregate in config order so the summary matches a sequential run
+    for src, result in zip(enabled_sources, results):
+        source_name = src.get("name", "unknown")
+        if result.error is not None:
             failed_sources.append(source_name)
-            log_ingestion_error(logger, source_name, e)
-
-            # Log failure to D1 if supported
-            if hasattr(storage, "write_crawl_log") and not args.dry_run:
-                try:
-                    source_duration = (time.time() - source_start_time) * 1000
-                    storage.write_crawl_log(
-                        source_name=source_name,
-                        source_type=source_type,
-                        articles_count=0,
-                        duration_ms=int(source_duration),
-                        status="failed",
-                        error_message=str(e),
-                    )
-                except Exception as log_error:
-                    logger.warning(f"Failed to write crawl log: {log_error}")
             continue
+        articles_written += result.written
+        articles_skipped += result.skipped
+        articles_collapsed += result.collapsed
+        source_stats[source_name] = result.written
 
     total_duration = (time.time() - ingestion_start_time) * 1000
 
@@ -276,6 +602,8 @@ def main() -> int:
     logger.info("INGESTION COMPLETE")
     logger.info(f"Total duration: {total_duration:.2f}ms")
     logger.info(f"Total articles written: {articles_written}")
+    logger.info(f"Skipped already-ingested articles: {articles_skipped}")
+    logger.info(f"Collapsed near-duplicate articles: {articles_collapsed}")
     logger.info(f"Successful sources: {len(source_stats) - len(failed_sources)}")
     logger.info(f"Failed sources: {len(failed_sources)}")
 
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
-import urllib.request
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 import urllib.parse
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 
+from ingestor.scrapers.http_client import http_stream
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+# Define namespace
+NS = {"atom": ATOM_NS, "arxiv": "http://arxiv.org/schemas/atom"}
+
 
 def fetch_arxiv(search_query: str = "cat:cs.AI", max_articles: int = 15) -> List[Dict[str, Any]]:
     """Fetch papers from ArXiv API.
@@ -41,84 +46,113 @@ def fetch_arxiv(search_query: str = "cat:cs.AI", max_articles: int = 15) -> List
         query_string = urllib.parse.urlencode(params)
         url = f"http://export.arxiv.org/api/query?{query_string}"
 
-        req = urllib.request.Request(
-            url, headers={"User-Agent": "Mozilla/5.0 (compatible; AI-Daily-Collector/1.0)"}
-        )
+        with http_stream(url, timeout=30) as response:
+            response.raise_for_status()
+            for item in iter_arxiv_entries(response.iter_content(), max_articles):
+                items.append(item)
 
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = response.read().decode("utf-8")
+    except Exception:
+        return []
 
-        # Parse XML
-        root = ET.fromstring(data)
+    return items
 
-        # Define namespace
-        ns = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
 
-        # Find all entry elements
-        for entry in root.findall(".//atom:entry", ns):
-            title_elem = entry.find("atom:title", ns)
-            title = title_elem.text if title_elem is not None else ""
-            title = title.replace("\n", " ").strip() if title else ""
+def iter_arxiv_entries(
+    chunks: Iterable[bytes], max_entries: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """Incrementally parse an ArXiv Atom response, yielding each paper as it closes.
 
-            if not title:
+    Parsed entries are removed from the tree so memory stays bounded, and
+    parsing stops after ``max_entries`` papers.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    entry_tag = f"{{{ATOM_NS}}}entry"
+    stack: List[Any] = []
+    count = 0
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
                 continue
 
-            # Get ID and URL
-            id_elem = entry.find("atom:id", ns)
-            arxiv_id = id_elem.text if id_elem is not None else ""
-
-            # Get abstract
-            summary_elem = entry.find("atom:summary", ns)
-            abstract = summary_elem.text if summary_elem is not None else ""
-            abstract = abstract.replace("\n", " ").strip() if abstract else ""
-
-            # Get published date
-            published_elem = entry.find("atom:published", ns)
-            published = published_elem.text if published_elem is not None else ""
-
-            # Get authors
-            authors = []
-            for author in entry.findall("atom:author", ns):
-                name_elem = author.find("atom:name", ns)
-                if name_elem is not None and name_elem.text:
-                    authors.append(name_elem.text)
-
-            # Get categories
-            categories = []
-            for category in entry.findall("atom:category", ns):
-                term = category.get("term", "")
-                if term:
-                    categories.append(term)
-
-            # Get PDF link
-            pdf_url = ""
-            for link in entry.findall("atom:link", ns):
-                if link.get("title") == "pdf":
-                    pdf_url = link.get("href", "")
-                    break
-
-            # Primary category
-            primary_category_elem = entry.find("arxiv:primary_category", ns)
-            primary_category = (
-                primary_category_elem.get("term", "") if primary_category_elem is not None else ""
-            )
-
-            items.append(
-                {
-                    "id": arxiv_id,
-                    "title": title,
-                    "url": arxiv_id,  # arxiv_id is already the URL
-                    "description": abstract[:1000],
-                    "pub_date": published,
-                    "source": "ArXiv",
-                    "authors": authors,
-                    "categories": categories,
-                    "primary_category": primary_category,
-                    "pdf_url": pdf_url,
-                }
-            )
+            stack.pop()
+            if elem.tag != entry_tag:
+                continue
 
-    except Exception:
-        return []
+            item = _entry_to_item(elem)
+            if stack:
+                stack[-1].remove(elem)
+            if item is None:
+                continue
 
-    return items
+            yield item
+            count += 1
+            if max_entries is not None and count >= max_entries:
+                return
+
+    parser.close()
+
+
+def _entry_to_item(entry: Any) -> Optional[Dict[str, Any]]:
+    """Convert an ArXiv ``<entry>`` element into an article dict."""
+    title_elem = entry.find("atom:title", NS)
+    title = title_elem.text if title_elem is not None else ""
+    title = title.replace("\n", " ").strip() if title else ""
+
+    if not title:
+        return None
+
+    # Get ID and URL
+    id_elem = entry.find("atom:id", NS)
+    arxiv_id = id_elem.text if id_elem is not None else ""
+
+    # Get abstract
+    summary_elem = entry.find("atom:summary", NS)
+    abstract = summary_elem.text if summary_elem is not None else ""
+    abstract = abstract.replace("\n", " ").strip() if abstract else ""
+
+    # Get published date
+    published_elem = entry.find("atom:published", NS)
+    published = published_elem.text if published_elem is not None else ""
+
+    # Get authors
+    authors = []
+    for author in entry.findall("atom:author", NS):
+        name_elem = author.find("atom:name", NS)
+        if name_elem is not None and name_elem.text:
+            authors.append(name_elem.text)
+
+    # Get categories
+    categories = []
+    for category in entry.findall("atom:category", NS):
+        term = category.get("term", "")
+        if term:
+            categories.append(term)
+
+    # Get PDF link
+    pdf_url = ""
+    for link in entry.findall("atom:link", NS):
+        if link.get("title") == "pdf":
+            pdf_url = link.get("href", "")
+            break
+
+    # Primary category
+    primary_category_elem = entry.find("arxiv:primary_category", NS)
+    primary_category = (
+        primary_category_elem.get("term", "") if primary_category_elem is not None else ""
+    )
+
+    return {
+        "id": arxiv_id,
+        "title": title,
+        "url": arxiv_id,  # arxiv_id is already the URL
+        "description": abstract[:1000],
+        "pub_date": published,
+        "source": "ArXiv",
+        "authors": authors,
+        "categories": categories,
+        "primary_category": primary_category,
+        "pdf_url": pdf_url,
+    }
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any
-import urllib.request
-import json
 from datetime import datetime, timedelta
 
+from ingestor.scrapers.http_client import http_get
+
 
 def fetch_devto(tag: str = "AI", max_articles: int = 15) -> List[Dict[str, Any]]:
     """Fetch articles from Dev.to API.
@@ -26,12 +26,9 @@ def fetch_devto(tag: str = "AI", max_articles: int = 15) -> List[Dict[str, Any]]
         # Dev.to API endpoint for articles with tag
         url = f"https://dev.to/api/articles?tag={tag}&per_page={max_articles}"
 
-        req = urllib.request.Request(
-            url, headers={"User-Agent": "Mozilla/5.0 (compatible; AI-Daily-Collector/1.0)"}
-        )
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            articles = json.loads(response.read().decode("utf-8"))
+        response = http_get(url, timeout=30)
+        response.raise_for_status()
+        articles = response.json()
 
         if not isinstance(articles, list):
             return []
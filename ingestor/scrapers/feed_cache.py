@@ -0,0 +1,123 @@
+"""Persistent HTTP validator cache for RSS/Atom feeds.
+
+Stores the ETag, Last-Modified and a SHA-256 content hash per feed URL so
+``fetch_rss`` can send conditional requests and skip feeds that have not
+changed since the previous run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_FEED_CACHE_PATH = ".ai_cache/feed_validators.json"
+
+
+class FeedValidatorCache:
+    """JSON-backed map of feed URL -> {etag, last_modified, content_hash}.
+
+    Safe to share between the ingestor's worker threads; every update is
+    written through to disk atomically.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_FEED_CACHE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry else None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a feed URL."""
+        entry = self.get(url) or {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def is_unchanged(self, url: str, digest: str) -> bool:
+        entry = self.get(url)
+        return bool(entry) and entry.get("content_hash") == digest
+
+    def update(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        digest: Optional[str] = None,
+    ) -> None:
+        """Record the validators of the latest successfully handled response."""
+        with self._lock:
+            entry = self._entries.setdefault(url, {})
+            entry["etag"] = etag
+            entry["last_modified"] = last_modified
+            if digest is not None:
+                entry["content_hash"] = digest
+            try:
+                self._save()
+            except OSError:
+                # A read-only cache only costs us the conditional request
+                pass
+
+
+@dataclass
+class PendingValidators:
+    """Validators of a fetched feed, to be recorded once its items are stored.
+
+    Recording them earlier would make the next run skip the feed (304 or an
+    identical body) even if the items never reached storage.
+    """
+
+    cache: FeedValidatorCache
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: Optional[str] = None
+
+    def commit(self) -> None:
+        self.cache.update(self.url, self.etag, self.last_modified, self.digest)
+
+
+_cache: Optional[FeedValidatorCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_feed_cache() -> Optional[FeedValidatorCache]:
+    """Return the shared validator cache, or None when it is disabled.
+
+    Environment Variables:
+        FEED_CACHE_ENABLED: Set to "0" to always download and parse feeds
+        FEED_CACHE_PATH: Cache file (default: .ai_cache/feed_validators.json)
+    """
+    global _cache
+    if os.getenv("FEED_CACHE_ENABLED", "1") == "0":
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = FeedValidatorCache(os.getenv("FEED_CACHE_PATH", DEFAULT_FEED_CACHE_PATH))
+    return _cache
@@ -2,24 +2,50 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
-import urllib.request
-import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 import re
 from datetime import datetime
 
+from ingestor.scrapers.http_client import http_get
+
+HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
+
+
+def _fetch_item(story_id: int, timeout: int = 10) -> Optional[Dict[str, Any]]:
+    """Fetch a single item through the shared keep-alive connection pool.
+
+    Args:
+        story_id: Hacker News item ID
+        timeout: Request timeout in seconds
+
+    Returns:
+        Item dictionary, or None if the request failed
+    """
+    try:
+        response = http_get(f"{HN_API_BASE}/item/{story_id}.json", timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    except Exception:
+        return None
+
 
 def fetch_hackernews(
-    keyword: str = "", hours: int = 24, max_articles: int = 30
+    keyword: str = "", hours: int = 24, max_articles: int = 30, max_workers: int = 8
 ) -> List[Dict[str, Any]]:
     """Fetch top stories from Hacker News.
 
     Uses the official Firebase API (https://github.com/HackerNews/API).
+    Item details are fetched concurrently, at most ``max_workers`` in flight,
+    and consumed in top-stories order; once ``max_articles`` matches are found
+    the remaining requests are cancelled.
 
     Args:
         keyword: Filter keywords (e.g., "AI|ml|agent|mcp|llm")
         hours: Time window (not directly supported by API, used for filtering)
         max_articles: Maximum articles to fetch
+        max_workers: Maximum concurrent item requests
 
     Returns:
         List of article dictionaries
@@ -28,9 +54,9 @@ def fetch_hackernews(
 
     try:
         # Get top stories IDs
-        top_stories_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-        with urllib.request.urlopen(top_stories_url, timeout=30) as response:
-            story_ids = json.loads(response.read().decode("utf-8"))
+        response = http_get(f"{HN_API_BASE}/topstories.json", timeout=30)
+        response.raise_for_status()
+        story_ids = response.json()
 
         if not isinstance(story_ids, list):
             return []
@@ -43,53 +69,74 @@ def fetch_hackernews(
             except re.error:
                 keyword_pattern = None
 
-        # Fetch details for each story
-        for story_id in story_ids[: max_articles * 2]:  # Fetch more to allow for filtering
-            if len(items) >= max_articles:
-                break
+        candidates = iter(story_ids[: max_articles * 2])  # Fetch more to allow for filtering
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="hn")
+        in_flight: deque = deque()
 
-            try:
-                story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                with urllib.request.urlopen(story_url, timeout=10) as response:
-                    story = json.loads(response.read().decode("utf-8"))
-
-                if not isinstance(story, dict):
-                    continue
-
-                title = story.get("title", "")
-                if not title:
-                    continue
-
-                # Filter by keyword if provided
-                if keyword_pattern and not keyword_pattern.search(title):
-                    continue
-
-                # Get URL (use story URL or HN discussion URL)
-                url = story.get("url", "")
-                if not url:
-                    url = f"https://news.ycombinator.com/item?id={story_id}"
-
-                # Get timestamp
-                timestamp = story.get("time", 0)
-                pub_date = datetime.fromtimestamp(timestamp).isoformat() if timestamp else ""
-
-                items.append(
-                    {
-                        "id": f"hn-{story_id}",
-                        "title": title,
-                        "url": url,
-                        "description": story.get("text", "")[:500],  # Truncate long text
-                        "pub_date": pub_date,
-                        "source": "Hacker News",
-                        "score": story.get("score", 0),
-                        "comments": story.get("descendants", 0),
-                    }
-                )
-
-            except Exception:
-                continue
+        def _submit_next() -> None:
+            story_id = next(candidates, None)
+            if story_id is not None:
+                in_flight.append((story_id, executor.submit(_fetch_item, story_id)))
+
+        try:
+            for _ in range(max(1, max_workers)):
+                _submit_next()
+
+            # Consume in submission order to keep top-stories ranking
+            while in_flight and len(items) < max_articles:
+                story_id, future = in_flight.popleft()
+                _submit_next()
+
+                article = _story_to_article(story_id, _result_or_none(future), keyword_pattern)
+                if article is not None:
+                    items.append(article)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     except Exception:
         return []
 
     return items[:max_articles]
+
+
+def _result_or_none(future: Future) -> Optional[Dict[str, Any]]:
+    try:
+        return future.result()
+    except Exception:
+        return None
+
+
+def _story_to_article(
+    story_id: int, story: Optional[Dict[str, Any]], keyword_pattern: Optional[re.Pattern]
+) -> Optional[Dict[str, Any]]:
+    """Convert an HN item into an article dict, or None if it is filtered out."""
+    if not isinstance(story, dict):
+        return None
+
+    title = story.get("title", "")
+    if not title:
+        return None
+
+    # Filter by keyword if provided
+    if keyword_pattern and not keyword_pattern.search(title):
+        return None
+
+    # Get URL (use story URL or HN discussion URL)
+    url = story.get("url", "")
+    if not url:
+        url = f"https://news.ycombinator.com/item?id={story_id}"
+
+    # Get timestamp
+    timestamp = story.get("time", 0)
+    pub_date = datetime.fromtimestamp(timestamp).isoformat() if timestamp else ""
+
+    return {
+        "id": f"hn-{story_id}",
+        "title": title,
+        "url": url,
+        "description": (story.get("text") or "")[:500],  # Truncate long text
+        "pub_date": pub_date,
+        "source": "Hacker News",
+        "score": story.get("score", 0),
+        "comments": story.get("descendants", 0),
+    }
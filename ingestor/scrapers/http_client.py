@@ -0,0 +1,497 @@
+"""Shared pooled HTTP client for scrapers.
+
+Built on ``http.client`` so scrapers stay standard-library only. Connections
+are kept alive and reused per host (with a cap on concurrent connections to
+each host), responses are transparently decompressed (gzip/deflate, and
+brotli when the ``brotli`` package is installed) and every request gets the
+same default timeout and User-Agent.
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import json
+import os
+import ssl
+import threading
+import time
+import urllib.request
+import zlib
+from contextlib import contextmanager
+from email.message import Message
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import brotli
+except Exception:
+    brotli = None
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; AI-Daily-Collector/1.0)"
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Errors raised when a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class HTTPStatusError(Exception):
+    """Raised by ``Response.raise_for_status`` for 4xx/5xx responses."""
+
+    def __init__(self, status: int, url: str, body: bytes = b""):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+        self.body = body
+
+
+class Response:
+    """A fully read, decompressed HTTP response."""
+
+    def __init__(self, status: int, headers: Message, content: bytes, url: str):
+        self.status = status
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        charset = encoding or self.headers.get_content_charset() or "utf-8"
+        return self.content.decode(charset, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.text())
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise HTTPStatusError(self.status, self.url, self.content)
+
+
+def _decode_body(body: bytes, encoding: str) -> bytes:
+    """Undo the Content-Encoding of a response body."""
+    encoding = (encoding or "").strip().lower()
+    if not body or encoding in ("", "identity"):
+        return body
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(body)
+    return body
+
+
+class _StreamDecoder:
+    """Incremental counterpart of ``_decode_body``."""
+
+    def __init__(self, encoding: str):
+        encoding = (encoding or "").strip().lower()
+        self._decompressor: Any = None
+        if encoding in ("gzip", "x-gzip"):
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self._decompressor = zlib.decompressobj()
+            self._raw_deflate_checked = False
+        elif encoding == "br" and brotli is not None:
+            self._decompressor = brotli.Decompressor()
+        self._encoding = encoding
+
+    def decode(self, chunk: bytes) -> bytes:
+        if self._decompressor is None:
+            return chunk
+        if self._encoding == "br":
+            return self._decompressor.process(chunk)
+        if self._encoding == "deflate" and not self._raw_deflate_checked:
+            self._raw_deflate_checked = True
+            try:
+                return self._decompressor.decompress(chunk)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib header
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decompressor.decompress(chunk)
+
+    def flush(self) -> bytes:
+        if self._decompressor is None or self._encoding == "br":
+            return b""
+        return self._decompressor.flush()
+
+
+class StreamingResponse:
+    """An HTTP response whose body is read incrementally."""
+
+    def __init__(self, raw: http.client.HTTPResponse, url: str):
+        self._raw = raw
+        self.status = raw.status
+        self.headers = raw.headers
+        self.url = url
+        self.complete = False
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise HTTPStatusError(self.status, self.url, self._raw.read())
+
+    def iter_content(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield decompressed body chunks until the body is exhausted."""
+        decoder = _StreamDecoder(self.headers.get("Content-Encoding", ""))
+        while True:
+            chunk = self._raw.read1(chunk_size)
+            if not chunk:
+                break
+            data = decoder.decode(chunk)
+            if data:
+                yield data
+        tail = decoder.flush()
+        if tail:
+            yield tail
+        self.complete = True
+
+
+class _HostPool:
+    """Idle keep-alive connections for one (scheme, host, port, proxy) key."""
+
+    def __init__(self, max_connections: int):
+        self.slots = threading.BoundedSemaphore(max_connections)
+        # (connection, time it was returned to the pool)
+        self.idle: List[Tuple[http.client.HTTPConnection, float]] = []
+        self.lock = threading.Lock()
+
+
+class HTTPClient:
+    """Thread-safe HTTP client with per-host keep-alive connection pools.
+
+    Args:
+        timeout: Default socket timeout in seconds for every request
+        max_connections_per_host: Cap on concurrent connections to one host;
+            callers beyond the cap wait for a connection to be released
+        user_agent: Default User-Agent header
+        max_redirects: Maximum redirects followed per request
+        keepalive_expiry: Close idle connections older than this many seconds
+            instead of reusing them (None keeps them indefinitely). Needed for
+            non-idempotent requests, which are not retried on a connection
+            the server has already dropped.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        user_agent: str = DEFAULT_USER_AGENT,
+        max_redirects: int = 5,
+        keepalive_expiry: Optional[float] = None,
+    ):
+        self.timeout = timeout
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.user_agent = user_agent
+        self.max_redirects = max_redirects
+        self.keepalive_expiry = keepalive_expiry
+        self._pools: Dict[Tuple[str, str, int, Optional[str]], _HostPool] = {}
+        self._pools_lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+        self._proxies = urllib.request.getproxies()
+
+    def _accept_encoding(self) -> str:
+        return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+    def _proxy_for(self, scheme: str, host: str) -> Optional[str]:
+        proxy = self._proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(host):
+            return None
+        return proxy
+
+    def _pool(self, key: Tuple[str, str, int, Optional[str]]) -> _HostPool:
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = _HostPool(self.max_connections_per_host)
+            return pool
+
+    def _new_connection(
+        self, scheme: str, host: str, port: int, proxy: Optional[str], timeout: float
+    ) -> http.client.HTTPConnection:
+        if proxy:
+            proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            proxy_host = proxy_parts.hostname or ""
+            proxy_port = proxy_parts.port or 8080
+            if scheme == "https":
+                conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                    proxy_host, proxy_port, timeout=timeout, context=self._ssl_context
+                )
+                conn.set_tunnel(host, port)
+                return conn
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=self._ssl_context
+            )
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _open(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        timeout: float,
+    ) -> Tuple[_HostPool, http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send a request on a pooled connection and return its unread response.
+
+        The caller owns one of the host's connection slots until it passes the
+        result to ``_release``.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = self._proxy_for(scheme, host)
+
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        if proxy and scheme == "http":
+            # Plain HTTP through a proxy uses the absolute URL as the target
+            path = f"{scheme}://{parts.netloc}{path}"
+
+        request_headers = {
+            "Host": parts.netloc,
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": self._accept_encoding(),
+            "Connection": "keep-alive",
+        }
+        request_headers.update(headers)
+
+        pool = self._pool((scheme, host, port, proxy))
+        pool.slots.acquire()
+        try:
+            for attempt in range(2):
+                conn = self._checkout(pool)
+                reused = conn is not None
+                if conn is None:
+                    conn = self._new_connection(scheme, host, port, proxy, timeout)
+
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+
+                try:
+                    conn.request(method, path, body=body, headers=request_headers)
+                    return pool, conn, conn.getresponse()
+                except _STALE_CONNECTION_ERRORS:
+                    conn.close()
+                    # A reused idle connection may have been dropped by the server
+                    if reused and attempt == 0 and method in ("GET", "HEAD"):
+                        continue
+                    raise
+                except Exception:
+                    conn.close()
+                    raise
+        except BaseException:
+            pool.slots.release()
+            raise
+
+        pool.slots.release()
+        raise http.client.HTTPException(f"Request to {url} failed")
+
+    def _checkout(self, pool: _HostPool) -> Optional[http.client.HTTPConnection]:
+        """Take the most recently used idle connection, dropping expired ones."""
+        expired = []
+        conn = None
+        with pool.lock:
+            while pool.idle:
+                candidate, released_at = pool.idle.pop()
+                if (
+                    self.keepalive_expiry is not None
+                    and time.monotonic() - released_at > self.keepalive_expiry
+                ):
+                    expired.append(candidate)
+                    continue
+                conn = candidate
+                break
+        for stale in expired:
+            stale.close()
+        return conn
+
+    def _release(
+        self,
+        pool: _HostPool,
+        conn: http.client.HTTPConnection,
+        raw: http.client.HTTPResponse,
+        reusable: bool = True,
+    ) -> None:
+        """Return a connection to its pool, or close it if it cannot be reused."""
+        try:
+            if reusable and raw.isclosed() and not raw.will_close:
+                with pool.lock:
+                    pool.idle.append((conn, time.monotonic()))
+            else:
+                conn.close()
+        finally:
+            pool.slots.release()
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        timeout: float,
+    ) -> Response:
+        pool, conn, raw = self._open(method, url, headers, body, timeout)
+        try:
+            content = raw.read()
+        except Exception:
+            self._release(pool, conn, raw, reusable=False)
+            raise
+        self._release(pool, conn, raw)
+
+        content = _decode_body(content, raw.headers.get("Content-Encoding", ""))
+        return Response(raw.status, raw.headers, content, url)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+    ) -> Response:
+        """Send a request, following redirects, and return the full response.
+
+        Non-2xx statuses are returned, not raised; call
+        ``Response.raise_for_status`` where an error status should fail.
+        """
+        method = method.upper()
+        timeout = self.timeout if timeout is None else timeout
+        headers = dict(headers or {})
+
+        for _ in range(self.max_redirects + 1):
+            response = self._send_once(method, url, headers, body, timeout)
+            location = response.headers.get("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response
+
+            url = urljoin(url, location)
+            if response.status == 303 or (
+                response.status in (301, 302) and method not in ("GET", "HEAD")
+            ):
+                method, body = "GET", None
+                headers.pop("Content-Type", None)
+
+        return response
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Response:
+        return self.request("GET", url, headers=headers, timeout=timeout)
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator["StreamingResponse"]:
+        """GET a URL and expose the body as decompressed chunks, read on demand.
+
+        Redirects are followed. If the body is not read to the end the
+        connection is closed instead of being returned to the pool.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        headers = dict(headers or {})
+
+        for _ in range(self.max_redirects + 1):
+            pool, conn, raw = self._open("GET", url, headers, None, timeout)
+            location = raw.headers.get("Location")
+            if raw.status in _REDIRECT_STATUSES and location:
+                try:
+                    raw.read()
+                except Exception:
+                    self._release(pool, conn, raw, reusable=False)
+                    raise
+                self._release(pool, conn, raw)
+                url = urljoin(url, location)
+                continue
+
+            response = StreamingResponse(raw, url)
+            try:
+                yield response
+            finally:
+                self._release(pool, conn, raw, reusable=response.complete)
+            return
+
+        raise http.client.HTTPException(f"Too many redirects for {url}")
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            with pool.lock:
+                while pool.idle:
+                    pool.idle.pop()[0].close()
+
+
+_client: Optional[HTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HTTPClient:
+    """Return the process-wide shared client, creating it on first use.
+
+    Environment Variables:
+        SCRAPER_HTTP_TIMEOUT: Default request timeout in seconds (default: 30)
+        SCRAPER_MAX_CONNECTIONS_PER_HOST: Connection cap per host (default: 8)
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HTTPClient(
+                    timeout=float(os.getenv("SCRAPER_HTTP_TIMEOUT", str(DEFAULT_TIMEOUT))),
+                    max_connections_per_host=int(
+                        os.getenv(
+                            "SCRAPER_MAX_CONNECTIONS_PER_HOST",
+                            str(DEFAULT_MAX_CONNECTIONS_PER_HOST),
+                        )
+                    ),
+                )
+    return _client
+
+
+def http_get(
+    url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None
+) -> Response:
+    """GET a URL through the shared client."""
+    return get_client().get(url, headers=headers, timeout=timeout)
+
+
+def http_stream(
+    url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None
+):
+    """Stream a GET response through the shared client (a context manager)."""
+    return get_client().stream(url, headers=headers, timeout=timeout)
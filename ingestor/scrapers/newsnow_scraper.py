@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any
-import urllib.request
-import json
 import hashlib
 
+from ingestor.scrapers.http_client import http_get
+
 
 def generate_article_id(source: str, url: str) -> str:
     """Generate unique article ID from source and URL hash."""
@@ -46,13 +46,9 @@ def fetch_newsnow(
     items: List[Dict[str, Any]] = []
 
     try:
-        req = urllib.request.Request(
-            url,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; AI-Daily-Collector/1.0)"},
-        )
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        response = http_get(url, timeout=30)
+        response.raise_for_status()
+        data = response.json()
     except Exception:
         return []
 
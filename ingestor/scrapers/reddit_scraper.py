@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any
-import urllib.request
-import json
 import re
 
+from ingestor.scrapers.http_client import http_get
+
 
 def fetch_reddit(subreddit: str, keyword: str = "", max_articles: int = 15) -> List[Dict[str, Any]]:
     """Fetch posts from Reddit API.
@@ -28,12 +28,9 @@ def fetch_reddit(subreddit: str, keyword: str = "", max_articles: int = 15) -> L
         # Reddit JSON API
         url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit={max_articles}"
 
-        req = urllib.request.Request(
-            url, headers={"User-Agent": "Mozilla/5.0 (compatible; AI-Daily-Collector/1.0)"}
-        )
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        response = http_get(url, timeout=30)
+        response.raise_for_status()
+        data = response.json()
 
         if not isinstance(data, dict):
             return []
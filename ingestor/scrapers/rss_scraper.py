@@ -4,7 +4,10 @@ RSS Scraper skeleton.
 """
 
 import hashlib
-from typing import List, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ingestor.scrapers.feed_cache import PendingValidators, get_feed_cache
+from ingestor.scrapers.http_client import http_stream
 
 
 def generate_article_id(source: str, url: str) -> str:
@@ -18,96 +21,155 @@ def generate_article_id(source: str, url: str) -> str:
     return f"{clean_source}-{url_hash}"
 
 
-def fetch_rss(url: str) -> List[Dict]:
-    """Fetch and parse a simple RSS/Atom feed from the given URL."""
-    import urllib.request
-    import xml.etree.ElementTree as ET
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
 
-    items: List[Dict] = []
-    try:
-        with urllib.request.urlopen(url, timeout=15) as resp:
-            data = resp.read()
-    except Exception:
-        return []
+
+def fetch_rss(
+    url: str,
+    use_cache: bool = True,
+    max_items: Optional[int] = None,
+    pending_validators: Optional[List[PendingValidators]] = None,
+) -> List[Dict]:
+    """Fetch and parse a simple RSS/Atom feed from the given URL.
+
+    The response is parsed incrementally while it downloads, and reading
+    stops once ``max_items`` items have been parsed.
+
+    With ``use_cache`` the request is conditional on the validators stored
+    by the previous successful fetch; a 304 response or a body identical to
+    the last one means nothing changed, and no items are returned.
+
+    The new validators are stored right away, unless ``pending_validators``
+    is given: then they are appended to it, and the caller commits them
+    once the returned items have been stored.
+    """
+    cache = get_feed_cache() if use_cache else None
+    hasher = hashlib.sha256()
 
     try:
-        root = ET.fromstring(data)
+        headers = cache.conditional_headers(url) if cache else None
+        with http_stream(url, headers=headers, timeout=15) as response:
+            if response.status == 304:
+                return []
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            items = list(iter_feed_items(_hashed(response.iter_content(), hasher), max_items))
+            complete = response.complete
     except Exception:
         return []
 
-    channel = root.find("channel")
-    if channel is not None:
-        channel_title = channel.findtext("title") or ""
-        for item in channel.findall("item"):
-            title = item.findtext("title") or ""
-            link = item.findtext("link") or ""
-            description = item.findtext("description") or ""
-            pubdate = (
-                item.findtext("pubDate")
-                or item.findtext("{http://purl.org/dc/elements/1.1/}date")
-                or ""
-            )
-            article_id = generate_article_id(channel_title, link or "")
-            items.append(
-                {
-                    "id": article_id,
-                    "title": title,
-                    "url": link,
-                    "description": description,
-                    "pubDate": pubdate,
-                    "pub_date": pubdate,
-                    "source": channel_title,
-                }
-            )
-        if not items:
-            return []
-        return items
-
-    for entry in root.findall(".//{http://www.w3.org/2005/Atom}entry"):
-        title = entry.findtext("{http://www.w3.org/2005/Atom}title") or ""
-        link_el = entry.find("{http://www.w3.org/2005/Atom}link")
-        link = link_el.get("href") if link_el is not None else ""
-        pub = (
-            entry.findtext("{http://www.w3.org/2005/Atom}updated")
-            or entry.findtext("{http://www.w3.org/2005/Atom}published")
-            or ""
-        )
-        summary = entry.findtext("{http://www.w3.org/2005/Atom}summary") or ""
-        article_id = generate_article_id(root.findtext("title") or "atom", link or "")
-        items.append(
-            {
-                "id": article_id,
-                "title": title,
-                "url": link,
-                "description": summary,
-                "pubDate": pub,
-                "pub_date": pub,
-                "source": root.findtext("{http://www.w3.org/2005/Atom}author") or "",
-            }
-        )
-    return items
+    # The body hash is only meaningful if the whole feed was read
+    digest = hasher.hexdigest() if complete else None
+    validators = None
+    if cache and digest and cache.is_unchanged(url, digest):
+        validators = PendingValidators(cache, url, etag, last_modified)
+        items = []
+    elif cache and items:
+        validators = PendingValidators(cache, url, etag, last_modified, digest)
 
-    # Atom
-    for entry in root.findall(".//{http://www.w3.org/2005/Atom}entry"):
-        title = entry.findtext("{http://www.w3.org/2005/Atom}title") or ""
-        link_el = entry.find("{http://www.w3.org/2005/Atom}link")
-        link = link_el.get("href") if link_el is not None else ""
-        pub = (
-            entry.findtext("{http://www.w3.org/2005/Atom}updated")
-            or entry.findtext("{http://www.w3.org/2005/Atom}published")
-            or ""
-        )
-        summary = entry.findtext("{http://www.w3.org/2005/Atom}summary") or ""
-        article_id = generate_article_id(root.findtext("title") or "atom", link or "")
-        items.append(
-            {
-                "id": article_id,
-                "title": title,
-                "url": link,
-                "description": summary,
-                "pubDate": pub,
-                "pub_date": pub,
-                "source": root.findtext("{http://www.w3.org/2005/Atom}author") or "",
-            }
-        )
+    if validators is not None:
+        if pending_validators is not None:
+            pending_validators.append(validators)
+        else:
+            validators.commit()
     return items
+
+
+def _hashed(chunks: Iterable[bytes], hasher: Any) -> Iterator[bytes]:
+    for chunk in chunks:
+        hasher.update(chunk)
+        yield chunk
+
+
+def iter_feed_items(chunks: Iterable[bytes], max_items: Optional[int] = None) -> Iterator[Dict]:
+    """Incrementally parse RSS 2.0 or Atom bytes, yielding each item as it closes.
+
+    Processed ``<item>``/``<entry>`` elements are dropped from the tree, so
+    memory stays bounded by a single item regardless of feed size.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the feed is not well-formed
+    """
+    import xml.etree.ElementTree as ET
+
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: List[Any] = []
+    is_rss = False
+    channel_title = ""
+    atom_title = ""
+    atom_author = ""
+    count = 0
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                if len(stack) == 1 and elem.tag == "channel":
+                    is_rss = True
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            parent = stack[-1] if stack else None
+            depth = len(stack)
+            item = None
+
+            if is_rss:
+                if depth == 2 and stack[1].tag == "channel":
+                    if elem.tag == "title":
+                        channel_title = elem.text or ""
+                    elif elem.tag == "item":
+                        item = _rss_item(elem, channel_title)
+            elif depth == 1:
+                # Feed-level metadata of an Atom document
+                if elem.tag == "title":
+                    atom_title = elem.text or ""
+                elif elem.tag == f"{ATOM_NS}author":
+                    atom_author = elem.text or ""
+            if not is_rss and elem.tag == f"{ATOM_NS}entry":
+                item = _atom_entry(elem, atom_title, atom_author)
+
+            if item is not None:
+                if parent is not None:
+                    parent.remove(elem)
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+
+    parser.close()
+
+
+def _rss_item(item: Any, channel_title: str) -> Dict:
+    title = item.findtext("title") or ""
+    link = item.findtext("link") or ""
+    description = item.findtext("description") or ""
+    pubdate = item.findtext("pubDate") or item.findtext(DC_DATE) or ""
+    return {
+        "id": generate_article_id(channel_title, link or ""),
+        "title": title,
+        "url": link,
+        "description": description,
+        "pubDate": pubdate,
+        "pub_date": pubdate,
+        "source": channel_title,
+    }
+
+
+def _atom_entry(entry: Any, feed_title: str, feed_author: str) -> Dict:
+    title = entry.findtext(f"{ATOM_NS}title") or ""
+    link_el = entry.find(f"{ATOM_NS}link")
+    link = link_el.get("href") if link_el is not None else ""
+    pub = entry.findtext(f"{ATOM_NS}updated") or entry.findtext(f"{ATOM_NS}published") or ""
+    summary = entry.findtext(f"{ATOM_NS}summary") or ""
+    return {
+        "id": generate_article_id(feed_title or "atom", link or ""),
+        "title": title,
+        "url": link,
+        "description": summary,
+        "pubDate": pub,
+        "pub_date": pub,
+        "source": feed_author,
+    }
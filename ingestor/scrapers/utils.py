@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import time
-import urllib.request
 from typing import Callable, TypeVar, Any
 from functools import wraps
 
+from ingestor.scrapers.http_client import http_get
+
 T = TypeVar("T")
 
 
@@ -37,7 +38,7 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0) -> Callable:
 
 
 def fetch_url(url: str, timeout: int = 30, headers: dict | None = None) -> bytes:
-    """Fetch URL content with proper headers and error handling.
+    """Fetch URL content through the shared pooled HTTP client.
 
     Args:
         url: URL to fetch
@@ -47,12 +48,6 @@ def fetch_url(url: str, timeout: int = 30, headers: dict | None = None) -> bytes
     Returns:
         Response content as bytes
     """
-    default_headers = {"User-Agent": "Mozilla/5.0 (compatible; AI-Daily-Collector/1.0)"}
-
-    if headers:
-        default_headers.update(headers)
-
-    req = urllib.request.Request(url, headers=default_headers)
-
-    with urllib.request.urlopen(req, timeout=timeout) as response:
-        return response.read()
+    response = http_get(url, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    return response.content
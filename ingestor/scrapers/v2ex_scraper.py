@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any
-import urllib.request
-import json
 import re
 
+from ingestor.scrapers.http_client import http_get
+
 
 def fetch_v2ex(keyword: str = "", max_articles: int = 20) -> List[Dict[str, Any]]:
     """Fetch topics from V2EX API.
@@ -26,12 +26,9 @@ def fetch_v2ex(keyword: str = "", max_articles: int = 20) -> List[Dict[str, Any]
         # V2EX API - get latest topics
         url = "https://www.v2ex.com/api/topics/latest.json"
 
-        req = urllib.request.Request(
-            url, headers={"User-Agent": "Mozilla/5.0 (compatible; AI-Daily-Collector/1.0)"}
-        )
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            topics = json.loads(response.read().decode("utf-8"))
+        response = http_get(url, timeout=30)
+        response.raise_for_status()
+        topics = response.json()
 
         if not isinstance(topics, list):
             return []
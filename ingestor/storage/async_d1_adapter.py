@@ -0,0 +1,230 @@
+"""Asyncio Cloudflare D1 adapter for the API server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from shared.models import ArticleModel
+from ingestor.storage.d1_adapter import (
+    DEFAULT_D1_KEEPALIVE_EXPIRY,
+    DEFAULT_D1_POOL_SIZE,
+    DEFAULT_D1_TIMEOUT,
+    D1AdapterBase,
+    d1_http_settings,
+)
+
+# One shared client per event loop: httpx connections cannot move between loops
+_async_d1_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    WeakKeyDictionary()
+)
+
+
+def _async_client(pool_size: int, timeout: float, keepalive_expiry: float) -> httpx.AsyncClient:
+    """Create an ``httpx.AsyncClient`` with a keep-alive pool of ``pool_size`` connections."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=timeout,
+    )
+
+
+def get_async_d1_http_client() -> httpx.AsyncClient:
+    """Return the keep-alive client shared by async D1 adapters on the running loop.
+
+    Pool settings come from ``d1_http_settings``. Must be called from a
+    coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_d1_clients.get(loop)
+    if client is None:
+        settings = d1_http_settings()
+        client = _async_d1_clients[loop] = _async_client(
+            settings["max_connections_per_host"],
+            settings["timeout"],
+            settings["keepalive_expiry"],
+        )
+    return client
+
+
+class AsyncD1StorageAdapter(D1AdapterBase):
+    """Read-side D1 adapter whose queries are coroutines.
+
+    Offers the same ``fetch_articles`` / ``get_stats`` / ``get_crawl_logs``
+    surface as ``D1StorageAdapter`` for the FastAPI routers, but awaits the
+    Cloudflare API on a pooled ``httpx.AsyncClient`` instead of blocking the
+    event loop, so one worker can have many D1 requests in flight.
+    """
+
+    def __init__(
+        self,
+        account_id: str,
+        database_id: str,
+        api_token: str,
+        base_url: str = "https://api.cloudflare.com/client/v4",
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        keepalive_expiry: Optional[float] = None,
+    ):
+        """Initialize async D1 storage adapter.
+
+        Args:
+            account_id: Cloudflare account ID
+            database_id: D1 database ID
+            api_token: Cloudflare API token with D1 read permissions
+            base_url: Cloudflare API base URL
+            pool_size: Maximum concurrent keep-alive connections. If this and
+                the other pool settings are omitted, the running event loop's
+                shared pool from ``get_async_d1_http_client`` is used.
+            timeout: Request timeout in seconds
+            keepalive_expiry: Seconds an idle connection may be reused
+        """
+        super().__init__(account_id, database_id, api_token, base_url)
+        self._http: Optional[httpx.AsyncClient] = None
+        self._owns_http = not (pool_size is None and timeout is None and keepalive_expiry is None)
+        if self._owns_http:
+            self._http = _async_client(
+                pool_size or DEFAULT_D1_POOL_SIZE,
+                DEFAULT_D1_TIMEOUT if timeout is None else timeout,
+                DEFAULT_D1_KEEPALIVE_EXPIRY if keepalive_expiry is None else keepalive_expiry,
+            )
+
+    def _client(self) -> httpx.AsyncClient:
+        # The shared client is looked up lazily: adapters may be created
+        # outside the event loop (e.g. in a sync FastAPI dependency)
+        return self._http if self._owns_http else get_async_d1_http_client()
+
+    async def aclose(self) -> None:
+        """Close the adapter's own connection pool (the shared pool stays open)."""
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def _post_query(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a payload to the D1 /query endpoint and check for errors.
+
+        Args:
+            payload: JSON body (a single statement or a ``batch`` array)
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            Exception: If API request fails
+        """
+        url = f"{self._api_base}/query"
+
+        data = json.dumps(payload).encode("utf-8")
+        statements = len(payload.get("batch", ())) or 1
+
+        start = time.monotonic()
+        ok = False
+        try:
+            response = await self._client().post(url, headers=self._headers(), content=data)
+            result = self._check_response(response.status_code, response.text)
+            ok = True
+            return result
+        finally:
+            self._record_query(time.monotonic() - start, statements, ok)
+
+    async def _execute_sql(
+        self, sql: str, params: Optional[List[Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute SQL query via D1 API.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters
+
+        Returns:
+            API response as dictionary
+        """
+        return await self._post_query({"sql": sql, "params": params or []})
+
+    async def batch(
+        self, statements: Iterable[Tuple[str, Optional[List[Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """Run several statements with as few D1 API requests as possible.
+
+        See ``D1StorageAdapter.batch``.
+
+        Args:
+            statements: (sql, params) tuples; params may be None
+
+        Returns:
+            One result per statement, in order
+        """
+        results: List[Dict[str, Any]] = []
+        for chunk in self._batch_chunks(statements):
+            response = await self._post_query(
+                {"batch": [{"sql": sql, "params": params} for sql, params in chunk]}
+            )
+            results.extend(self._batch_results(response, chunk))
+        return results
+
+    async def fetch_articles(
+        self, filters: Optional[Dict[str, Any]] = None, limit: int = 50, offset: int = 0
+    ) -> List[ArticleModel]:
+        """Fetch articles with optional filtering.
+
+        Args:
+            filters: Optional filters (source, id, date_start, date_end, etc.)
+            limit: Maximum results
+            offset: Pagination offset
+
+        Returns:
+            List of ArticleModel instances
+        """
+        result = await self._execute_sql(*self._articles_query(filters, limit, offset))
+        return self._rows_to_articles(result)
+
+    async def get_article_by_id(self, article_id: str) -> Optional[ArticleModel]:
+        """Get a single article by ID.
+
+        Args:
+            article_id: Article ID
+
+        Returns:
+            ArticleModel or None
+        """
+        result = await self._execute_sql(
+            "SELECT * FROM articles WHERE id = ? LIMIT 1", [article_id]
+        )
+        row = self._parse_single_result(result)
+        return self._row_to_article(row) if row else None
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get database statistics.
+
+        Returns:
+            Dictionary with total count and source breakdown
+        """
+        return self._stats_from_results(await self.batch(self.STATS_STATEMENTS))
+
+    async def get_crawl_logs(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get crawl logs.
+
+        Args:
+            limit: Maximum results
+            offset: Pagination offset
+
+        Returns:
+            List of crawl log entries
+        """
+        result = await self._execute_sql(self.CRAWL_LOGS_SQL, [limit, offset])
+        return self._parse_result(result)
+
+    async def get_crawl_stats(self) -> Dict[str, Any]:
+        """Get crawl statistics.
+
+        Returns:
+            Dictionary with crawl stats
+        """
+        return self._crawl_stats_from_results(await self.batch(self.CRAWL_STATS_STATEMENTS))
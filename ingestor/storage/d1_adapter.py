@@ -2,23 +2,107 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 import json
-import urllib.request
-import urllib.error
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
 from datetime import datetime
 
 from shared.models import ArticleModel
+from ingestor.scrapers.http_client import HTTPClient
 from ingestor.storage.db import StorageAdapter
 
+logger = logging.getLogger(__name__)
 
-class D1StorageAdapter(StorageAdapter):
-    """Production storage adapter using Cloudflare D1.
+DEFAULT_D1_POOL_SIZE = 8
+DEFAULT_D1_TIMEOUT = 30.0
+# Cloudflare closes idle connections after a while; reconnect rather than
+# risk sending a (non-idempotent) statement on a dropped connection
+DEFAULT_D1_KEEPALIVE_EXPIRY = 30.0
 
-    This adapter connects to Cloudflare D1 via the REST API
-    and provides full CRUD operations for articles.
+_d1_client: Optional[HTTPClient] = None
+_d1_client_lock = threading.Lock()
+
+
+def d1_http_settings() -> Dict[str, float]:
+    """Connection pool settings for D1 clients, read from the environment.
+
+    Environment Variables:
+        D1_POOL_SIZE: Maximum concurrent connections (default: 8)
+        D1_TIMEOUT: Request timeout in seconds (default: 30)
+        D1_KEEPALIVE_EXPIRY: Seconds an idle connection is reused (default: 30)
+    """
+    return {
+        "timeout": float(os.getenv("D1_TIMEOUT", str(DEFAULT_D1_TIMEOUT))),
+        "max_connections_per_host": int(os.getenv("D1_POOL_SIZE", str(DEFAULT_D1_POOL_SIZE))),
+        "keepalive_expiry": float(
+            os.getenv("D1_KEEPALIVE_EXPIRY", str(DEFAULT_D1_KEEPALIVE_EXPIRY))
+        ),
+    }
+
+
+def get_d1_http_client() -> HTTPClient:
+    """Return the process-wide keep-alive client shared by D1 adapters.
+
+    Every adapter created with default pool settings reuses the same TLS
+    connections to the Cloudflare API, even when adapters are created per
+    request or per script step. Pool settings come from ``d1_http_settings``.
+    """
+    global _d1_client
+    if _d1_client is None:
+        with _d1_client_lock:
+            if _d1_client is None:
+                _d1_client = HTTPClient(**d1_http_settings())
+    return _d1_client
+
+
+class D1AdapterBase:
+    """Transport-independent parts of the D1 adapters.
+
+    Holds the credentials, request statistics, SQL for the read queries and
+    the parsing of D1 API responses, shared by ``D1StorageAdapter`` and the
+    asyncio ``AsyncD1StorageAdapter``; subclasses send the requests.
     """
 
+    # D1 allows at most 100 bound parameters per statement (12 per article row)
+    UPSERT_ROWS_PER_STATEMENT = 8
+    # Statements packed into one /query request by batch
+    STATEMENTS_PER_REQUEST = 25
+
+    STATS_STATEMENTS = [
+        # Total count
+        ("SELECT COUNT(*) as total FROM articles", None),
+        # Source breakdown
+        ("SELECT source, COUNT(*) as count FROM articles GROUP BY source", None),
+    ]
+
+    CRAWL_STATS_STATEMENTS = [
+        # Total crawls
+        ("SELECT COUNT(*) as total FROM crawl_logs", None),
+        # Success/failed breakdown
+        ("SELECT status, COUNT(*) as count FROM crawl_logs GROUP BY status", None),
+        # Total articles captured
+        (
+            "SELECT SUM(articles_count) as total FROM crawl_logs WHERE status = 'success'",
+            None,
+        ),
+        # Average duration
+        (
+            "SELECT AVG(duration_ms) as avg_duration FROM crawl_logs WHERE status = 'success'",
+            None,
+        ),
+    ]
+
+    CRAWL_LOGS_SQL = """
+        SELECT * FROM crawl_logs 
+        ORDER BY crawled_at DESC 
+        LIMIT ? OFFSET ?
+        """
+
     def __init__(
         self,
         account_id: str,
@@ -26,14 +110,6 @@ class D1StorageAdapter(StorageAdapter):
         api_token: str,
         base_url: str = "https://api.cloudflare.com/client/v4",
     ):
-        """Initialize D1 storage adapter.
-
-        Args:
-            account_id: Cloudflare account ID
-            database_id: D1 database ID
-            api_token: Cloudflare API token with D1 read/write permissions
-            base_url: Cloudflare API base URL
-        """
         self.account_id = account_id
         self.database_id = database_id
         self.api_token = api_token
@@ -41,6 +117,13 @@ class D1StorageAdapter(StorageAdapter):
         self._api_base = (
             f"{self.base_url}/accounts/{self.account_id}/d1/database/{self.database_id}"
         )
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._statements = 0
+        self._errors = 0
+        self._total_time = 0.0
+        self._max_time = 0.0
+        self._recent_times: deque = deque(maxlen=1000)
 
     def _headers(self) -> Dict[str, str]:
         """Get request headers with authentication."""
@@ -49,49 +132,93 @@ class D1StorageAdapter(StorageAdapter):
             "Content-Type": "application/json",
         }
 
-    def _execute_sql(
-        self, sql: str, params: Optional[List[Any]] = None
-    ) -> Dict[str, Any]:
-        """Execute SQL query via D1 API.
+    def _check_response(self, status: int, body: str) -> Dict[str, Any]:
+        """Decode a /query response, raising on HTTP or API errors.
 
         Args:
-            sql: SQL query string
-            params: Query parameters
+            status: HTTP status of the D1 /query response
+            body: Decoded response body
 
         Returns:
             API response as dictionary
 
         Raises:
-            Exception: If API request fails
+            Exception: If the request failed
         """
-        url = f"{self._api_base}/query"
-
-        payload = {"sql": sql, "params": params or []}
-
-        data = json.dumps(payload).encode("utf-8")
-
-        req = urllib.request.Request(
-            url, data=data, headers=self._headers(), method="POST"
+        if status >= 400:
+            raise Exception(f"D1 HTTP error {status}: {body}")
+
+        result = json.loads(body)
+        if not result.get("success", False):
+            errors = result.get("errors", [])
+            error_msg = (
+                errors[0].get("message", "Unknown error")
+                if errors
+                else "Unknown error"
+            )
+            raise Exception(f"D1 API error: {error_msg}")
+        return result
+
+    def _batch_chunks(
+        self, statements: Iterable[Tuple[str, Optional[List[Any]]]]
+    ) -> List[List[Tuple[str, List[Any]]]]:
+        """Split statements into ``STATEMENTS_PER_REQUEST``-sized requests."""
+        statements = [(sql, params or []) for sql, params in statements]
+        return [
+            statements[start : start + self.STATEMENTS_PER_REQUEST]
+            for start in range(0, len(statements), self.STATEMENTS_PER_REQUEST)
+        ]
+
+    def _batch_results(
+        self, response: Dict[str, Any], chunk: List[Tuple[str, List[Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Return the per-statement results of a batch response."""
+        entries = response.get("result") or []
+        if len(entries) != len(chunk):
+            raise Exception(
+                f"D1 batch error: {len(entries)} results for {len(chunk)} statements"
+            )
+        return entries
+
+    def _record_query(self, elapsed: float, statements: int, ok: bool) -> None:
+        with self._stats_lock:
+            self._requests += 1
+            self._statements += statements
+            self._errors += 0 if ok else 1
+            self._total_time += elapsed
+            self._max_time = max(self._max_time, elapsed)
+            self._recent_times.append(elapsed)
+        logger.debug(
+            "D1 query: %d statement(s) in %.1f ms%s",
+            statements,
+            elapsed * 1000,
+            "" if ok else " (failed)",
         )
 
-        try:
-            with urllib.request.urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode("utf-8"))
-
-            if not result.get("success", False):
-                errors = result.get("errors", [])
-                error_msg = (
-                    errors[0].get("message", "Unknown error")
-                    if errors
-                    else "Unknown error"
-                )
-                raise Exception(f"D1 API error: {error_msg}")
-
-            return result
+    def query_stats(self) -> Dict[str, Any]:
+        """Return response-time statistics for this adapter's D1 requests.
 
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8")
-            raise Exception(f"D1 HTTP error {e.code}: {error_body}")
+        Returns:
+            Dictionary with request/statement/error counts, and average,
+            median, p95 and maximum response time in milliseconds (the
+            percentiles cover the most recent 1000 requests)
+        """
+        with self._stats_lock:
+            recent = sorted(self._recent_times)
+            requests = self._requests
+            stats = {
+                "requests": requests,
+                "statements": self._statements,
+                "errors": self._errors,
+                "total_ms": self._total_time * 1000,
+                "avg_ms": self._total_time / requests * 1000 if requests else 0.0,
+                "max_ms": self._max_time * 1000,
+            }
+        for name, fraction in (("p50_ms", 0.5), ("p95_ms", 0.95)):
+            # Nearest-rank percentile
+            index = max(0, math.ceil(len(recent) * fraction) - 1)
+            stats[name] = recent[index] * 1000 if recent else 0.0
+        return stats
 
     def _parse_result(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Parse D1 API response to get rows.
@@ -133,6 +260,256 @@ class D1StorageAdapter(StorageAdapter):
             return rows[0]
         return None
 
+    def _row_to_article(self, row: Dict[str, Any]) -> ArticleModel:
+        """Convert database row to ArticleModel.
+
+        Args:
+            row: Database row as dictionary
+
+        Returns:
+            ArticleModel instance
+        """
+        # Parse JSON fields
+        categories = json.loads(row.get("categories", "[]"))
+        tags = json.loads(row.get("tags", "[]"))
+
+        return ArticleModel(
+            id=row["id"],
+            title=row["title"],
+            content=row.get("content", ""),
+            url=row["url"],
+            published_at=row.get("published_at"),
+            source=row["source"],
+            categories=categories,
+            tags=tags,
+            summary=row.get("summary"),
+            raw_markdown=row.get("raw_markdown"),
+            ingested_at=row["ingested_at"],
+        )
+
+    def _articles_query(
+        self, filters: Optional[Dict[str, Any]], limit: int, offset: int
+    ) -> Tuple[str, List[Any]]:
+        """Build the SQL and parameters for ``fetch_articles``."""
+        filters = filters or {}
+
+        sql = "SELECT * FROM articles WHERE 1=1"
+        params: List[Any] = []
+
+        # Add filters
+        if "source" in filters:
+            sql += " AND source = ?"
+            params.append(filters["source"])
+
+        if "id" in filters:
+            sql += " AND id = ?"
+            params.append(filters["id"])
+
+        # Date range filters
+        if "date_start" in filters:
+            sql += " AND ingested_at >= ?"
+            params.append(filters["date_start"])
+
+        if "date_end" in filters:
+            sql += " AND ingested_at <= ?"
+            params.append(filters["date_end"])
+
+        # Add ordering and pagination
+        sql += " ORDER BY ingested_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        return sql, params
+
+    def _rows_to_articles(self, result: Dict[str, Any]) -> List[ArticleModel]:
+        """Convert a /query response of article rows to ArticleModel instances."""
+        articles = []
+        rows = self._parse_result(result)
+        for row in rows:
+            if isinstance(row, dict):
+                articles.append(self._row_to_article(row))
+
+        return articles
+
+    def _stats_from_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build ``get_stats`` output from the ``STATS_STATEMENTS`` results."""
+        count_result, sources_result = results
+
+        total = 0
+        rows = count_result.get("results") or []
+        if rows:
+            total = rows[0].get("total", 0)
+
+        sources = {}
+        for row in sources_result.get("results") or []:
+            sources[row["source"]] = row["count"]
+
+        return {"total": total, "sources": sources}
+
+    def _crawl_stats_from_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build ``get_crawl_stats`` output from the ``CRAWL_STATS_STATEMENTS`` results."""
+        total_result, status_result, articles_result, avg_duration_result = results
+
+        rows = total_result.get("results") or []
+        total = rows[0].get("total", 0) if rows else 0
+
+        status_counts = {}
+        for row in status_result.get("results") or []:
+            status_counts[row["status"]] = row["count"]
+
+        rows = articles_result.get("results") or []
+        total_articles = rows[0].get("total", 0) if rows else 0
+
+        rows = avg_duration_result.get("results") or []
+        avg_duration = rows[0].get("avg_duration", 0) if rows else 0
+
+        return {
+            "total_crawls": total,
+            "status_counts": status_counts,
+            "total_articles_captured": total_articles,
+            "avg_duration_ms": int(avg_duration) if avg_duration else 0,
+        }
+
+
+class D1StorageAdapter(D1AdapterBase, StorageAdapter):
+    """Production storage adapter using Cloudflare D1.
+
+    This adapter connects to Cloudflare D1 via the REST API
+    and provides full CRUD operations for articles.
+    """
+
+    def __init__(
+        self,
+        account_id: str,
+        database_id: str,
+        api_token: str,
+        base_url: str = "https://api.cloudflare.com/client/v4",
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        keepalive_expiry: Optional[float] = None,
+    ):
+        """Initialize D1 storage adapter.
+
+        Args:
+            account_id: Cloudflare account ID
+            database_id: D1 database ID
+            api_token: Cloudflare API token with D1 read/write permissions
+            base_url: Cloudflare API base URL
+            pool_size: Maximum concurrent keep-alive connections. If this and
+                the other pool settings are omitted, the process-wide pool
+                from ``get_d1_http_client`` is used.
+            timeout: Request timeout in seconds
+            keepalive_expiry: Seconds an idle connection may be reused
+        """
+        super().__init__(account_id, database_id, api_token, base_url)
+        if pool_size is None and timeout is None and keepalive_expiry is None:
+            self._http = get_d1_http_client()
+            self._owns_http = False
+        else:
+            self._http = HTTPClient(
+                timeout=DEFAULT_D1_TIMEOUT if timeout is None else timeout,
+                max_connections_per_host=pool_size or DEFAULT_D1_POOL_SIZE,
+                keepalive_expiry=(
+                    DEFAULT_D1_KEEPALIVE_EXPIRY if keepalive_expiry is None else keepalive_expiry
+                ),
+            )
+            self._owns_http = True
+
+    def close(self) -> None:
+        """Close the adapter's own connection pool (the shared pool stays open)."""
+        if self._owns_http:
+            self._http.close()
+
+    def _execute_sql(
+        self, sql: str, params: Optional[List[Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute SQL query via D1 API.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            Exception: If API request fails
+        """
+        return self._post_query({"sql": sql, "params": params or []})
+
+    def _execute_batch(
+        self, statements: List[Tuple[str, List[Any]]]
+    ) -> Dict[str, Any]:
+        """Execute several statements in a single D1 API request.
+
+        The statements are sent as a ``batch`` array and run by D1 in one
+        implicit transaction.
+
+        Args:
+            statements: List of (sql, params) tuples
+
+        Returns:
+            API response as dictionary, with one ``result`` entry per statement
+
+        Raises:
+            Exception: If API request fails
+        """
+        return self._post_query(
+            {"batch": [{"sql": sql, "params": params or []} for sql, params in statements]}
+        )
+
+    def batch(
+        self, statements: Iterable[Tuple[str, Optional[List[Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """Run several statements with as few D1 API requests as possible.
+
+        Statements are packed ``STATEMENTS_PER_REQUEST`` at a time into one
+        ``batch`` request each (usually a single request). Each request runs
+        in one implicit D1 transaction, so a failing statement fails its
+        whole request.
+
+        Args:
+            statements: (sql, params) tuples; params may be None
+
+        Returns:
+            One result per statement, in order. Each is a dict with the rows
+            under ``results`` plus ``meta`` and ``success``.
+
+        Raises:
+            Exception: If an API request fails or returns the wrong number
+                of results
+        """
+        results: List[Dict[str, Any]] = []
+        for chunk in self._batch_chunks(statements):
+            results.extend(self._batch_results(self._execute_batch(chunk), chunk))
+        return results
+
+    def _post_query(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a payload to the D1 /query endpoint and check for errors.
+
+        Args:
+            payload: JSON body (a single statement or a ``batch`` array)
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            Exception: If API request fails
+        """
+        url = f"{self._api_base}/query"
+
+        data = json.dumps(payload).encode("utf-8")
+        statements = len(payload.get("batch", ())) or 1
+
+        start = time.monotonic()
+        ok = False
+        try:
+            response = self._http.request("POST", url, headers=self._headers(), body=data)
+            result = self._check_response(response.status, response.text())
+            ok = True
+            return result
+        finally:
+            self._record_query(time.monotonic() - start, statements, ok)
+
     def ensure_schema(self) -> None:
         """Create articles and crawl_logs tables if they don't exist."""
         create_table_sql = """
@@ -180,18 +557,33 @@ class D1StorageAdapter(StorageAdapter):
         CREATE INDEX IF NOT EXISTS idx_crawl_logs_crawled_at ON crawl_logs(crawled_at);
         """
 
-        self._execute_sql(create_table_sql)
-        self._execute_sql(create_crawl_logs_sql)
-        self._execute_sql(create_index_sql)
-        self._execute_sql(create_index_date_sql)
-        self._execute_sql(create_crawl_logs_index_sql)
+        # 迁移检查：is_ai_related 字段是否已存在
+        column_check_sql = (
+            "SELECT COUNT(*) AS present FROM pragma_table_info('articles') "
+            "WHERE name = 'is_ai_related'"
+        )
 
-        # 迁移：添加 is_ai_related 字段
-        try:
-            self._execute_sql("ALTER TABLE articles ADD COLUMN is_ai_related INTEGER DEFAULT 0")
-        except Exception:
-            # 字段已存在，忽略错误
-            pass
+        *_, column_check = self.batch(
+            [
+                (create_table_sql, None),
+                (create_crawl_logs_sql, None),
+                (create_index_sql, None),
+                (create_index_date_sql, None),
+                (create_crawl_logs_index_sql, None),
+                (column_check_sql, None),
+            ]
+        )
+
+        # 迁移：添加 is_ai_related 字段（单独执行，失败不影响建表）
+        rows = column_check.get("results") or []
+        if not (rows and rows[0].get("present")):
+            try:
+                self._execute_sql(
+                    "ALTER TABLE articles ADD COLUMN is_ai_related INTEGER DEFAULT 0"
+                )
+            except Exception:
+                # 字段已存在，忽略错误
+                pass
 
     def _decode_double_encoded(self, text: str) -> str:
         """Decode double-encoded Unicode strings.
@@ -265,33 +657,6 @@ class D1StorageAdapter(StorageAdapter):
             1 if get("is_ai_related") else 0,
         )
 
-    def _row_to_article(self, row: Dict[str, Any]) -> ArticleModel:
-        """Convert database row to ArticleModel.
-
-        Args:
-            row: Database row as dictionary
-
-        Returns:
-            ArticleModel instance
-        """
-        # Parse JSON fields
-        categories = json.loads(row.get("categories", "[]"))
-        tags = json.loads(row.get("tags", "[]"))
-
-        return ArticleModel(
-            id=row["id"],
-            title=row["title"],
-            content=row.get("content", ""),
-            url=row["url"],
-            published_at=row.get("published_at"),
-            source=row["source"],
-            categories=categories,
-            tags=tags,
-            summary=row.get("summary"),
-            raw_markdown=row.get("raw_markdown"),
-            ingested_at=row["ingested_at"],
-        )
-
     def write_article(self, article: ArticleModel) -> None:
         """Insert a new article.
 
@@ -326,6 +691,57 @@ class D1StorageAdapter(StorageAdapter):
         row = self._article_to_row(article)
         self._execute_sql(sql, list(row))
 
+    def upsert_articles(self, articles: Iterable[ArticleModel]) -> int:
+        """Insert or update many articles with few API requests.
+
+        Rows are grouped into multi-row ``INSERT OR REPLACE`` statements
+        (``UPSERT_ROWS_PER_STATEMENT`` rows each) and the statements are sent
+        ``STATEMENTS_PER_REQUEST`` at a time through ``batch``.
+
+        Args:
+            articles: Articles to upsert
+
+        Returns:
+            Number of articles written
+        """
+        rows = [self._article_to_row(article) for article in articles]
+        if not rows:
+            return 0
+
+        statements: List[Tuple[str, List[Any]]] = []
+        for start in range(0, len(rows), self.UPSERT_ROWS_PER_STATEMENT):
+            chunk = rows[start : start + self.UPSERT_ROWS_PER_STATEMENT]
+            placeholders = ", ".join(
+                ["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk)
+            )
+            sql = f"""
+            INSERT OR REPLACE INTO articles (
+                id, title, content, url, published_at, source,
+                categories, tags, summary, raw_markdown, ingested_at, is_ai_related
+            ) VALUES {placeholders}
+            """
+            statements.append((sql, [value for row in chunk for value in row]))
+
+        self.batch(statements)
+
+        return len(rows)
+
+    def iter_article_keys(self, page_size: int = 1000) -> Iterator[Tuple[str, str, str]]:
+        """Yield (url, id, title) for every stored article, one page per request."""
+        last_rowid = 0
+        while True:
+            result = self._execute_sql(
+                "SELECT rowid, url, id, title FROM articles WHERE rowid > ? "
+                "ORDER BY rowid LIMIT ?",
+                [last_rowid, page_size],
+            )
+            rows = self._parse_result(result)
+            for row in rows:
+                yield row.get("url"), row.get("id"), row.get("title")
+            if len(rows) < page_size:
+                return
+            last_rowid = rows[-1]["rowid"]
+
     def fetch_articles(
         self, filters: Optional[Dict[str, Any]] = None, limit: int = 50, offset: int = 0
     ) -> List[ArticleModel]:
@@ -339,43 +755,9 @@ class D1StorageAdapter(StorageAdapter):
         Returns:
             List of ArticleModel instances
         """
-        filters = filters or {}
-
-        sql = "SELECT * FROM articles WHERE 1=1"
-        params: List[Any] = []
-
-        # Add filters
-        if "source" in filters:
-            sql += " AND source = ?"
-            params.append(filters["source"])
-
-        if "id" in filters:
-            sql += " AND id = ?"
-            params.append(filters["id"])
-
-        # Date range filters
-        if "date_start" in filters:
-            sql += " AND ingested_at >= ?"
-            params.append(filters["date_start"])
-
-        if "date_end" in filters:
-            sql += " AND ingested_at <= ?"
-            params.append(filters["date_end"])
-
-        # Add ordering and pagination
-        sql += " ORDER BY ingested_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-
-        result = self._execute_sql(sql, params)
-
-        # Parse results using helper
-        articles = []
-        rows = self._parse_result(result)
-        for row in rows:
-            if isinstance(row, dict):
-                articles.append(self._row_to_article(row))
-
-        return articles
+        return self._rows_to_articles(
+            self._execute_sql(*self._articles_query(filters, limit, offset))
+        )
 
     def get_article_by_id(self, article_id: str) -> Optional[ArticleModel]:
         """Get a single article by ID.
@@ -418,23 +800,7 @@ class D1StorageAdapter(StorageAdapter):
         Returns:
             Dictionary with total count and source breakdown
         """
-        # Total count
-        count_result = self._execute_sql("SELECT COUNT(*) as total FROM articles")
-        total = 0
-        rows = self._parse_result(count_result)
-        if rows:
-            total = rows[0].get("total", 0)
-
-        # Source breakdown
-        sources_result = self._execute_sql(
-            "SELECT source, COUNT(*) as count FROM articles GROUP BY source"
-        )
-        sources = {}
-        rows = self._parse_result(sources_result)
-        for row in rows:
-            sources[row["source"]] = row["count"]
-
-        return {"total": total, "sources": sources}
+        return self._stats_from_results(self.batch(self.STATS_STATEMENTS))
 
     def delete_old_articles(self, days: int = 30) -> int:
         """Delete articles older than specified days.
@@ -505,13 +871,7 @@ class D1StorageAdapter(StorageAdapter):
         Returns:
             List of crawl log entries
         """
-        sql = """
-        SELECT * FROM crawl_logs 
-        ORDER BY crawled_at DESC 
-        LIMIT ? OFFSET ?
-        """
-
-        result = self._execute_sql(sql, [limit, offset])
+        result = self._execute_sql(self.CRAWL_LOGS_SQL, [limit, offset])
         return self._parse_result(result)
 
     def get_crawl_stats(self) -> Dict[str, Any]:
@@ -520,37 +880,4 @@ class D1StorageAdapter(StorageAdapter):
         Returns:
             Dictionary with crawl stats
         """
-        # Total crawls
-        total_result = self._execute_sql("SELECT COUNT(*) as total FROM crawl_logs")
-        rows = self._parse_result(total_result)
-        total = rows[0].get("total", 0) if rows else 0
-
-        # Success/failed breakdown
-        status_result = self._execute_sql(
-            "SELECT status, COUNT(*) as count FROM crawl_logs GROUP BY status"
-        )
-        status_counts = {}
-        rows = self._parse_result(status_result)
-        for row in rows:
-            status_counts[row["status"]] = row["count"]
-
-        # Total articles captured
-        articles_result = self._execute_sql(
-            "SELECT SUM(articles_count) as total FROM crawl_logs WHERE status = 'success'"
-        )
-        rows = self._parse_result(articles_result)
-        total_articles = rows[0].get("total", 0) if rows else 0
-
-        # Average duration
-        avg_duration_result = self._execute_sql(
-            "SELECT AVG(duration_ms) as avg_duration FROM crawl_logs WHERE status = 'success'"
-        )
-        rows = self._parse_result(avg_duration_result)
-        avg_duration = rows[0].get("avg_duration", 0) if rows else 0
-
-        return {
-            "total_crawls": total,
-            "status_counts": status_counts,
-            "total_articles_captured": total_articles,
-            "avg_duration_ms": int(avg_duration) if avg_duration else 0,
-        }
+        return self._crawl_stats_from_results(self.batch(self.CRAWL_STATS_STATEMENTS))
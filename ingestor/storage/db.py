@@ -8,10 +8,12 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from shared.models import ArticleModel
 
@@ -29,6 +31,26 @@ class StorageAdapter(ABC):
     def upsert_article(self, article: ArticleModel) -> None:
         pass
 
+    def upsert_articles(self, articles: Iterable[ArticleModel]) -> int:
+        """Insert or update many articles, returning how many were written.
+
+        Adapters override this to batch round-trips; the default falls back
+        to one ``upsert_article`` call per article.
+        """
+        count = 0
+        for article in articles:
+            self.upsert_article(article)
+            count += 1
+        return count
+
+    def iter_article_keys(self) -> Iterator[Tuple[str, str, str]]:
+        """Yield (url, id, title) for every stored article.
+
+        Used to warm the ingestor's seen-URL index; adapters that cannot list
+        their articles yield nothing.
+        """
+        return iter(())
+
     @abstractmethod
     def fetch_articles(
         self, filters: dict, limit: int = 50, offset: int = 0
@@ -36,12 +58,25 @@ class StorageAdapter(ABC):
         pass
 
 
+class _ThreadConnection:
+    """A thread's connection, held in a ``threading.local`` so that it is
+    dropped (and closed by its finalizer) when the thread exits."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
 class LocalDBAdapter(StorageAdapter):
     """SQLite-based local storage adapter for development.
 
     Stores articles in a local SQLite file for persistence across restarts.
     """
 
+    # Rows per multi-row INSERT, kept under SQLite's 999 bound-parameter limit
+    UPSERT_ROWS_PER_STATEMENT = 90
+
     def __init__(self, connection_string: str | None = None):
         # Default to data/local.db if no connection string provided
         if connection_string:
@@ -51,13 +86,40 @@ class LocalDBAdapter(StorageAdapter):
             data_dir.mkdir(exist_ok=True)
             self.db_path = str(data_dir / "local.db")
 
+        # One connection per thread, reused across calls until close(). Each
+        # is closed when its thread exits; the finalizers let close() reach
+        # the connections of threads that are still alive.
+        self._local = threading.local()
+        self._finalizers: Set[weakref.finalize] = set()
+        self._connections_lock = threading.Lock()
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the calling thread's database connection, opening it on first use."""
+        holder = getattr(self._local, "connection", None)
+        if holder is None:
+            # check_same_thread=False only so close() and the thread-exit
+            # finalizer can run on another thread; each connection is still
+            # used by a single thread
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            holder = _ThreadConnection(conn)
+            finalizer = weakref.finalize(holder, conn.close)
+            with self._connections_lock:
+                self._finalizers = {f for f in self._finalizers if f.alive}
+                self._finalizers.add(finalizer)
+            self._local.connection = holder
+        return holder.conn
+
+    def close(self) -> None:
+        """Close every connection opened by this adapter."""
+        with self._connections_lock:
+            finalizers = self._finalizers
+            self._finalizers = set()
+            # Threads that keep running open a new connection on next use
+            self._local = threading.local()
+        for finalizer in finalizers:
+            finalizer()
 
     def _init_db(self) -> None:
         """Initialize database schema."""
@@ -193,6 +255,38 @@ class LocalDBAdapter(StorageAdapter):
             )
             conn.commit()
 
+    def upsert_articles(self, articles: Iterable[ArticleModel]) -> int:
+        """Insert or update many articles in a single transaction.
+
+        Rows are written with multi-row ``INSERT OR REPLACE`` statements of
+        up to ``UPSERT_ROWS_PER_STATEMENT`` rows each.
+        """
+        rows = [self._article_to_row(article) for article in articles]
+        if not rows:
+            return 0
+
+        with self._get_connection() as conn:
+            for start in range(0, len(rows), self.UPSERT_ROWS_PER_STATEMENT):
+                chunk = rows[start : start + self.UPSERT_ROWS_PER_STATEMENT]
+                placeholders = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk))
+                conn.execute(
+                    f"""
+                    INSERT OR REPLACE INTO articles (
+                        id, title, content, url, published_at, source,
+                        categories, tags, summary, raw_markdown, ingested_at
+                    ) VALUES {placeholders}
+                """,
+                    [value for row in chunk for value in row],
+                )
+            conn.commit()
+
+        return len(rows)
+
+    def iter_article_keys(self) -> Iterator[Tuple[str, str, str]]:
+        with self._get_connection() as conn:
+            for row in conn.execute("SELECT url, id, title FROM articles"):
+                yield row["url"], row["id"], row["title"]
+
     def fetch_articles(
         self, filters: dict, limit: int = 50, offset: int = 0
     ) -> List[ArticleModel]:
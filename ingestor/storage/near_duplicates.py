@@ -0,0 +1,307 @@
+"""Near-duplicate detection for articles carried by several sources.
+
+NewsNow, Reddit, HN, V2EX and the RSS blogs often post the same story under
+different URLs. Each item gets a MinHash signature over its title words (CJK
+text as character bigrams); items whose estimated Jaccard similarity to an
+already-known article reaches ``threshold`` are collapsed into it before they
+are written, so the expensive extraction and summarization steps never see
+the redundant copies.
+
+Candidates come from LSH banding (16 bands of 4 rows, i.e. pairs above ~0.5
+similarity are very likely to share a band), then are verified against the
+full signature.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import threading
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ingestor.storage.seen_index import article_key
+
+DEFAULT_NEAR_DUPLICATE_INDEX_PATH = ".ai_cache/near_duplicates.db"
+
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed permutations, so signatures stay comparable across runs
+_PERMUTATIONS = [
+    (
+        int.from_bytes(hashlib.blake2b(b"a%d" % i, digest_size=8).digest(), "big") % _PRIME | 1,
+        int.from_bytes(hashlib.blake2b(b"b%d" % i, digest_size=8).digest(), "big") % _PRIME,
+    )
+    for i in range(NUM_PERM)
+]
+
+# Latin words/numbers, or runs of CJK characters (tokenized as bigrams)
+_TOKEN_RE = re.compile(r"[a-z0-9]+|[\u3400-\u9fff]+")
+_CJK_RE = re.compile(r"[\u3400-\u9fff]")
+
+# Titles with fewer features than this borrow from the description; items
+# that still fall short are too generic to cluster safely
+MIN_FEATURES = 4
+DESCRIPTION_CHARS = 200
+
+
+def _features(text: str) -> List[str]:
+    features = []
+    for token in _TOKEN_RE.findall((text or "").lower()):
+        if _CJK_RE.match(token):
+            if len(token) == 1:
+                features.append(token)
+            else:
+                features.extend(token[i : i + 2] for i in range(len(token) - 1))
+        else:
+            features.append(token)
+    return features
+
+
+def minhash(title: str, description: str = "") -> Optional[array]:
+    """MinHash signature of an article, or None if it has too little text.
+
+    Headlines are what the copies of a story share; descriptions differ a
+    lot between sources (HN items usually have none), so they only pad out
+    titles that are too short on their own.
+    """
+    features = set(_features(title))
+    if len(features) < MIN_FEATURES:
+        features.update(_features((description or "")[:DESCRIPTION_CHARS]))
+    if len(features) < MIN_FEATURES - 1:
+        return None
+
+    hashes = [
+        int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "big")
+        for f in features
+    ]
+    return array(
+        "I", (min((a * h + b) % _PRIME for h in hashes) & _MAX_HASH for a, b in _PERMUTATIONS)
+    )
+
+
+def similarity(a: array, b: array) -> float:
+    """Jaccard similarity estimated from two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+
+def _bands(signature: array) -> List[bytes]:
+    data = signature.tobytes()
+    width = ROWS_PER_BAND * signature.itemsize
+    return [data[i * width : (i + 1) * width] for i in range(BANDS)]
+
+
+class NearDuplicateIndex:
+    """MinHash-LSH index kept in memory and persisted to SQLite.
+
+    ``filter_new`` claims the signatures of the items it lets through right
+    away, so copies of one story fetched concurrently from different sources
+    are collapsed within a run; ``add_many`` persists them once they are
+    stored, and ``release`` drops the claims of items that never were.
+    Items collapsed into an earlier article are recorded as aliases.
+    Thread-safe.
+    """
+
+    def __init__(
+        self, path: str | Path = DEFAULT_NEAR_DUPLICATE_INDEX_PATH, threshold: float = 0.7
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+
+        self._lock = threading.Lock()
+        self._signatures: Dict[str, array] = {}
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(BANDS)]
+        # Keys inserted by filter_new whose articles are not stored yet
+        self._claimed: Set[str] = set()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS signatures (
+                key TEXT PRIMARY KEY,
+                signature BLOB NOT NULL,
+                seen_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS aliases (
+                duplicate_key TEXT PRIMARY KEY,
+                canonical_key TEXT NOT NULL,
+                seen_at TEXT NOT NULL
+            );
+        """
+        )
+        for key, blob in self._conn.execute("SELECT key, signature FROM signatures"):
+            self._insert(key, array("I", blob))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._signatures)
+
+    def _insert(self, key: str, signature: array) -> None:
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for buckets, band in zip(self._buckets, _bands(signature)):
+            buckets.setdefault(band, []).append(key)
+
+    def _remove(self, key: str) -> None:
+        signature = self._signatures.pop(key)
+        for buckets, band in zip(self._buckets, _bands(signature)):
+            keys = buckets[band]
+            keys.remove(key)
+            if not keys:
+                del buckets[band]
+
+    def _find(self, signature: array) -> Optional[str]:
+        best_key, best_score = None, self.threshold
+        checked = set()
+        for buckets, band in zip(self._buckets, _bands(signature)):
+            for key in buckets.get(band, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                score = similarity(signature, self._signatures[key])
+                if score >= best_score:
+                    best_key, best_score = key, score
+        return best_key
+
+    def find(self, title: str, description: str = "") -> Optional[str]:
+        """Return the key of a known near-duplicate article, if any."""
+        signature = minhash(title, description)
+        if signature is None:
+            return None
+        with self._lock:
+            return self._find(signature)
+
+    def filter_new(
+        self, items: Iterable[Dict[str, Any]], key_of: Callable[[Dict[str, Any]], str]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Split scraper items into (distinct items, number collapsed).
+
+        Args:
+            items: Scraper item dicts with ``title`` and ``description``
+            key_of: Maps an item to its article key
+
+        Returns:
+            Items that are not near-duplicates of a known article, and the
+            count of items collapsed into an existing one
+        """
+        distinct: List[Dict[str, Any]] = []
+        aliases: List[Tuple[str, str, str]] = []
+        now = datetime.utcnow().isoformat()
+
+        with self._lock:
+            for item in items:
+                key = key_of(item)
+                signature = minhash(item.get("title", ""), item.get("description", ""))
+                if signature is None or not key or key in self._signatures:
+                    distinct.append(item)
+                    continue
+                canonical = self._find(signature)
+                if canonical is None:
+                    self._insert(key, signature)
+                    self._claimed.add(key)
+                    distinct.append(item)
+                else:
+                    aliases.append((key, canonical, now))
+
+            if aliases:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO aliases (duplicate_key, canonical_key, seen_at) "
+                    "VALUES (?, ?, ?)",
+                    aliases,
+                )
+                self._conn.commit()
+
+        return distinct, len(aliases)
+
+    def add_many(self, entries: Iterable[Tuple[str, Optional[str], Optional[str]]]) -> None:
+        """Persist (key, title, description) of articles that reached storage.
+
+        Keys claimed by ``filter_new`` keep the signature computed there.
+        """
+        now = datetime.utcnow().isoformat()
+        rows = []
+        for key, title, description in entries:
+            if not key:
+                continue
+            with self._lock:
+                signature = self._signatures.get(key)
+            if signature is None:
+                signature = minhash(title or "", description or "")
+            if signature is not None:
+                rows.append((key, signature))
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO signatures (key, signature, seen_at) VALUES (?, ?, ?)",
+                [(key, signature.tobytes(), now) for key, signature in rows],
+            )
+            self._conn.commit()
+            for key, signature in rows:
+                self._insert(key, signature)
+                self._claimed.discard(key)
+
+    def release(self, keys: Iterable[str]) -> None:
+        """Drop the claims ``filter_new`` made for items that were not stored.
+
+        Keys already persisted by ``add_many`` are kept. Aliases pointing at a
+        released key are removed as well: the collapsed copies were never
+        stored either, so they must be free to come through on a later run.
+        """
+        with self._lock:
+            released = [key for key in keys if key in self._claimed]
+            if not released:
+                return
+            for key in released:
+                self._claimed.discard(key)
+                self._remove(key)
+            self._conn.executemany(
+                "DELETE FROM aliases WHERE canonical_key = ?", [(key,) for key in released]
+            )
+            self._conn.commit()
+
+    def warm_from_storage(self, storage: Any) -> int:
+        """Seed an empty index with the titles in the storage's ``articles`` table.
+
+        Returns:
+            Number of articles loaded (0 if the index already had entries)
+        """
+        if len(self) or not hasattr(storage, "iter_article_keys"):
+            return 0
+        loaded = 0
+        batch: List[Tuple[str, Optional[str], Optional[str]]] = []
+        for url, article_id, title in storage.iter_article_keys():
+            batch.append((article_key(url, article_id), title, None))
+            if len(batch) >= 1000:
+                self.add_many(batch)
+                loaded += len(batch)
+                batch = []
+        if batch:
+            self.add_many(batch)
+            loaded += len(batch)
+        return loaded
+
+    def aliases_of(self, key: str) -> List[str]:
+        """Keys of the items that were collapsed into the article with ``key``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT duplicate_key FROM aliases WHERE canonical_key = ? ORDER BY duplicate_key",
+                (key,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
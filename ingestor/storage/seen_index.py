@@ -0,0 +1,258 @@
+"""Persistent index of already-ingested articles.
+
+Lets the ingestor drop items it stored in a previous run before they are
+transformed and written again. Lookups go through an in-memory Bloom filter
+first, so the common "never seen" case costs no I/O; filter hits are then
+confirmed against an exact SQLite table that also remembers a title
+fingerprint, so an item whose title changed is treated as new.
+
+With a ``ttl``, entries older than that many seconds count as unseen (so an
+article can be reprocessed after a configurable window) and are purged by
+``expire()``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_SEEN_INDEX_PATH = ".ai_cache/seen_index.db"
+
+# Query parameters that only carry tracking/referral data
+_TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "ref_src", "spm"}
+
+
+def normalize_url(url: str) -> str:
+    """Canonicalize a URL so trivially different links map to the same key.
+
+    Lowercases scheme and host, drops default ports, fragments, tracking
+    parameters (``utm_*`` and friends) and trailing slashes, and sorts the
+    remaining query parameters.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and (scheme, port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+        )
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def article_key(url: Optional[str], article_id: Optional[str]) -> str:
+    """Index key for an article: its normalized URL, or its ID without one."""
+    normalized = normalize_url(url or "")
+    if normalized:
+        return normalized
+    return f"id:{article_id}" if article_id else ""
+
+
+def title_fingerprint(title: Optional[str]) -> str:
+    return hashlib.sha1((title or "").strip().encode("utf-8")).hexdigest()[:16]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class SeenIndex:
+    """SQLite-backed seen set with a Bloom filter in front of it.
+
+    Appends and lookups are single indexed statements, and the WAL journal
+    keeps per-item commits cheap. Also usable as a set of keys
+    (``key in index``, ``index.add(key)``). Thread-safe; one instance is
+    shared by all ingestion workers.
+    """
+
+    MIN_CAPACITY = 100_000
+
+    def __init__(self, path: str | Path = DEFAULT_SEEN_INDEX_PATH, ttl: Optional[float] = None):
+        """
+        Args:
+            path: SQLite database file
+            ttl: Seconds after which an entry no longer counts as seen
+                (None keeps entries forever)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen (
+                key TEXT PRIMARY KEY,
+                fingerprint TEXT,
+                seen_at TEXT NOT NULL
+            )
+        """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_at ON seen (seen_at)")
+        self._conn.commit()
+        self._rebuild_filter()
+
+    def _cutoff(self) -> Optional[str]:
+        if self.ttl is None:
+            return None
+        return (datetime.utcnow() - timedelta(seconds=self.ttl)).isoformat()
+
+    def _rebuild_filter(self) -> None:
+        total = self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        self._filter = BloomFilter(max(self.MIN_CAPACITY, total * 2))
+        for (key,) in self._conn.execute("SELECT key FROM seen"):
+            self._filter.add(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def is_seen(self, key: str, fingerprint: Optional[str] = None) -> bool:
+        """True if ``key`` was recorded with the same fingerprint (or any, if None)."""
+        if not key:
+            return False
+        with self._lock:
+            if key not in self._filter:
+                return False
+            row = self._conn.execute(
+                "SELECT fingerprint, seen_at FROM seen WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return False
+        cutoff = self._cutoff()
+        if cutoff is not None and row[1] < cutoff:
+            return False
+        return fingerprint is None or row[0] is None or row[0] == fingerprint
+
+    def __contains__(self, key: str) -> bool:
+        return self.is_seen(key)
+
+    def add(self, key: str, fingerprint: Optional[str] = None) -> None:
+        """Record a single key (already normalized) as seen."""
+        if not key:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO seen (key, fingerprint, seen_at) VALUES (?, ?, ?)",
+                (key, fingerprint, datetime.utcnow().isoformat()),
+            )
+            self._conn.commit()
+            self._filter.add(key)
+            if self._filter.count > self._filter.capacity:
+                self._rebuild_filter()
+
+    def expire(self) -> int:
+        """Delete entries older than ``ttl``.
+
+        Returns:
+            Number of entries removed (0 without a ttl)
+        """
+        cutoff = self._cutoff()
+        if cutoff is None:
+            return 0
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM seen WHERE seen_at < ?", (cutoff,)).rowcount
+            self._conn.commit()
+            if removed:
+                self._rebuild_filter()
+        return removed
+
+    def filter_new(self, items: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """Split scraper items into (new or changed items, number skipped)."""
+        new_items: List[Dict[str, Any]] = []
+        skipped = 0
+        for item in items:
+            key = article_key(item.get("url"), item.get("id"))
+            if self.is_seen(key, title_fingerprint(item.get("title"))):
+                skipped += 1
+            else:
+                new_items.append(item)
+        return new_items, skipped
+
+    def add_many(
+        self, entries: Iterable[Tuple[Optional[str], Optional[str], Optional[str]]]
+    ) -> None:
+        """Record (url, article_id, title) tuples as ingested."""
+        now = datetime.utcnow().isoformat()
+        rows = []
+        for url, article_id, title in entries:
+            key = article_key(url, article_id)
+            if key:
+                rows.append((key, title_fingerprint(title), now))
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen (key, fingerprint, seen_at) VALUES (?, ?, ?)", rows
+            )
+            self._conn.commit()
+            for key, _, _ in rows:
+                self._filter.add(key)
+            if self._filter.count > self._filter.capacity:
+                self._rebuild_filter()
+
+    def warm_from_storage(self, storage: Any) -> int:
+        """Seed an empty index from the storage's ``articles`` table.
+
+        Returns:
+            Number of articles loaded (0 if the index already had entries)
+        """
+        if len(self) or not hasattr(storage, "iter_article_keys"):
+            return 0
+        loaded = 0
+        batch: List[Tuple[Optional[str], Optional[str], Optional[str]]] = []
+        for entry in storage.iter_article_keys():
+            batch.append(entry)
+            if len(batch) >= 1000:
+                self.add_many(batch)
+                loaded += len(batch)
+                batch = []
+        if batch:
+            self.add_many(batch)
+            loaded += len(batch)
+        return loaded
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
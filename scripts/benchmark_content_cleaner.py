@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+噪声清理微基准：逐条 re.sub 的旧实现 vs 预编译的 ContentCleaner
+
+ai/articles/original 中的样例只有元信息，这里把每篇样例嵌入一个模拟的
+Crawl4AI 页面（导航菜单、登录区、图片行、备案信息等噪声 + 正文），
+再按 --scale 放大到接近真实页面的大小。另外测一段病态输入：
+一行里反复出现噪声前缀但没有结尾，旧实现的 .*? 会逐个回溯到行尾。
+
+用法:
+    python scripts/benchmark_content_cleaner.py
+    python scripts/benchmark_content_cleaner.py --input ai/articles/original --scale 20
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.extractors.content_cleaner import markdown_cleaner  # noqa: E402
+
+# 重构前 crawl4ai_extractor.clean_content 使用的规则
+LEGACY_PATTERNS = [
+    r"\[?\]\(https://36kr\.com/usercenter[^\)]*\)",
+    r"账号设置.*?退出登录",
+    r"登录\s*搜索",
+    r"(\* \[?[^\]]*\]?\(https?://[^\)]+\)\s*){3,}",
+    r"!\[.*?\]\(https?://img\.36krcdn\.com[^\)]+\)",
+    r"京ICP证\d+号.*?",
+    r"京ICP备\d+号.*?",
+    r"京公网安备\d+号",
+    r"36氪APP.*?看到未来",
+    r"鲸准.*?领跑行业",
+    r"您正在使用IE低版浏览器.*?(?:浏览器|体验)",
+    r"为了您的.*?账号安全",
+    r"爱搞机",
+    r"雷锋网",
+    r"相关推荐.*?热门文章",
+    r"更多精彩.*?",
+]
+
+
+def legacy_clean(text: str, url: str = None) -> str:
+    """重构前的实现：每条规则一次 re.sub，再逐行过滤"""
+    for pattern in LEGACY_PATTERNS:
+        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.MULTILINE)
+    cleaned_lines = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if re.match(r"^!\[.*?\]\(.+\)$", stripped):
+            continue
+        if len(stripped) < 15 and (
+            "36kr" in stripped or "leiphone" in stripped or "krcdn" in stripped
+        ):
+            continue
+        if len(stripped) < 5:
+            continue
+        cleaned_lines.append(line)
+    text = "\n".join(cleaned_lines)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+PAGE_TEMPLATE = """[](https://36kr.com/usercenter/account) 账号设置 我的关注 退出登录
+登录 搜索
+* [首页](https://36kr.com/)
+* [快讯](https://36kr.com/newsflashes)
+* [资讯](https://36kr.com/information/web_news)
+* [专题](https://36kr.com/topics)
+![logo](https://img.36krcdn.com/logo.png)
+
+# {title}
+
+{body}
+
+![](https://img.36krcdn.com/cover.jpg)
+36kr
+相关推荐 · 热门文章
+36氪APP 让一部分人先看到未来
+京ICP备12345678号 京公网安备11010502012345号
+"""
+
+PARAGRAPH = (
+    "大模型的推理成本在过去一年里持续下降，越来越多的团队开始把长文本摘要、"
+    "代码补全和检索增强生成部署到生产环境中。{meta}\n"
+)
+
+
+def load_pages(input_dir: Path, scale: int) -> List[Tuple[str, str]]:
+    """把样例文章嵌入模拟页面，返回 (url, 页面) 列表"""
+    pages = []
+    for path in sorted(input_dir.glob("*.md")):
+        meta = path.read_text(encoding="utf-8")
+        url = "https://36kr.com/p/0"
+        for line in meta.splitlines():
+            if line.startswith("URL:"):
+                url = line.split(":", 1)[1].strip()
+        body = PARAGRAPH.format(meta=meta.replace("\n", " ")) * scale
+        pages.append((url, PAGE_TEMPLATE.format(title=path.stem, body=body)))
+    return pages
+
+
+def bench(
+    func: Callable[[str, str], str], pages: List[Tuple[str, str]], repeat: int
+) -> float:
+    """返回每页平均耗时（微秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for url, page in pages:
+            func(page, url)
+    return (time.perf_counter() - start) / (repeat * len(pages)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="噪声清理微基准")
+    parser.add_argument("--input", type=Path, default=Path("ai/articles/original"))
+    parser.add_argument("--scale", type=int, default=20, help="每页正文段落数")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--pathological", type=int, default=4000, help="病态输入的重复次数")
+    args = parser.parse_args()
+
+    pages = load_pages(args.input, args.scale)
+    if not pages:
+        print(f"❌ 没有样例文章: {args.input}")
+        return 1
+
+    avg_size = sum(len(page) for _, page in pages) / len(pages)
+    print(f"样例: {len(pages)} 篇, 平均 {avg_size:.0f} 字符/页, 重复 {args.repeat} 次")
+
+    cleaner = markdown_cleaner.clean
+    for url, page in pages:
+        cleaner(page, url)  # 预热：编译规则
+        cleaner(page)
+    legacy_us = bench(legacy_clean, pages, args.repeat)
+    all_rules_us = bench(lambda page, url: cleaner(page), pages, args.repeat)
+    domain_us = bench(cleaner, pages, args.repeat)
+    print(f"  旧实现:                  {legacy_us:7.1f} µs/页")
+    for name, us in (("全部规则", all_rules_us), ("按域名", domain_us)):
+        print(f"  ContentCleaner {name}: {us:7.1f} µs/页  ({legacy_us / us:.1f}x)")
+
+    # 应用全部规则时应与旧实现逐字一致（模拟页面和原始样例都检查）
+    samples = [path.read_text(encoding="utf-8") for path in sorted(args.input.glob("*.md"))]
+    inputs = [page for _, page in pages] + samples
+    same = sum(legacy_clean(text) == cleaner(text) for text in inputs)
+    print(f"  输出一致（全部规则）: {same}/{len(inputs)}")
+
+    line = "账号设置 " * args.pathological
+    print(f"病态输入: {len(line)} 字符的单行")
+    for name, func in (("旧实现", legacy_clean), ("ContentCleaner", cleaner)):
+        start = time.perf_counter()
+        func(line, "https://36kr.com/p/0")
+        print(f"  {name}: {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0 if same == len(inputs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,12 @@
 import numpy as np
 import logging
-from typing import Dict, List
+import os
+from typing import Dict, List, Optional
+from utils.keyword_matcher import get_matcher
 from utils.retry import retry_with_exponential_backoff
 
+from .embedding_cache import DEFAULT_EMBEDDING_CACHE_DIR, EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -14,14 +18,44 @@ except Exception:
 class BGEClassifier:
     """BGE Embedding 智能分类器（带降级兜底）"""
 
-    def __init__(self):
+    # 低于该相似度的文章归入默认分类 "new"
+    MIN_SCORE = 0.3
+    # 单条文本截断长度
+    MAX_TEXT_CHARS = 1000
+
+    MODEL_NAME = "BAAI/bge-m3"
+
+    def __init__(self, batch_size: int = 32, embedding_cache: Optional[EmbeddingCache] = None):
+        """
+        Args:
+            batch_size: classify_many 每次送入编码器的文本数
+            embedding_cache: embedding 缓存；不传时按环境变量创建
+
+        Environment Variables:
+            EMBEDDING_CACHE_ENABLED: 设为 "0" 时不使用缓存
+            EMBEDDING_CACHE_DIR: 缓存目录（默认 .ai_cache/embeddings）
+        """
+        self.batch_size = batch_size
         self.model = None
         if SentenceTransformer is not None:
             try:
-                self.model = SentenceTransformer("BAAI/bge-m3")
+                self.model = SentenceTransformer(self.MODEL_NAME)
             except Exception as e:
                 logger.warning(f"BGE 模型加载失败: {e}")
                 self.model = None
+        self.embedding_cache = embedding_cache
+        if (
+            self.embedding_cache is None
+            and self.model is not None
+            and os.environ.get("EMBEDDING_CACHE_ENABLED", "1") != "0"
+        ):
+            try:
+                self.embedding_cache = EmbeddingCache(
+                    self.MODEL_NAME,
+                    os.environ.get("EMBEDDING_CACHE_DIR", DEFAULT_EMBEDDING_CACHE_DIR),
+                )
+            except Exception as e:
+                logger.warning(f"embedding 缓存不可用: {e}")
         # 分类模板
         self.templates = {
             "breaking": ["突发新闻", "紧急快讯", "重磅消息", "Breaking News"],
@@ -40,15 +74,61 @@ class BGEClassifier:
         }
         # 预计算 embeddings
         self.template_embs = {}
+        self._categories: List[str] = []
+        self._centroids: Optional[np.ndarray] = None
         self._precompute_embeddings()
 
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """编码文本，已缓存的直接读取，只把未见过的文本送入模型"""
+        if self.embedding_cache is None:
+            return self._encode_uncached(texts)
+
+        found = self.embedding_cache.get_many(texts)
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if i not in found:
+                missing.setdefault(text, []).append(i)
+
+        if missing:
+            new_texts = list(missing)
+            embs = self._encode_uncached(new_texts)
+            self.embedding_cache.put_many(new_texts, embs)
+            for text, emb in zip(new_texts, embs):
+                for i in missing[text]:
+                    found[i] = emb
+        return np.stack([found[i] for i in range(len(texts))]).astype(np.float32)
+
+    def _encode_uncached(self, texts: List[str]) -> np.ndarray:
+        """按 batch_size 分批编码，返回 L2 归一化后的矩阵"""
+        embs = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        return np.asarray(embs, dtype=np.float32)
+
     def _precompute_embeddings(self):
         self.template_embs = {}
+        self._categories = []
+        self._centroids = None
         if self.model is None:
             return
+        # 所有模板一次编码，再按分类求均值
+        all_texts = [t for texts in self.templates.values() for t in texts]
+        embs = self._encode(all_texts)
+        start = 0
         for cat, texts in self.templates.items():
-            embs = self.model.encode(texts)
-            self.template_embs[cat] = np.mean(embs, axis=0)
+            self.template_embs[cat] = np.mean(embs[start : start + len(texts)], axis=0)
+            start += len(texts)
+        # 分类中心堆成 (C, D) 矩阵并归一化，打分只需一次矩阵乘法
+        self._categories = list(self.template_embs)
+        centroids = np.stack([self.template_embs[cat] for cat in self._categories])
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        self._centroids = centroids / np.maximum(norms, 1e-12)
+
+    def classify(self, text: str) -> Dict[str, object]:
+        return self.classify_many([text])[0]
 
     @retry_with_exponential_backoff(
         max_retries=2,
@@ -56,31 +136,49 @@ class BGEClassifier:
         exceptions=(OSError, RuntimeError),
         on_retry=lambda e, n: logger.warning(f"BGE 分类重试 {n}: {e}"),
     )
-    def classify(self, text: str) -> Dict[str, object]:
-        if not text:
-            return {"category": "new", "tags": [], "scores": {}}
-        text = text[:1000]
-        if self.model is None:
-            return {"category": "new", "tags": [], "scores": {}}
+    def classify_many(self, texts: List[str]) -> List[Dict[str, object]]:
+        """批量分类
+
+        文本按 batch_size 分批编码，与归一化的分类中心矩阵做一次矩阵乘法
+        得到全部余弦相似度；标签用编译好的关键词自动机提取。
+
+        Args:
+            texts: 待分类文本列表
+
+        Returns:
+            与 texts 一一对应的 {"category", "tags", "scores"} 列表
+        """
+        results: List[Dict[str, object]] = [
+            {"category": "new", "tags": [], "scores": {}} for _ in texts
+        ]
+        if self.model is None or self._centroids is None:
+            return results
+
+        indices = [i for i, text in enumerate(texts) if text]
+        if not indices:
+            return results
+        batch = [texts[i][: self.MAX_TEXT_CHARS] for i in indices]
+
         try:
-            text_emb = self.model.encode([text])
-            scores: Dict[str, float] = {}
-            for cat, template_emb in self.template_embs.items():
-                sim = float(np.dot(text_emb, template_emb.T)[0])
-                scores[cat] = sim
-            category = max(scores, key=scores.get) if scores else "new"
-            if scores.get(category, 0) < 0.3:
-                category = "new"
-            tags = self._extract_tags(text)
-            return {"category": category, "tags": tags[:3], "scores": scores}
+            sims = self._encode(batch) @ self._centroids.T
         except Exception as e:
             logger.error(f"BGE 分类失败: {e}")
-            return {"category": "new", "tags": [], "scores": {}}
+            return results
+
+        matcher = get_matcher(self.tag_keywords)
+        best = sims.argmax(axis=1)
+        for row, (i, text) in enumerate(zip(indices, batch)):
+            scores = {cat: float(sims[row, col]) for col, cat in enumerate(self._categories)}
+            category = self._categories[best[row]]
+            if scores[category] < self.MIN_SCORE:
+                category = "new"
+            results[i] = {
+                "category": category,
+                "tags": list(matcher.count(text)[0])[:3],
+                "scores": scores,
+            }
+        return results
 
     def _extract_tags(self, text: str) -> List[str]:
-        text_lower = text.lower()
-        tags: List[str] = []
-        for tag, keywords in self.tag_keywords.items():
-            if any(kw.lower() in text_lower for kw in keywords):
-                tags.append(tag)
-        return tags
+        (hits,) = get_matcher(self.tag_keywords).count(text)
+        return list(hits)
@@ -0,0 +1,183 @@
+"""内容寻址的 embedding 缓存
+
+键为 sha256(模型名 + 文本)。内存中保留一个 LRU，磁盘上每个模型一个
+只追加的 float16 矩阵文件（通过 np.memmap 读取）加一个 SQLite 索引
+（键 -> 行号）。重复处理同一篇文章、或重新启动后再次计算分类模板时，
+命中缓存即可跳过编码器。
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_EMBEDDING_CACHE_DIR = ".ai_cache/embeddings"
+
+
+def embedding_key(model_name: str, text: str) -> str:
+    return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """单个模型的 embedding 缓存
+
+    线程安全；多个进程共用同一目录时，写入通过 SQLite 写锁串行化。
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: str = DEFAULT_EMBEDDING_CACHE_DIR,
+        max_memory_items: int = 4096,
+    ):
+        """
+        Args:
+            model_name: 模型名，参与键的计算并决定磁盘文件名
+            cache_dir: 缓存目录
+            max_memory_items: 内存 LRU 最多保留的向量数
+        """
+        self.model_name = model_name
+        self.max_memory_items = max_memory_items
+        slug = hashlib.sha1(model_name.encode("utf-8")).hexdigest()[:12]
+        directory = Path(cache_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        self._data_path = directory / f"{slug}.f16"
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._mmap: Optional[np.memmap] = None
+
+        # 自动提交模式，写入时用 BEGIN IMMEDIATE 串行化多个进程
+        self._conn = sqlite3.connect(
+            str(directory / f"{slug}.idx"), check_same_thread=False, isolation_level=None
+        )
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS rows (key TEXT PRIMARY KEY, row INTEGER NOT NULL);
+        """
+        )
+        self.dim: Optional[int] = self._read_dim()
+        self._rows = 0
+
+    def _read_dim(self) -> Optional[int]:
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'dim'").fetchone()
+        return int(row[0]) if row else None
+
+    def _rows_on_disk(self) -> int:
+        if self.dim is None or not self._data_path.exists():
+            return 0
+        # 向下取整：其他进程正在写入的半行不计入
+        return self._data_path.stat().st_size // (self.dim * 2)
+
+    def _matrix(self) -> Optional[np.memmap]:
+        """按需（重新）映射数据文件，使其覆盖所有已写入的行"""
+        if self.dim is None:
+            self.dim = self._read_dim()
+        self._rows = self._rows_on_disk()
+        if self._rows == 0:
+            return None
+        if self._mmap is None or self._mmap.shape[0] < self._rows:
+            self._mmap = np.memmap(
+                self._data_path, dtype=np.float16, mode="r", shape=(self._rows, self.dim)
+            )
+        return self._mmap
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def get_many(self, texts: List[str]) -> Dict[int, np.ndarray]:
+        """查询缓存
+
+        Returns:
+            {texts 中的下标: float32 向量}，只包含命中的文本
+        """
+        found: Dict[int, np.ndarray] = {}
+        with self._lock:
+            disk_lookups: Dict[str, List[int]] = {}
+            for i, text in enumerate(texts):
+                key = embedding_key(self.model_name, text)
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[i] = vector
+                else:
+                    disk_lookups.setdefault(key, []).append(i)
+
+            matrix = self._matrix()
+            if matrix is None or not disk_lookups:
+                return found
+
+            keys = list(disk_lookups)
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                for key, row in self._conn.execute(
+                    f"SELECT key, row FROM rows WHERE key IN ({placeholders})", chunk
+                ):
+                    vector = np.asarray(matrix[row], dtype=np.float32)
+                    self._remember(key, vector)
+                    for i in disk_lookups[key]:
+                        found[i] = vector
+        return found
+
+    def put_many(self, texts: List[str], vectors: np.ndarray) -> None:
+        """把新计算的向量追加到磁盘并放入内存 LRU"""
+        if len(texts) == 0:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._append(texts, vectors)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _append(self, texts: List[str], vectors: np.ndarray) -> None:
+        self.dim = self._read_dim()
+        if self.dim is None:
+            self.dim = int(vectors.shape[1])
+            self._conn.execute(
+                "INSERT INTO meta (name, value) VALUES ('dim', ?)", (str(self.dim),)
+            )
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"embedding 维度不一致: {vectors.shape[1]} != {self.dim}")
+
+        # 持有写锁时以数据文件长度为准分配行号；崩溃遗留的半行先截掉
+        base = self._rows_on_disk()
+        if self._data_path.exists() and self._data_path.stat().st_size != base * self.dim * 2:
+            with open(self._data_path, "r+b") as f:
+                f.truncate(base * self.dim * 2)
+
+        new_rows = []
+        new_vectors = []
+        pending = set()
+        for text, vector in zip(texts, vectors):
+            key = embedding_key(self.model_name, text)
+            self._remember(key, vector)
+            if key in pending:
+                continue
+            exists = self._conn.execute("SELECT 1 FROM rows WHERE key = ?", (key,)).fetchone()
+            if exists is None:
+                pending.add(key)
+                new_rows.append((key, base + len(new_rows)))
+                new_vectors.append(vector)
+
+        if new_rows:
+            # 先写数据再提交索引，索引永远不会指向未写入的行
+            with open(self._data_path, "ab") as f:
+                f.write(np.asarray(new_vectors, dtype=np.float16).tobytes())
+            self._conn.executemany("INSERT INTO rows (key, row) VALUES (?, ?)", new_rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._mmap = None
+            self._conn.close()
@@ -3,6 +3,8 @@
 用于 AI / 科技新闻文章分类
 """
 
+from utils.keyword_matcher import get_matcher, rules_version
+
 # 分类规则：category -> 关键词列表（按优先级排序）
 CATEGORY_RULES = {
     "大厂/人物": [
@@ -241,6 +243,15 @@ TAG_RULES = {
     "国际": ["美国", "欧洲", "日本", "韩国", "海外", "全球", "国际"],
 }
 
+_RULES_VERSION = rules_version(CATEGORY_RULES, TAG_RULES)
+
+
+def _match(text: str):
+    """一次扫描返回 (分类得分, 命中的标签)，自动机只编译一次"""
+    matcher = get_matcher(CATEGORY_RULES, TAG_RULES, version=_RULES_VERSION)
+    scores, tag_hits = matcher.count(text)
+    return scores, list(tag_hits)[:5]
+
 
 def classify(text: str) -> dict:
     """
@@ -258,17 +269,8 @@ def classify(text: str) -> dict:
     if not text:
         return {"category": DEFAULT_CATEGORY, "tags": []}
 
-    text_lower = text.lower()
-
-    # 计算每个分类的匹配分数
-    scores = {}
-    for category, keywords in CATEGORY_RULES.items():
-        score = 0
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                score += 1
-        if score > 0:
-            scores[category] = score
+    # 计算每个分类的匹配分数并提取标签
+    scores, tags = _match(text)
 
     # 选择得分最高的分类
     if scores:
@@ -276,17 +278,6 @@ def classify(text: str) -> dict:
     else:
         category = DEFAULT_CATEGORY
 
-    # 提取标签
-    tags = []
-    for tag, keywords in TAG_RULES.items():
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                tags.append(tag)
-                break
-
-    # 去重并限制标签数量
-    tags = list(dict.fromkeys(tags))[:5]
-
     return {"category": category, "tags": tags}
 
 
@@ -310,17 +301,8 @@ def classify_with_confidence(text: str) -> dict:
             "all_scores": {},
         }
 
-    text_lower = text.lower()
-
-    # 计算每个分类的匹配分数
-    scores = {}
-    for category, keywords in CATEGORY_RULES.items():
-        score = 0
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                score += 1
-        if score > 0:
-            scores[category] = score
+    # 计算每个分类的匹配分数并提取标签
+    scores, tags = _match(text)
 
     # 计算置信度
     if scores:
@@ -332,16 +314,6 @@ def classify_with_confidence(text: str) -> dict:
         category = DEFAULT_CATEGORY
         confidence = 0.0
 
-    # 提取标签
-    tags = []
-    for tag, keywords in TAG_RULES.items():
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                tags.append(tag)
-                break
-
-    tags = list(dict.fromkeys(tags))[:5]
-
     return {
         "category": category,
         "category_score": confidence,
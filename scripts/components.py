@@ -0,0 +1,121 @@
+"""进程级组件注册表
+
+提取器、摘要器、分类器、日报生成器等重量级组件在首次使用时才导入
+并创建，之后整个进程共享同一个实例：
+
+- ``LazyClass`` 延迟导入类所在模块，只有真正实例化时才加载
+  （例如 extract-only 模式永远不会导入 sentence_transformers）
+- ``shared(factory, *args)`` 按 (工厂, 参数) 缓存实例，多个
+  ContentProcessor、dagster solid 之间不会重复加载模型
+- ``Deferred`` 把 "首次访问属性时再创建" 的组件交给只持有引用的调用方
+"""
+
+import importlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LazyClass:
+    """按需导入的类引用，调用方式与类本身相同"""
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self._cls = None
+
+    def load(self) -> type:
+        """导入模块并返回真正的类"""
+        if self._cls is None:
+            self._cls = getattr(importlib.import_module(self.module), self.name)
+        return self._cls
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyClass({self.module}.{self.name})"
+
+
+class ComponentRegistry:
+    """线程安全的共享实例表
+
+    每个键单独加锁：加载 BGE 模型时不会阻塞其他组件的创建，
+    并发的首次访问也只会构造一次。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        self._instances: Dict[Tuple, Any] = {}
+
+    @staticmethod
+    def _key(factory: Callable, args: Tuple, kwargs: Dict[str, Hashable]) -> Tuple:
+        return (factory, args, tuple(sorted(kwargs.items())))
+
+    def get(self, factory: Callable, *args: Hashable, **kwargs: Hashable) -> Any:
+        """返回 factory(*args, **kwargs) 的共享实例，首次调用时创建
+
+        Args:
+            factory: 类、LazyClass 或任意可调用对象
+            *args, **kwargs: 构造参数，需可哈希，参与缓存键
+
+        Returns:
+            共享实例
+        """
+        key = self._key(factory, args, kwargs)
+        instance = self._instances.get(key)
+        if instance is not None:
+            return instance
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._instances:
+                self._instances[key] = factory(*args, **kwargs)
+            return self._instances[key]
+
+    def loaded(self, factory: Callable, *args: Hashable, **kwargs: Hashable) -> bool:
+        """对应实例是否已经创建"""
+        return self._key(factory, args, kwargs) in self._instances
+
+    def clear(self) -> None:
+        """丢弃所有共享实例（主要用于测试）"""
+        with self._lock:
+            self._instances.clear()
+            self._key_locks.clear()
+
+
+registry = ComponentRegistry()
+
+
+def shared(factory: Callable, *args: Hashable, **kwargs: Hashable) -> Any:
+    """从进程级注册表获取共享实例，见 ComponentRegistry.get"""
+    return registry.get(factory, *args, **kwargs)
+
+
+class Deferred:
+    """组件代理：首次访问属性时才通过 loader 创建真正的组件
+
+    可选组件（如未安装 crawl4ai）加载失败时只记录一次日志，之后代理为假值，
+    属性访问抛出 AttributeError，调用方可以像对待缺失的组件一样跳过它。
+    """
+
+    def __init__(self, loader: Callable[[], Any]):
+        self._loader = loader
+        self._error: Optional[Exception] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._error is None:
+            try:
+                return getattr(self._loader(), name)
+            except AttributeError:
+                raise
+            except Exception as e:
+                logger.warning(f"组件加载失败，已跳过: {e}")
+                self._error = e
+        raise AttributeError(f"组件不可用: {self._error}") from self._error
+
+    def __bool__(self) -> bool:
+        return self._error is None
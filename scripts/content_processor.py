@@ -8,6 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import argparse
+import threading
 import time
 import json
 import logging
@@ -16,63 +17,70 @@ import uuid
 from datetime import datetime, timezone
 from typing import List, Dict
 
-try:
-    from scripts.extractors import (
-        TrafilaturaExtractor,
-        JinaExtractor,
-        Crawl4AIExtractor,
-    )
-    from scripts.extractors.race_extractor import FastExtractor
-except Exception:
-    from scripts.extractors.trafilatura_extractor import TrafilaturaExtractor
-    from scripts.extractors.jina_extractor import JinaExtractor
-    from scripts.extractors.crawl4ai_extractor import Crawl4AIExtractor
-    from scripts.extractors.race_extractor import FastExtractor
-try:
-    from scripts.summarizers import OllamaSummarizer
-except Exception:
-    from scripts.summarizers.ollama_summarizer import OllamaSummarizer
-try:
-    from scripts.classifiers import BGEClassifier
-except Exception:
-    from scripts.classifiers.bge_classifier import BGEClassifier
-try:
-    from scripts.report_generator import ReportGenerator
-except Exception:
-    from scripts.report_generator import ReportGenerator
-
-try:
-    from utils.rate_limit import SemaphoreLimiter, RateLimiter
-except Exception:
-    # 如果限流模块不可用，提供空实现
-    class SemaphoreLimiter:
-        def __init__(self, max_concurrent):
-            pass
-
-        def __enter__(self):
-            return self
+from scripts.components import Deferred, LazyClass, shared
+from scripts.extractors.trafilatura_extractor import TrafilaturaExtractor
+from scripts.extractors.jina_extractor import JinaExtractor
+from scripts.extractors.race_extractor import FastExtractor
 
-        def __exit__(self, *args):
-            pass
+# 重量级组件延迟到首次使用时才导入：extract-only 模式不会加载
+# sentence_transformers（BGE）或 crawl4ai（除非竞速全部失败需要降级）
+Crawl4AIExtractor = LazyClass("scripts.extractors.crawl4ai_extractor", "Crawl4AIExtractor")
+OllamaSummarizer = LazyClass("scripts.summarizers.ollama_summarizer", "OllamaSummarizer")
+BGEClassifier = LazyClass("scripts.classifiers.bge_classifier", "BGEClassifier")
+ReportGenerator = LazyClass("scripts.report_generator", "ReportGenerator")
 
-    class RateLimiter:
-        def __init__(self, *args, **kwargs):
-            pass
+DEFAULT_PROCESSED_URLS_DB = ".ai_cache/processed_urls.db"
 
-        def wait_and_acquire(self):
-            return 0
+from ingestor.storage.seen_index import SeenIndex, normalize_url
+from utils.pipeline import Stage, StagedPipeline
+from utils.rate_limit import RateLimiter
 
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class _SharedComponent:
+    """ContentProcessor 的懒加载组件属性
+
+    首次访问时从进程级注册表取共享实例；工厂按名字在本模块中查找，
+    因此 patch 掉模块级的类同样生效。也可以直接赋值覆盖。
+    """
+
+    def __init__(self, factory_name: str):
+        self.factory_name = factory_name
+
+    def __set_name__(self, owner, name):
+        self.attr = "_" + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        instance = obj.__dict__.get(self.attr)
+        if instance is None:
+            instance = shared(globals()[self.factory_name])
+            obj.__dict__[self.attr] = instance
+        return instance
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.attr] = value
+
+
 class ContentProcessor:
-    """文章内容处理器（基线实现）"""
+    """文章内容处理器（基线实现）
+
+    提取器、摘要器、分类器和日报生成器在首次使用时创建，并在进程内
+    所有 ContentProcessor 之间共享。
+    """
 
-    # 类级别的限流器
-    _semaphore = SemaphoreLimiter(max_concurrent=5)
-    _rate_limiter = RateLimiter(max_calls=120, period=60.0)  # 每分钟120次请求，提高速度
+    # 类级别的分阶段限流器
+    _rate_limiter = RateLimiter(max_calls=120, period=60.0)  # 提取：每分钟120次请求
+    _summarize_rate_limiter = RateLimiter(max_calls=120, period=60.0)  # 摘要：Ollama 调用
+
+    crawl4ai = _SharedComponent("Crawl4AIExtractor")  # 批量抓取也使用这个实例
+    summarizer = _SharedComponent("OllamaSummarizer")
+    classifier = _SharedComponent("BGEClassifier")
+    report_generator = _SharedComponent("ReportGenerator")
 
     def __init__(
         self,
@@ -80,24 +88,34 @@ class ContentProcessor:
         mode: str = "full",
         d1_adapter=None,
         use_crawl4ai_batch: bool = False,
+        extract_workers: int = 5,
+        summarize_workers: int = None,
+        classify_batch_size: int = 32,
+        seen_ttl_days: float = None,
+        seen_db_path: str = None,
     ):
         self.max_articles = max_articles
         self.mode = mode
         self.d1_adapter = d1_adapter
         self.use_crawl4ai_batch = use_crawl4ai_batch  # 新增：是否使用 Crawl4AI 批量模式
-
-        trafilatura = TrafilaturaExtractor()
-        jina = JinaExtractor(api_key=os.environ.get("JINA_API_KEY", ""))
-        self.crawl4ai = Crawl4AIExtractor()  # 保存引用供批量使用
-
-        self.fast_extractor = FastExtractor(trafilatura, jina, self.crawl4ai)
+        # process_batch 各阶段的并发度
+        self.extract_workers = max(1, extract_workers)
+        # 摘要并发默认与 Ollama 服务端的并行槽位（OLLAMA_NUM_PARALLEL）一致
+        if summarize_workers is None:
+            summarize_workers = int(os.environ.get("OLLAMA_NUM_PARALLEL", "4") or 4)
+        self.summarize_workers = max(1, summarize_workers)
+        self.classify_batch_size = max(1, classify_batch_size)
+        self._stats_lock = threading.Lock()
+
+        trafilatura = shared(TrafilaturaExtractor)
+        jina = shared(JinaExtractor, api_key=os.environ.get("JINA_API_KEY", ""))
+        # Crawl4AI 只在竞速失败降级或批量模式时才创建
+        crawl4ai = Deferred(lambda: self.crawl4ai)
+
+        self.fast_extractor = FastExtractor(trafilatura, jina, crawl4ai)
         self.extractor = trafilatura
         self.fallback_extractor = jina
-        self.fallback_extractor_2 = self.crawl4ai
-
-        self.summarizer = OllamaSummarizer()
-        self.classifier = BGEClassifier()
-        self.report_generator = ReportGenerator()
+        self.fallback_extractor_2 = crawl4ai
         self.metrics = self._init_metrics()
 
         # 抓取状态记录
@@ -108,27 +126,42 @@ class ContentProcessor:
             "all_failed": 0,
             "failed_urls": [],  # 记录失败 URL 和原因
         }
-        # 记录已处理的 URL 以实现简单的幂等/去重（持久化到磁盘）
-        self._seen_path = Path(".ai_cache/processed_urls.json")
-        self._seen_path.parent.mkdir(parents=True, exist_ok=True)
-        if self._seen_path.exists():
-            try:
-                with open(self._seen_path, "r", encoding="utf-8") as f:
-                    self._seen_urls = set(json.load(f))
-            except Exception:
-                self._seen_urls = set()
-        else:
-            self._seen_urls = set()
+        # 记录已处理的 URL 以实现幂等/去重：SQLite 表，O(1) 追加与查询，
+        # 可配置过期时间（到期后允许重新处理）
+        if seen_ttl_days is None:
+            seen_ttl_days = float(os.environ.get("PROCESSED_URLS_TTL_DAYS", "0") or 0)
+        if seen_db_path is None:
+            seen_db_path = os.environ.get("PROCESSED_URLS_DB", DEFAULT_PROCESSED_URLS_DB)
+        self._seen_path = Path(seen_db_path)
+        self._seen_urls = SeenIndex(
+            self._seen_path, ttl=seen_ttl_days * 86400 if seen_ttl_days > 0 else None
+        )
+        expired = self._seen_urls.expire()
+        if expired:
+            logger.info(f"已过期的已处理 URL: {expired} 条，将允许重新处理")
+        self._import_legacy_seen(self._seen_path.with_suffix(".json"))
+
+    def _import_legacy_seen(self, legacy_path: Path) -> None:
+        """一次性导入旧版 processed_urls.json，导入后改名保留"""
+        if not legacy_path.exists() or len(self._seen_urls):
+            return
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                urls = json.load(f)
+            self._seen_urls.add_many((url, None, None) for url in urls)
+            legacy_path.rename(legacy_path.with_suffix(".json.migrated"))
+            logger.info(f"已导入 {len(urls)} 条旧版已处理 URL: {legacy_path}")
+        except Exception as e:
+            logger.warning(f"导入旧版已处理 URL 列表失败: {e}")
 
-    def _load_seen(self) -> set:
+    def _load_seen(self) -> SeenIndex:
         return self._seen_urls
 
+    def _is_seen(self, url: str) -> bool:
+        return normalize_url(url) in self._seen_urls
+
     def _save_seen(self) -> None:
-        try:
-            with open(self._seen_path, "w", encoding="utf-8") as f:
-                json.dump(list(self._seen_urls), f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.warning(f"保存已处理 URL 列表失败: {e}")
+        """已处理 URL 在 add 时即已持久化，保留此方法以兼容旧调用方"""
 
     def _init_metrics(self) -> dict:
         # Initialize metrics collection for observability
@@ -200,13 +233,53 @@ class ContentProcessor:
         except Exception as e:
             logger.warning(f"写入 metrics 失败: {e}")
 
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.extraction_stats[key] += 1
+
+    def _record_failure(self, url: str, error: str) -> None:
+        with self._stats_lock:
+            self.extraction_stats["all_failed"] += 1
+            self.extraction_stats["failed_urls"].append({"url": url, "error": error})
+
     def process_article(
         self,
         url: str,
         title: str,
         original_id: str = None,
         pre_extracted_content: str = None,
+        classify: bool = True,
+    ) -> Dict:
+        """处理单篇文章
+
+        classify=False 时跳过分类（category/tags 留空），由调用方通过
+        _classify_results 批量补齐。
+        """
+        result = self._extract_article(url, title, original_id, pre_extracted_content)
+        if result["extraction_method"] == "dry-run":
+            return result
+        self._summarize_result(result)
+
+        if self._needs_classification(result) and classify:
+            logger.info("智能分类...")
+            classification = self.classifier.classify(
+                title + " " + (result["summary"] or "")
+            )
+            result["category"] = classification.get("category", "new")
+            result["tags"] = classification.get("tags", [])
+        else:
+            result["category"] = None
+            result["tags"] = []
+        return result
+
+    def _extract_article(
+        self,
+        url: str,
+        title: str,
+        original_id: str = None,
+        pre_extracted_content: str = None,
     ) -> Dict:
+        """提取阶段：抓取正文，返回尚未摘要/分类的结果"""
         article_id = original_id if original_id else str(uuid.uuid4())
         extracted_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
@@ -216,7 +289,8 @@ class ContentProcessor:
             "title": title,
             "content": "",
             "summary": "",
-            "category": "new",
+            # 未分类的结果（失败、extract-only 等）保持 None，与 process_article 一致
+            "category": None,
             "tags": [],
             "source": self._detect_source(url),
             "extracted_at": extracted_at,
@@ -238,7 +312,7 @@ class ContentProcessor:
             content = pre_extracted_content
             extraction_method = "crawl4ai-batch"
             if content:
-                self.extraction_stats["crawl4ai_success"] += 1
+                self._count("crawl4ai_success")
                 logger.info(f"Crawl4AI 批量提取成功: {url}")
         else:
             try:
@@ -246,27 +320,21 @@ class ContentProcessor:
 
                 if content:
                     if extraction_method == "trafilatura":
-                        self.extraction_stats["trafilatura_success"] += 1
+                        self._count("trafilatura_success")
                     elif extraction_method == "jina":
-                        self.extraction_stats["jina_success"] += 1
+                        self._count("jina_success")
                     elif extraction_method == "crawl4ai":
-                        self.extraction_stats["crawl4ai_success"] += 1
+                        self._count("crawl4ai_success")
                     logger.info(f"{extraction_method} 提取成功: {url}")
                 else:
                     extraction_method = "failed"
                     extraction_error = "All extractors returned empty"
-                    self.extraction_stats["all_failed"] += 1
-                    self.extraction_stats["failed_urls"].append(
-                        {"url": url, "error": extraction_error}
-                    )
+                    self._record_failure(url, extraction_error)
                     logger.warning(f"所有提取器失败: {url}")
             except Exception as e:
                 extraction_method = "failed"
                 extraction_error = str(e)
-                self.extraction_stats["all_failed"] += 1
-                self.extraction_stats["failed_urls"].append(
-                    {"url": url, "error": extraction_error}
-                )
+                self._record_failure(url, extraction_error)
                 logger.error(f"提取异常: {url}, {e}")
 
         if not content:
@@ -283,115 +351,179 @@ class ContentProcessor:
         result["content"] = content if content == "-1" else content[:10000]
         result["extraction_method"] = extraction_method or "unknown"
         result["extraction_error"] = extraction_error
+        return result
 
-        # 根据 mode 决定是否执行后续步骤
-        if self.mode in ("full", "summarize-only") and content != "-1":
+    def _summarize_result(self, result: Dict) -> Dict:
+        """摘要阶段：根据 mode 生成摘要，dry-run 结果原样返回"""
+        if result.get("extraction_method") == "dry-run":
+            return result
+        if self.mode in ("full", "summarize-only") and result["content"] != "-1":
             logger.info("生成摘要...")
-            result["summary"] = self.summarizer.summarize(content[:3000])
+            result["summary"] = self.summarizer.summarize(result["content"][:3000])
         else:
             result["summary"] = None
+        return result
 
-        if self.mode in ("full", "classify-only") and content != "-1":
-            logger.info("智能分类...")
-            classification = self.classifier.classify(
-                title + " " + (result["summary"] or "")
-            )
+    def _needs_classification(self, result: Dict) -> bool:
+        return (
+            self.mode in ("full", "classify-only")
+            and result.get("content") not in (None, "", "-1")
+            and result.get("extraction_method") != "dry-run"
+        )
+
+    def _classify_results(self, results: List[Dict]) -> List[Dict]:
+        """对一批结果调用 classify_many，一次批量编码完成分类和打标签"""
+        pending = [r for r in results if self._needs_classification(r)]
+        if not pending:
+            return results
+        logger.info(f"批量智能分类: {len(pending)} 篇")
+        classifications = self.classifier.classify_many(
+            [r["title"] + " " + (r["summary"] or "") for r in pending]
+        )
+        for result, classification in zip(pending, classifications):
             result["category"] = classification.get("category", "new")
             result["tags"] = classification.get("tags", [])
-        else:
-            result["category"] = None
-            result["tags"] = []
+        return results
+
+    def _persist_result(self, result: Dict) -> Dict:
+        """写入阶段：回写 D1 并记录已处理 URL（单线程执行）"""
+        # 更新 D1（如果提供了 d1_adapter 且提取成功）
+        extraction_method = result.get("extraction_method", "unknown")
+        if (
+            self.d1_adapter
+            and result.get("id")
+            and result.get("content")
+            and extraction_method != "failed"
+        ):
+            self.d1_adapter.update_article_content(
+                result["id"],
+                result["content"],
+                extraction_method,
+            )
+            logger.info(f"已更新 D1 文章 content: {result['id']}")
+
+        self._seen_urls.add(normalize_url(result["url"]))
         return result
 
     def process_batch(self, articles: List[Dict]) -> tuple[List[Dict], List[Dict]]:
-        results: List[Dict] = []
+        """分阶段并发处理一批文章
+
+        提取 → 摘要 → 分类 → 写入 各自拥有线程池和有界队列，摘要慢时
+        提取阶段仍会继续抓取后面的 URL；分类按批调用 classify_many。
+        """
         errors: List[Dict] = []
-        seen = self._load_seen()
-
-        # 批量 Crawl4AI 模式：先抓取所有内容
-        pre_extracted = {}
-        if self.use_crawl4ai_batch:
-            # 收集需要处理的 URLs（排除已处理的）
-            urls_to_crawl = []
-            articles_to_process = []
-            for article in articles[: self.max_articles]:
-                url = article.get("url")
-                if not url or url in seen:
-                    continue
-                urls_to_crawl.append(url)
-                articles_to_process.append(article)
-
-            if urls_to_crawl:
-                logger.info(f"Crawl4AI 批量抓取: {len(urls_to_crawl)} URLs")
-                pre_extracted = self.crawl4ai.extract_many(
-                    urls_to_crawl,
-                    callback=lambda c, t: logger.info(f"抓取进度: {c}/{t}"),
-                )
-                logger.info(
-                    f"Crawl4AI 批量完成: {len([v for v in pre_extracted.values() if v])}/{len(urls_to_crawl)} 成功"
-                )
-
-        # 处理每篇文章
-        for i, article in enumerate(articles[: self.max_articles]):
+
+        # 筛选待处理文章
+        pending: List[Dict] = []
+        queued = set()
+        for article in articles[: self.max_articles]:
             url = article.get("url")
             if not url:
                 logger.warning(f"跳过空 URL 文章: {article.get('title', 'unknown')}")
                 continue
-            if url in seen:
+            # 同一批内重复的 URL 只处理第一篇（与逐篇处理时的已处理判断一致）
+            if url in queued or self._is_seen(url):
                 logger.info(f"跳过已处理的 URL: {url}")
                 continue
-            logger.info(f"处理 {i + 1}/{len(articles)}: {article.get('title', '')}")
-
-            # 限流：等待获取令牌
-            wait_time = self._rate_limiter.wait_and_acquire()
-            if wait_time > 0:
-                logger.debug(f"速率限制等待: {wait_time:.2f}s")
-
-            # 并发限制
-            with self._semaphore:
-                try:
-                    start = time.time()
-                    pre_content = (
-                        pre_extracted.get(url) if self.use_crawl4ai_batch else None
-                    )
-                    result = self.process_article(
-                        article["url"],
-                        article.get("title", ""),
-                        article.get("id"),
-                        pre_content,
-                    )
-                    elapsed = time.time() - start
-                    logger.info(f"处理耗时: {elapsed:.2f}s")
-                    results.append(result)
-
-                    # 立即更新 D1（如果提供了 d1_adapter 且提取成功）
-                    extraction_method = result.get("extraction_method", "unknown")
-                    if (
-                        self.d1_adapter
-                        and result.get("id")
-                        and result.get("content")
-                        and extraction_method != "failed"
-                    ):
-                        self.d1_adapter.update_article_content(
-                            result["id"],
-                            result["content"],
-                            extraction_method,
-                        )
-                        logger.info(f"已更新 D1 文章 content: {result['id']}")
-
-                    if url:
-                        seen.add(url)
-                        self._save_seen()
-                except Exception as e:
-                    logger.error(f"处理失败: {e}")
-                    errors.append(
-                        {"url": url, "error": str(e), "title": article.get("title", "")}
-                    )
+            queued.add(url)
+            pending.append(article)
+
+        total = len(pending)
+        positions = {article["url"]: i for i, article in enumerate(pending)}
+
+        def feed():
+            """按抓取完成顺序产出 (序号, 文章, 预抓取正文)
+
+            批量 Crawl4AI 模式下每抓完一个 URL 就送入流水线，摘要和写入
+            随即开始；流水线队列满时抓取也随之暂停。
+            """
+            if not (self.use_crawl4ai_batch and pending):
+                for i, article in enumerate(pending):
+                    yield i, article, None
+                return
+
+            by_url = {article["url"]: article for article in pending}
+            logger.info(f"Crawl4AI 流式抓取: {len(by_url)} URLs")
+            succeeded = 0
+            for url, content in self.crawl4ai.iter_many(
+                list(by_url),
+                callback=lambda c, t: logger.info(f"抓取进度: {c}/{t}"),
+            ):
+                article = by_url.pop(url, None)
+                if article is None:
                     continue
+                succeeded += bool(content)
+                yield positions[url], article, content
+            logger.info(f"Crawl4AI 批量完成: {succeeded}/{len(pending)} 成功")
+            # 抓取器没有返回的 URL 交给逐篇提取
+            for url, article in by_url.items():
+                yield positions[url], article, None
+
+        def extract(indexed):
+            i, article, pre_content = indexed
+            logger.info(f"处理 {i + 1}/{total}: {article.get('title', '')}")
+            start = time.time()
+            result = self._extract_article(
+                article["url"],
+                article.get("title", ""),
+                article.get("id"),
+                pre_content,
+            )
+            logger.info(f"提取耗时: {time.time() - start:.2f}s")
+            return result
+
+        def classify(results):
+            try:
+                return self._classify_results(results)
+            except Exception as e:
+                logger.error(f"批量分类失败: {e}")
+                return results
+
+        def on_error(item, stage, error):
+            # 提取阶段的条目是 (序号, 文章, 预抓取正文)，之后是结果字典
+            article = item[1] if stage == "extract" else item
+            logger.error(f"处理失败 [{stage}]: {error}")
+            errors.append(
+                {
+                    "url": article.get("url"),
+                    "error": str(error),
+                    "title": article.get("title", ""),
+                }
+            )
+
+        stages = [
+            Stage(
+                "extract",
+                extract,
+                workers=self.extract_workers,
+                queue_size=self.extract_workers * 2,
+                rate_limiter=self._rate_limiter,
+            ),
+            Stage(
+                "summarize",
+                self._summarize_result,
+                workers=self.summarize_workers,
+                queue_size=self.summarize_workers * 4,
+                rate_limiter=(
+                    self._summarize_rate_limiter
+                    if self.mode in ("full", "summarize-only")
+                    else None
+                ),
+            ),
+            Stage(
+                "classify",
+                classify,
+                queue_size=self.classify_batch_size * 2,
+                batch_size=self.classify_batch_size,
+            ),
+            Stage("persist", self._persist_result, queue_size=64),
+        ]
+        results = StagedPipeline(stages, on_error=on_error).run(feed())
+        # 流式模式下按抓取完成顺序进入流水线，这里恢复输入顺序
+        results.sort(key=lambda result: positions.get(result["url"], total))
+
         # Emit metrics for this batch execution
         self._emit_metrics()
-        if articles:
-            self._save_seen()
         return results, errors
 
     def _detect_source(self, url: str) -> str:
@@ -442,6 +574,25 @@ def main():
         action="store_true",
         help="Use Crawl4AI batch mode for extraction",
     )
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=5,
+        help="Concurrent extraction workers",
+    )
+    parser.add_argument(
+        "--summarize-workers",
+        type=int,
+        default=None,
+        help="Concurrent summarization (Ollama) requests (default: OLLAMA_NUM_PARALLEL or 4)",
+    )
+    parser.add_argument(
+        "--seen-ttl-days",
+        type=float,
+        default=None,
+        help="Reprocess URLs processed more than this many days ago "
+        "(default: PROCESSED_URLS_TTL_DAYS, 0 = never)",
+    )
     args = parser.parse_args()
 
     input_dir = Path(args.input)
@@ -522,6 +673,9 @@ def main():
         mode=args.mode,
         d1_adapter=d1_adapter,
         use_crawl4ai_batch=args.use_crawl4ai_batch,
+        extract_workers=args.extract_workers,
+        summarize_workers=args.summarize_workers,
+        seen_ttl_days=args.seen_ttl_days,
     )
     results, errors = processor.process_batch(articles)
 
@@ -545,7 +699,6 @@ def main():
     # 生成日报 (仅在全量模式或非提取模式时)
     if args.mode == "full" and results:
         try:
-            processor = ContentProcessor(max_articles=args.max_articles, mode=args.mode)
             processor.report_generator.generate(results, "ai/daily/REPORT.md")
         except Exception as e:
             logger.error(f"日报生成失败: {e}")
@@ -556,6 +709,13 @@ def main():
         f"处理完成: {len(results)} 篇文章, {len(errors)} 个处理错误, {len(write_errors)} 个写入错误"
     )
 
+    if d1_adapter is not None:
+        d1_stats = d1_adapter.query_stats()
+        logger.info(
+            f"D1 请求: {d1_stats['requests']} 次, 平均 {d1_stats['avg_ms']:.0f}ms, "
+            f"p95 {d1_stats['p95_ms']:.0f}ms, 失败 {d1_stats['errors']} 次"
+        )
+
     # 输出抓取状态统计
     if hasattr(processor, "extraction_stats"):
         stats = processor.extraction_stats
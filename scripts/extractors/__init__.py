@@ -1,3 +1,11 @@
 from .trafilatura_extractor import TrafilaturaExtractor
 from .jina_extractor import JinaExtractor
-from .crawl4ai_extractor import Crawl4AIExtractor
+
+
+def __getattr__(name):
+    # crawl4ai_extractor 在导入时注册退出/信号处理，只在真正用到时才加载
+    if name == "Crawl4AIExtractor":
+        from .crawl4ai_extractor import Crawl4AIExtractor
+
+        return Crawl4AIExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,195 @@
+"""提取结果的噪声清理引擎
+
+各站点的噪声规则（导航、登录、版权、推广语等）集中定义为规则集。
+清理时按 URL 的域名选出适用的规则集，合并成一个预编译的正则交替式，
+整个清理只需固定的几遍线性扫描：
+
+1. 块级噪声：一次 sub 删除所有命中的噪声片段
+2. 行级噪声（可选）：一次 sub 删除空行、纯图片行、过短行
+3. 合并多余空行、去掉首尾空白
+
+规则中的通配部分都限定在单行内且有长度上限，不会因为回溯退化成平方级。
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+from scripts.extractors.routing import domain_of
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """一组噪声规则
+
+    Attributes:
+        name: 规则集名
+        patterns: 正则列表，按顺序合并（较长的规则应排在其前缀规则之前）
+        domains: 适用的域名（含子域名）；为空表示适用于所有站点
+        line_tokens: 含这些词的短行视为噪声（如只剩 logo 链接的行），区分大小写
+    """
+
+    name: str
+    patterns: Tuple[str, ...]
+    domains: Tuple[str, ...] = ()
+    line_tokens: Tuple[str, ...] = ()
+
+    def applies_to(self, domain: Optional[str]) -> bool:
+        if not self.domains or domain is None:
+            return True
+        return any(domain == d or domain.endswith("." + d) for d in self.domains)
+
+
+# 单行内、有长度上限的非贪婪通配，替代 .*?
+_GAP = r"[^\n]{0,200}?"
+
+DEFAULT_RULE_SETS: Tuple[RuleSet, ...] = (
+    RuleSet(
+        "common",
+        (
+            # 登录/用户中心区域
+            rf"账号设置{_GAP}退出登录",
+            r"登录\s*搜索",
+            # 导航菜单（连续多行分类链接）
+            r"(?:\* \[?[^\]\n(]*\]?\(https?://[^)\n]+\)\s*){3,}",
+            # 常见噪声
+            rf"相关推荐{_GAP}热门文章",
+            r"更多精彩",
+        ),
+    ),
+    RuleSet(
+        "36kr",
+        (
+            r"\[?\]\(https://36kr\.com/usercenter[^)\n]*\)",
+            # logo 图片链接
+            r"!\[[^\]\n]*\]\(https?://img\.36krcdn\.com[^)\n]+\)",
+            # 版权/备案信息
+            r"京ICP证\d+号",
+            r"京ICP备\d+号",
+            r"京公网安备\d+号",
+            rf"36氪APP{_GAP}看到未来",
+            rf"鲸准{_GAP}领跑行业",
+        ),
+        domains=("36kr.com",),
+        line_tokens=("36kr", "krcdn"),
+    ),
+    RuleSet(
+        "leiphone",
+        (
+            rf"您正在使用IE低版浏览器{_GAP}(?:浏览器|体验)",
+            rf"为了您的{_GAP}账号安全",
+            r"雷锋网版权",
+            r"雷锋网",
+            r"爱搞机",
+        ),
+        domains=("leiphone.com",),
+        line_tokens=("leiphone",),
+    ),
+)
+
+# 纯文本结果（MultiMethodExtractor）额外去掉转载声明
+TEXT_RULE_SETS: Tuple[RuleSet, ...] = DEFAULT_RULE_SETS + (
+    RuleSet(
+        "reprint",
+        (
+            rf"未经授权{_GAP}转载",
+            rf"详情见{_GAP}转载须知",
+        ),
+    ),
+)
+
+# 行级噪声：空白行、纯图片行、去掉首尾空白后不足 5 个字符的行
+_LINE_PATTERNS = (
+    r"[^\S\n]*!\[[^\]\n]*\]\([^\n]+\)[^\S\n]*",
+    r"[^\S\n]*(?:\S[^\n]{0,3}?)?[^\S\n]*",
+)
+_SHORT_LINE_LIMIT = 15  # 含站点标记词的行短于此长度视为噪声
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+class ContentCleaner:
+    """按域名选择规则集的噪声清理器（线程安全）
+
+    每种规则集组合只编译一次，之后按域名缓存。
+    """
+
+    def __init__(
+        self, rule_sets: Iterable[RuleSet] = DEFAULT_RULE_SETS, filter_lines: bool = True
+    ):
+        """
+        Args:
+            rule_sets: 噪声规则集
+            filter_lines: 是否删除空行、纯图片行和过短的行（适用于 Markdown 输出）
+        """
+        self.rule_sets = tuple(rule_sets)
+        self.filter_lines = filter_lines
+        self._lock = threading.Lock()
+        self._compiled: Dict[FrozenSet[str], Tuple[Optional[Pattern], Optional[Pattern]]] = {}
+        self._by_domain: Dict[Optional[str], Tuple[Optional[Pattern], Optional[Pattern]]] = {}
+
+    def select(self, url: Optional[str] = None) -> List[RuleSet]:
+        """适用于该 URL 的规则集；url 为空时返回全部规则集"""
+        domain = domain_of(url) if url else None
+        return [rules for rules in self.rule_sets if rules.applies_to(domain)]
+
+    def _compile(self, rule_sets: List[RuleSet]) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+        patterns = [p for rules in rule_sets for p in rules.patterns]
+        blocks = (
+            re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE | re.MULTILINE)
+            if patterns
+            else None
+        )
+        lines = None
+        if self.filter_lines:
+            line_patterns = list(_LINE_PATTERNS)
+            tokens = [re.escape(t) for rules in rule_sets for t in rules.line_tokens]
+            if tokens:
+                # 去掉首尾空白后短于 _SHORT_LINE_LIMIT 且含标记词（标记词区分大小写）
+                line_patterns.append(
+                    rf"[^\S\n]*(?=\S[^\n]{{0,{_SHORT_LINE_LIMIT - 2}}}?[^\S\n]*$)"
+                    rf"[^\n]*?(?-i:{'|'.join(tokens)})[^\n]*"
+                )
+            alternation = "|".join(f"(?:{p})" for p in line_patterns)
+            lines = re.compile(rf"^(?:{alternation})$\n?", re.IGNORECASE | re.MULTILINE)
+        return blocks, lines
+
+    def _patterns(self, url: Optional[str]) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+        domain = domain_of(url) if url else None
+        compiled = self._by_domain.get(domain)
+        if compiled is not None:
+            return compiled
+        rule_sets = self.select(url)
+        key = frozenset(rules.name for rules in rule_sets)
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is None:
+                compiled = self._compiled[key] = self._compile(rule_sets)
+            self._by_domain[domain] = compiled
+        return compiled
+
+    def clean(self, text: str, url: Optional[str] = None) -> str:
+        """
+        清理文本中的噪声
+
+        Args:
+            text: 提取结果
+            url: 来源 URL，用于选择站点规则；为空时应用全部规则
+
+        Returns:
+            清理后的文本
+        """
+        if not text:
+            return text
+        blocks, lines = self._patterns(url)
+        if blocks is not None:
+            text = blocks.sub("", text)
+        if lines is not None:
+            text = lines.sub("", text)
+        else:
+            text = _BLANK_LINES.sub("\n\n", text)
+        return text.strip()
+
+
+markdown_cleaner = ContentCleaner(filter_lines=True)
+text_cleaner = ContentCleaner(TEXT_RULE_SETS, filter_lines=False)
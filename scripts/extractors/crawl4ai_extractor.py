@@ -6,154 +6,54 @@ import logging
 import os
 import signal
 import sys
-from typing import Optional, List, Dict
+import threading
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from scripts.extractors.content_cleaner import markdown_cleaner
+from scripts.extractors.page_cache import cached_text, get_page_cache
 
 logger = logging.getLogger(__name__)
 
 
-def clean_content(text: str) -> str:
+def clean_content(text: str, url: Optional[str] = None) -> str:
     """
-    清理提取内容中的噪声（导航、登录、页脚等）
+    清理提取内容中的噪声（导航、登录、页脚、图片行、过短的行等）
 
-    使用策略：
-    1. 移除固定噪声模式（导航、登录、页脚等）
-    2. 移除短链接行
-    3. 尝试识别并提取文章主体
+    Args:
+        text: Crawl4AI 输出的 Markdown
+        url: 来源 URL，用于选择站点规则；为空时应用全部规则
     """
-    import re
-
-    if not text:
-        return text
-
-    # 1. 移除大块噪声模式
-    noise_blocks = [
-        # 登录/用户中心区域
-        r"\[?\]\(https://36kr\.com/usercenter[^\)]*\)",
-        r"账号设置.*?退出登录",
-        r"登录\s*搜索",
-        # 导航菜单（连续多行分类链接）
-        r"(\* \[?[^\]]*\]?\(https?://[^\)]+\)\s*){3,}",
-        # logo 图片链接
-        r"!\[.*?\]\(https?://img\.36krcdn\.com[^\)]+\)",
-        # 版权/备案信息
-        r"京ICP证\d+号.*?",
-        r"京ICP备\d+号.*?",
-        r"京公网安备\d+号",
-        r"36氪APP.*?看到未来",
-        r"鲸准.*?领跑行业",
-        # 雷锋网噪声
-        r"您正在使用IE低版浏览器.*?(?:浏览器|体验)",
-        r"为了您的.*?账号安全",
-        # 爱搞机
-        r"爱搞机",
-        r"雷锋网",
-        # 常见噪声
-        r"相关推荐.*?热门文章",
-        r"更多精彩.*?",
-    ]
-
-    for pattern in noise_blocks:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.MULTILINE)
-
-    # 2. 移除单行噪声
-    lines = text.split("\n")
-    cleaned_lines = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        # 跳过纯图片行
-        if re.match(r"^!\[.*?\]\(.+\)$", stripped):
-            continue
-        # 跳过只有图片链接的行（很短）
-        if len(stripped) < 15 and (
-            "36kr" in stripped or "leiphone" in stripped or "krcdn" in stripped
-        ):
-            continue
-        # 跳过非常短的行
-        if len(stripped) < 5:
-            continue
-        cleaned_lines.append(line)
-
-    text = "\n".join(cleaned_lines)
-
-    # 3. 移除多余空行
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = text.strip()
-
-    return text
-
-    # 移除常见的导航/菜单噪声
-    noise_patterns = [
-        # 登录/注册提示
-        r"您正在使用IE低版浏览器.*?建议使用.*?浏览器",
-        r"为了您的.*?账号安全.*?更好的产品体验",
-        r"立即登录|免费注册|登录注册",
-        r"\[!\[\]\(https?://[^\]]+\)\]\([^)]+\)",  # 图片链接（通常是logo）
-        # 导航栏
-        r"\* \[.*?\]\(https?://[^)]+\)\s*\* \[",  # 导航链接
-        # 版权/页脚
-        r"版权所有.*?\d{4}",
-        r"copyright.*?\d{4}",
-        r"沪ICP备\d+号",
-        r"京ICP备\d+号",
-        # 社交分享
-        r"分享到.*?微博.*?微信",
-        r"扫码.*?关注",
-        # 相关推荐（通常在文章底部）
-        r"相关推荐.*?热门文章",
-        r"更多.*?阅读",
-        r"上一篇.*?下一篇",
-        # 广告
-        r"广告",
-        r" Sponsored ",
-        # 常见噪声词
-        r"爱搞机",
-        r"雷峰网",
-        r"机器之心",
-        r"36kr",
-    ]
-
-    for pattern in noise_patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.DOTALL)
-
-    # 移除空行和多余空白
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r" {2,}", " ", text)
-
-    # 移除单行噪声（如短链接列表）
-    lines = text.split("\n")
-    cleaned_lines = []
-    for line in lines:
-        # 跳过太短的行（通常是按钮/链接）
-        if len(line.strip()) < 10:
-            continue
-        # 跳过纯链接行
-        if re.match(r"^!?\[.*?\]\(https?://", line):
-            continue
-        cleaned_lines.append(line)
-
-    text = "\n".join(cleaned_lines)
-
-    # 移除首尾空白
-    text = text.strip()
-
-    return text
+    return markdown_cleaner.clean(text, url)
 
 
 # 全局爬虫实例（类级别复用）
 _crawler = None
 _crawler_config = None
 _event_loop = None
+_loop_thread = None
+_loop_lock = threading.Lock()
 
 
 def _get_event_loop():
-    """获取或创建事件循环，避免重复创建"""
-    global _event_loop
-    if _event_loop is None or _event_loop.is_closed():
-        _event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(_event_loop)
-    return _event_loop
+    """获取后台事件循环（在独立线程中运行），避免重复创建
+
+    所有 Crawl4AI 协程都提交到这个循环执行，因此可以在任意线程
+    （包括 process_batch 的多个提取线程）中同时调用。
+    """
+    global _event_loop, _loop_thread
+    with _loop_lock:
+        if _event_loop is None or _event_loop.is_closed():
+            _event_loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_event_loop.run_forever, name="crawl4ai-loop", daemon=True
+            )
+            _loop_thread.start()
+        return _event_loop
+
+
+def _run(coro, timeout: float = None):
+    """在后台事件循环中执行协程并等待结果"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result(timeout)
 
 
 async def _close_crawler_async():
@@ -169,20 +69,24 @@ async def _close_crawler_async():
 
 def _cleanup():
     """清理资源"""
-    global _event_loop, _crawler
-
-    # 先尝试关闭爬虫
-    if _crawler is not None and _event_loop is not None and not _event_loop.is_closed():
-        try:
-            _event_loop.run_until_complete(_close_crawler_async())
-        except Exception:
-            pass
-
-    # 再关闭事件循环
-    if _event_loop is not None and not _event_loop.is_closed():
-        _event_loop.close()
+    global _event_loop, _crawler, _loop_thread
+
+    loop = _event_loop
+    if loop is not None and not loop.is_closed():
+        # 先尝试关闭爬虫，再停止并关闭事件循环
+        if _crawler is not None:
+            try:
+                _run(_close_crawler_async(), timeout=10)
+            except Exception:
+                pass
+        loop.call_soon_threadsafe(loop.stop)
+        if _loop_thread is not None:
+            _loop_thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
 
     _event_loop = None
+    _loop_thread = None
     _crawler = None
 
 
@@ -192,9 +96,24 @@ def _signal_handler(signum, frame):
     sys.exit(0)
 
 
-atexit.register(_cleanup)
-signal.signal(signal.SIGINT, _signal_handler)
-signal.signal(signal.SIGTERM, _signal_handler)
+_cleanup_registered = False
+
+
+def _register_cleanup():
+    """注册退出清理（只执行一次）
+
+    本模块可能在 process_batch 的提取线程中首次导入/初始化，
+    而 signal.signal 只能在主线程调用，因此其他线程只注册 atexit。
+    """
+    global _cleanup_registered
+    with _loop_lock:
+        if _cleanup_registered:
+            return
+        _cleanup_registered = True
+    atexit.register(_cleanup)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGINT, _signal_handler)
+        signal.signal(signal.SIGTERM, _signal_handler)
 
 
 def _init_crawler():
@@ -204,6 +123,7 @@ def _init_crawler():
     if _crawler is not None:
         return _crawler
 
+    _register_cleanup()
     try:
         from crawl4ai import (
             AsyncWebCrawler,
@@ -245,6 +165,8 @@ def _init_crawler():
         _crawler_config = {
             "browser": browser_config,
             "crawl": crawl_config,
+            # 流式：arun_many 每完成一个 URL 就产出结果
+            "crawl_stream": crawl_config.clone(stream=True),
             "dispatcher": dispatcher,
         }
 
@@ -264,12 +186,11 @@ class Crawl4AIExtractor:
         self.max_concurrent = max_concurrent
         self._crawler = None
 
+    @cached_text("crawl4ai")
     def extract(self, url: str) -> Optional[str]:
         """单 URL 提取（同步接口，保持兼容）"""
         try:
-            loop = _get_event_loop()
-            result = loop.run_until_complete(self._extract_async(url))
-            return result
+            return _run(self._extract_async(url))
         except Exception as e:
             logger.error(f"Crawl4AI 提取失败 {url}: {e}")
             return None
@@ -288,18 +209,98 @@ class Crawl4AIExtractor:
         Returns:
             {url: content} 字典，失败为 None
         """
+        return dict(self.iter_many(urls, callback, progress_interval))
+
+    def iter_many(
+        self, urls: List[str], callback=None, progress_interval: int = 10
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        流式批量提取：每个 URL 抓取完成即产出 (url, content)
+
+        已缓存的 URL 最先产出；之后按完成顺序产出，内存占用只与正在抓取
+        的 URL 数量有关。调用方处理慢时抓取会随之暂停。
+
+        Args:
+            urls: URL 列表
+            callback: 进度回调函数 callback(completed, total)
+            progress_interval: 进度报告间隔
+
+        Yields:
+            (url, content)，失败时 content 为 None；每个 URL 恰好产出一次
+        """
         if not urls:
-            return {}
+            return
+
+        total = len(urls)
+        completed = 0
+        pending = []
+
+        # 已缓存的 URL 不再抓取
+        cache = get_page_cache()
+        for url in urls:
+            text = cache.get_text(url, "crawl4ai") if cache is not None else None
+            if text is None:
+                pending.append(url)
+                continue
+            completed += 1
+            yield url, text
+        if completed:
+            logger.info(f"Crawl4AI 缓存命中: {completed}/{total}")
 
+        remaining = set(pending)
+        stream = self._iter_many_async(pending)
         try:
-            loop = _get_event_loop()
-            results = loop.run_until_complete(
-                self._extract_many_async(urls, callback, progress_interval)
-            )
-            return results
+            while remaining:
+                try:
+                    url, text = _run(stream.__anext__())
+                except StopAsyncIteration:
+                    break
+                if url not in remaining:
+                    continue
+                remaining.discard(url)
+                if text and cache is not None:
+                    cache.put_text(url, "crawl4ai", text)
+                completed += 1
+                if callback and completed % progress_interval == 0:
+                    callback(completed, total)
+                yield url, text
         except Exception as e:
             logger.error(f"Crawl4AI 批量提取失败: {e}")
-            return {url: None for url in urls}
+        finally:
+            try:
+                _run(stream.aclose(), timeout=10)
+            except Exception:
+                pass
+
+        # 没有结果的 URL（抓取异常或中途失败）按失败产出
+        for url in pending:
+            if url in remaining:
+                yield url, None
+
+        if callback:
+            callback(total, total)
+
+    def _result_text(self, result) -> Optional[str]:
+        """从 CrawlResult 中取清理后的正文，不合格返回 None"""
+        if not result.success:
+            error = result.error if hasattr(result, "error") else "Unknown"
+            logger.debug(f"Failed: {result.url} - {error}")
+            return None
+
+        # 优先使用过滤后的内容
+        text = None
+        if hasattr(result, "fit_markdown") and result.fit_markdown:
+            text = result.fit_markdown.strip()
+        elif hasattr(result, "markdown") and result.markdown:
+            text = result.markdown.strip()
+
+        if text and len(text) > 100:
+            # 后处理清理噪声
+            text = clean_content(text, result.url)
+            if len(text) > 50:  # 清理后仍需保留足够内容
+                return text
+            logger.warning(f"清理后内容过短: {result.url}")
+        return None
 
     async def _extract_async(self, url: str) -> Optional[str]:
         """异步单 URL 提取"""
@@ -311,20 +312,10 @@ class Crawl4AIExtractor:
             config = _crawler_config
             result = await crawler.arun(url, config=config["crawl"])
 
-            if result.success:
-                # 优先使用过滤后的内容
-                text = None
-                if hasattr(result, "fit_markdown") and result.fit_markdown:
-                    text = result.fit_markdown.strip()
-                elif hasattr(result, "markdown") and result.markdown:
-                    text = result.markdown.strip()
-
-                if text and len(text) > 100:
-                    # 后处理清理噪声
-                    text = clean_content(text)
-                    if len(text) > 50:  # 清理后仍需保留足够内容
-                        logger.info(f"Crawl4AI 成功: {url}, {len(text)} chars")
-                        return text
+            text = self._result_text(result)
+            if text:
+                logger.info(f"Crawl4AI 成功: {url}, {len(text)} chars")
+                return text
 
             error_msg = result.error if hasattr(result, "error") else "Unknown"
             logger.warning(f"Crawl4AI 返回为空: {url} - {error_msg}")
@@ -334,67 +325,50 @@ class Crawl4AIExtractor:
             logger.error(f"Crawl4AI 异常: {url} - {e}")
             return None
 
-    async def _extract_many_async(
-        self, urls: List[str], callback=None, progress_interval: int = 10
-    ) -> Dict[str, Optional[str]]:
-        """异步批量提取"""
+    async def _iter_many_async(self, urls: List[str]) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """异步流式批量提取，按完成顺序产出 (url, content)"""
+        if not urls:
+            return
         crawler = _init_crawler()
         if crawler is None:
-            return {url: None for url in urls}
+            for url in urls:
+                yield url, None
+            return
 
         config = _crawler_config
-        results_dict = {}
-        completed = 0
-        total = len(urls)
-
-        logger.info(f"Crawl4AI 开始批量抓取: {total} URLs, 并发={self.max_concurrent}")
+        logger.info(f"Crawl4AI 开始流式抓取: {len(urls)} URLs, 并发={self.max_concurrent}")
+        success_count = 0
 
         result_container = await crawler.arun_many(
-            urls=urls, config=config["crawl"], dispatcher=config["dispatcher"]
+            urls=urls, config=config["crawl_stream"], dispatcher=config["dispatcher"]
         )
-
         if isinstance(result_container, list):
-            results_list = result_container
+            # 不支持流式的旧版本：一次性返回全部结果
+            for result in result_container:
+                text = self._result_text(result)
+                success_count += bool(text)
+                yield result.url, text
         else:
-            results_list = []
-            async for res in result_container:
-                results_list.append(res)
-
-        for result in results_list:
-            url = result.url
-            completed += 1
+            async for result in result_container:
+                text = self._result_text(result)
+                success_count += bool(text)
+                yield result.url, text
 
-            if result.success:
-                # 优先使用过滤后的内容
-                text = None
-                if hasattr(result, "fit_markdown") and result.fit_markdown:
-                    text = result.fit_markdown.strip()
-                elif hasattr(result, "markdown") and result.markdown:
-                    text = result.markdown.strip()
-
-                if text and len(text) > 100:
-                    # 后处理清理噪声
-                    text = clean_content(text)
-                    if len(text) > 50:
-                        results_dict[url] = text
-                        logger.debug(f"OK: {url}")
-                    else:
-                        results_dict[url] = None
-                        logger.warning(f"清理后内容过短: {url}")
-            else:
-                results_dict[url] = None
-                error = result.error if hasattr(result, "error") else "Unknown"
-                logger.debug(f"Failed: {url} - {error}")
+        logger.info(f"Crawl4AI 批量完成: {success_count}/{len(urls)} 成功")
 
+    async def _extract_many_async(
+        self, urls: List[str], callback=None, progress_interval: int = 10
+    ) -> Dict[str, Optional[str]]:
+        """异步批量提取"""
+        results_dict = {url: None for url in urls}
+        completed = 0
+        async for url, text in self._iter_many_async(urls):
+            results_dict[url] = text
+            completed += 1
             if callback and completed % progress_interval == 0:
-                callback(completed, total)
-
+                callback(completed, len(urls))
         if callback:
-            callback(total, total)
-
-        success_count = sum(1 for v in results_dict.values() if v)
-        logger.info(f"Crawl4AI 批量完成: {success_count}/{total} 成功")
-
+            callback(len(urls), len(urls))
         return results_dict
 
 
@@ -1,12 +1,33 @@
 import requests
+import asyncio
 import logging
 import os
-from typing import Optional
+from typing import Callable, Optional
+from weakref import WeakKeyDictionary
 
+try:
+    import httpx
+except ImportError:  # 可选依赖：没有 httpx 时 extract_async 退回线程池
+    httpx = None
+
+from scripts.extractors.page_cache import cached_text
 from utils.retry import retry_with_exponential_backoff
 
 logger = logging.getLogger(__name__)
 
+# 每个事件循环一个 httpx.AsyncClient（连接不能跨循环使用）
+_async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_async_client() -> "httpx.AsyncClient":
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient()
+    return client
+
 
 class JinaExtractor:
     ERROR_KEYWORDS = [
@@ -70,59 +91,77 @@ class JinaExtractor:
                 return str(data[key])
         return str(data)
 
-    def extract(self, url: str) -> Optional[str]:
-        try:
-            timeout = int(os.environ.get("JINA_TIMEOUT", "15"))
-            endpoint = self._get_endpoint(url)
-            headers = self._get_headers()
+    @staticmethod
+    def _timeout() -> int:
+        return int(os.environ.get("JINA_TIMEOUT", "15"))
+
+    def _parse_response(
+        self,
+        url: str,
+        status_code: int,
+        content_type: str,
+        body: str,
+        load_json: Callable[[], dict],
+    ) -> Optional[str]:
+        """从 Jina 响应中取出正文，错误或内容过短时返回 None"""
+        if status_code != 200:
+            logger.warning(f"Jina API 返回非 200: url={url}, status={status_code}")
+            return None
 
-            response = requests.get(endpoint, headers=headers, timeout=timeout)
+        text = ""
 
-            if response.status_code != 200:
-                logger.warning(f"Jina API 返回非 200: url={url}, status={response.status_code}")
-                return None
+        if "application/json" in content_type:
+            try:
+                data = load_json()
 
-            content_type = response.headers.get("content-type", "")
-            text = ""
-
-            if "application/json" in content_type:
-                try:
-                    data = response.json()
-
-                    if self._is_error_response(data):
-                        error_msg = self._extract_error_message(data)
-                        logger.error(f"Jina API 返回错误: url={url}, error={error_msg}")
-                        return None
-
-                    if "data" in data:
-                        data_val = data["data"]
-                        if isinstance(data_val, dict):
-                            text = data_val.get("content", "") or data_val.get("markdown", "")
-                        elif isinstance(data_val, str):
-                            text = data_val
-
-                    if not text:
-                        logger.warning(f"Jina 响应无有效内容: url={url}")
-                        return None
-
-                except Exception as e:
-                    logger.warning(f"Jina JSON 解析失败: url={url}, error={e}")
-                    text = response.text
-            else:
-                text = response.text
-
-            if text and len(text) < 500:
-                text_lower = text.lower()
-                if any(kw in text_lower for kw in self.ERROR_KEYWORDS):
-                    logger.warning(f"Jina 返回内容包含错误: url={url}")
+                if self._is_error_response(data):
+                    error_msg = self._extract_error_message(data)
+                    logger.error(f"Jina API 返回错误: url={url}, error={error_msg}")
                     return None
 
-            if text and len(text) > 100:
-                logger.info(f"Jina 提取成功: url={url}, length={len(text)}")
-                return text.strip()
+                if "data" in data:
+                    data_val = data["data"]
+                    if isinstance(data_val, dict):
+                        text = data_val.get("content", "") or data_val.get("markdown", "")
+                    elif isinstance(data_val, str):
+                        text = data_val
 
-            logger.warning(f"Jina 返回内容过短: url={url}")
-            return None
+                if not text:
+                    logger.warning(f"Jina 响应无有效内容: url={url}")
+                    return None
+
+            except Exception as e:
+                logger.warning(f"Jina JSON 解析失败: url={url}, error={e}")
+                text = body
+        else:
+            text = body
+
+        if text and len(text) < 500:
+            text_lower = text.lower()
+            if any(kw in text_lower for kw in self.ERROR_KEYWORDS):
+                logger.warning(f"Jina 返回内容包含错误: url={url}")
+                return None
+
+        if text and len(text) > 100:
+            logger.info(f"Jina 提取成功: url={url}, length={len(text)}")
+            return text.strip()
+
+        logger.warning(f"Jina 返回内容过短: url={url}")
+        return None
+
+    @cached_text("jina")
+    def extract(self, url: str) -> Optional[str]:
+        try:
+            response = requests.get(
+                self._get_endpoint(url), headers=self._get_headers(), timeout=self._timeout()
+            )
+            return self._parse_response(
+                url,
+                response.status_code,
+                response.headers.get("content-type", ""),
+                response.text,
+                response.json,
+            )
 
         except requests.exceptions.Timeout:
             logger.error(f"Jina 超时: {url}")
@@ -133,3 +172,36 @@ class JinaExtractor:
         except Exception as e:
             logger.error(f"Jina 提取失败: {url}, error={e}")
             return None
+
+    @cached_text("jina")
+    async def extract_async(self, url: str) -> Optional[str]:
+        """extract 的协程版本，可被取消（竞速输掉时请求随即中断）
+
+        没有安装 httpx 时在线程池中执行 extract，此时无法中断。
+        """
+        if httpx is None:
+            return await asyncio.get_running_loop().run_in_executor(None, self.extract, url)
+        try:
+            response = await _get_async_client().get(
+                self._get_endpoint(url),
+                headers=self._get_headers(),
+                timeout=self._timeout(),
+                follow_redirects=True,
+            )
+            return self._parse_response(
+                url,
+                response.status_code,
+                response.headers.get("content-type", ""),
+                response.text,
+                response.json,
+            )
+
+        except httpx.TimeoutException:
+            logger.error(f"Jina 超时: {url}")
+            return None
+        except httpx.HTTPError as e:
+            logger.error(f"Jina 请求失败: {url}, error={e}")
+            return None
+        except Exception as e:
+            logger.error(f"Jina 提取失败: {url}, error={e}")
+            return None
@@ -10,35 +10,21 @@
 import logging
 import os
 import re
+import time
 from typing import Optional, List, Dict, Any
 from urllib.parse import urlparse
 
-logger = logging.getLogger(__name__)
-
-
-def clean_content(text: str) -> str:
-    """清理提取内容中的残留噪声"""
-    if not text:
-        return text
-
-    # 移除常见噪声模式
-    noise_patterns = [
-        r"您正在使用IE低版浏览器.*?(?:浏览器|体验)",
-        r"为了您的.*?账号安全",
-        r"未经授权.*?转载",
-        r"详情见.*?转载须知",
-        r"雷锋网版权",
-        r"爱搞机",
-    ]
+from scripts.components import shared
+from scripts.extractors.content_cleaner import text_cleaner
+from scripts.extractors.page_cache import fetch_html, get_page_cache
+from scripts.extractors.routing import ExtractorRouter
 
-    for pattern in noise_patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+logger = logging.getLogger(__name__)
 
-    # 清理多余空白
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = text.strip()
 
-    return text
+def clean_content(text: str, url: Optional[str] = None) -> str:
+    """清理提取内容中的残留噪声（按 url 的域名选择站点规则）"""
+    return text_cleaner.clean(text, url)
 
 
 class MultiMethodExtractor:
@@ -47,7 +33,7 @@ class MultiMethodExtractor:
     # 支持的方法
     METHODS = ["trafilatura", "newspaper", "jina", "beautifulsoup"]
 
-    # 中文科技媒体域名（优先使用特定方法）
+    # 中文科技媒体域名的初始首选方法；积累数据后以 ExtractorRouter 的路由表为准
     PRIORITY_DOMAINS = {
         "36kr.com": "jina",  # 36kr 反爬强，用 Jina
         "leiphone.com": "trafilatura",  # 雷峰网用 Trafilatura
@@ -56,8 +42,9 @@ class MultiMethodExtractor:
         "ithome.com": "trafilatura",  # IT之家
     }
 
-    def __init__(self, use_proxy: bool = False):
+    def __init__(self, use_proxy: bool = False, router: ExtractorRouter = None):
         self.use_proxy = use_proxy
+        self.router = router if router is not None else shared(ExtractorRouter)
         self._trafilatura = None
         self._newspaper = None
         self._jina = None
@@ -110,7 +97,7 @@ class MultiMethodExtractor:
         if not self._trafilatura:
             return None
         try:
-            html = self._trafilatura.fetch_url(url)
+            html = fetch_html(url, lambda: self._trafilatura.fetch_url(url))
             if not html:
                 return None
             # 注意：output_format 应该是 "txt" 不是 "text"
@@ -134,7 +121,14 @@ class MultiMethodExtractor:
             return None
         try:
             article = self._newspaper(url)
-            article.download()
+            cache = get_page_cache()
+            html = cache.get_html(url) if cache is not None else None
+            if html:
+                article.download(input_html=html)
+            else:
+                article.download()
+                if cache is not None and article.html:
+                    cache.put_html(url, article.html)
             article.parse()
             text = article.text
             if text and len(text) > 100:
@@ -160,7 +154,7 @@ class MultiMethodExtractor:
             from bs4 import BeautifulSoup
             import trafilatura
 
-            html = trafilatura.fetch_url(url)
+            html = fetch_html(url, lambda: trafilatura.fetch_url(url))
             if not html:
                 return None
 
@@ -184,8 +178,6 @@ class MultiMethodExtractor:
                 text = soup.get_text(separator="\n", strip=True)
 
             # 清理多余空白
-            import re
-
             text = re.sub(r"\n{3,}", "\n\n", text)
             text = text.strip()
 
@@ -212,13 +204,15 @@ class MultiMethodExtractor:
         # 确定要尝试的方法顺序
         if methods is None:
             priority = self._get_priority_method(url)
-            # 优先方法放前面，其他按默认顺序
+            # 优先方法放前面，其他按默认顺序；有历史数据时按路由表重排
             methods = [priority] + [m for m in self.METHODS if m != priority]
+            methods = self.router.order(url, methods)
 
         logger.info(f"MultiMethodExtractor 开始提取: {url}, 方法顺序: {methods}")
 
         for method in methods:
             result = None
+            start = time.monotonic()
 
             if method == "trafilatura":
                 result = self._extract_trafilatura(url)
@@ -229,9 +223,11 @@ class MultiMethodExtractor:
             elif method == "beautifulsoup":
                 result = self._extract_beautifulsoup(url)
 
-            if result and len(result) > 100:
+            valid = result if result and len(result) > 100 else None
+            self.router.record(url, method, valid, time.monotonic() - start)
+            if valid:
                 # 后处理清理残留噪声
-                result = clean_content(result)
+                result = clean_content(result, url)
                 if len(result) > 50:
                     logger.info(f"提取成功: {url}, 方法={method}, 长度={len(result)}")
                     return result
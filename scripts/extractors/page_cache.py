@@ -0,0 +1,323 @@
+"""内容寻址的网页磁盘缓存
+
+提取链路中 Trafilatura、Bypass、BeautifulSoup 下载的是同一个页面，
+重跑或降级时又会重复下载。这里把两类数据存到磁盘：
+
+- 原始 HTML：按抓取的 URL 索引（fetch_html）
+- 提取结果：按 (URL, 提取器) 索引（cached_text 装饰器），Jina 等付费
+  接口重跑时不再消耗配额
+
+正文按内容哈希（sha256）以 zlib 压缩存放，相同内容只存一份；SQLite 索引
+记录每个条目的写入和访问时间，过期（TTL）视为未命中，总大小超过上限时
+按最近最少使用淘汰。
+"""
+
+import contextlib
+import contextvars
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_CACHE_DIR = ".ai_cache/pages"
+
+
+def _is_valid(value: Optional[str]) -> bool:
+    return bool(value) and value != "-1"
+
+
+class PageCache:
+    """压缩、带 TTL 和容量上限的网页缓存（线程安全）"""
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_PAGE_CACHE_DIR,
+        ttl: float = 24 * 3600,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        Args:
+            directory: 缓存目录
+            ttl: 条目有效期（秒）
+            max_bytes: 压缩后正文的总大小上限
+        """
+        self.directory = Path(directory)
+        self.blob_dir = self.directory / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.directory / "index.db"), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at);
+            CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries (digest);
+        """
+        )
+        self._conn.commit()
+        self.total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM entries)"
+        ).fetchone()[0]
+
+    @staticmethod
+    def _key(url: str, kind: str) -> str:
+        return hashlib.sha256(f"{kind}\0{url}".encode("utf-8")).hexdigest()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / f"{digest}.z"
+
+    def get(self, url: str, kind: str) -> Optional[str]:
+        """读取缓存条目，未命中或已过期返回 None"""
+        key = self._key(url, kind)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            digest, stored_at = row
+            if now - stored_at > self.ttl:
+                self._delete_locked(key, digest)
+                self._conn.commit()
+                return None
+            try:
+                data = zlib.decompress(self._blob_path(digest).read_bytes())
+            except (OSError, zlib.error):
+                # 正文文件丢失或损坏：丢弃索引条目
+                self._delete_locked(key, digest)
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return data.decode("utf-8")
+
+    def put(self, url: str, kind: str, value: str) -> None:
+        """写入缓存条目，必要时按 LRU 淘汰"""
+        if not _is_valid(value):
+            return
+        raw = value.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        key = self._key(url, kind)
+        now = time.time()
+        with self._lock:
+            path = self._blob_path(digest)
+            shared = self._conn.execute(
+                "SELECT size FROM entries WHERE digest = ? LIMIT 1", (digest,)
+            ).fetchone()
+            if shared is None or not path.exists():
+                compressed = zlib.compress(raw, 6)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+                tmp.write_bytes(compressed)
+                os.replace(tmp, path)
+                size = len(compressed)
+                if shared is None:
+                    self.total_bytes += size
+            else:
+                size = shared[0]
+
+            old = self._conn.execute(
+                "SELECT digest FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if old is not None and old[0] != digest:
+                self._delete_locked(key, old[0])
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, kind, digest, size, now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def _delete_locked(self, key: str, digest: str) -> None:
+        self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        row = self._conn.execute(
+            "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if row is None:
+            path = self._blob_path(digest)
+            try:
+                self.total_bytes -= path.stat().st_size
+                path.unlink()
+            except OSError:
+                pass
+
+    def _evict_locked(self) -> None:
+        # 先清过期条目，再按最久未访问淘汰到容量以内
+        cutoff = time.time() - self.ttl
+        for key, digest in self._conn.execute(
+            "SELECT key, digest FROM entries WHERE stored_at < ?", (cutoff,)
+        ).fetchall():
+            self._delete_locked(key, digest)
+        while self.total_bytes > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT key, digest FROM entries ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._delete_locked(*row)
+
+    def get_html(self, url: str, kind: str = "html") -> Optional[str]:
+        return self.get(url, kind)
+
+    def put_html(self, url: str, html: str, kind: str = "html") -> None:
+        self.put(url, kind, html)
+
+    def get_text(self, url: str, extractor: str) -> Optional[str]:
+        return self.get(url, f"text:{extractor}")
+
+    def put_text(self, url: str, extractor: str, text: str) -> None:
+        self.put(url, f"text:{extractor}", text)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_page_cache: Optional[PageCache] = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> Optional[PageCache]:
+    """进程级网页缓存；PAGE_CACHE_ENABLED=0 时返回 None
+
+    环境变量：PAGE_CACHE_DIR、PAGE_CACHE_TTL_HOURS（默认 24）、
+    PAGE_CACHE_MAX_MB（默认 512）
+    """
+    global _page_cache
+    if os.environ.get("PAGE_CACHE_ENABLED", "1") == "0":
+        return None
+    with _page_cache_lock:
+        if _page_cache is None:
+            try:
+                _page_cache = PageCache(
+                    os.environ.get("PAGE_CACHE_DIR", DEFAULT_PAGE_CACHE_DIR),
+                    ttl=float(os.environ.get("PAGE_CACHE_TTL_HOURS", "24")) * 3600,
+                    max_bytes=int(float(os.environ.get("PAGE_CACHE_MAX_MB", "512")) * 1024 * 1024),
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"网页缓存不可用: {e}")
+                return None
+        return _page_cache
+
+
+def fetch_html(
+    url: str, fetch: Callable[[], Optional[str]], kind: str = "html"
+) -> Optional[str]:
+    """先查缓存，未命中时调用 fetch() 下载并写入缓存
+
+    Args:
+        url: 页面 URL
+        fetch: 下载函数
+        kind: 缓存类别；请求方式不同（如 Bypass 的浏览器请求头）得到的
+            页面可能不同，用不同类别分开缓存
+    """
+    cache = get_page_cache()
+    if cache is not None:
+        html = cache.get_html(url, kind)
+        if html is not None:
+            logger.debug(f"网页缓存命中: {url}")
+            return html
+    html = fetch()
+    if cache is not None and _is_valid(html):
+        cache.put_html(url, html, kind)
+    return html
+
+
+class CacheProbe:
+    """probe_cache() 的结果：hit 表示块内有 cached_text 直接返回了缓存"""
+
+    def __init__(self):
+        self.hit = False
+
+
+_probe: contextvars.ContextVar[Optional[CacheProbe]] = contextvars.ContextVar(
+    "page_cache_probe", default=None
+)
+
+
+@contextlib.contextmanager
+def probe_cache() -> Iterator[CacheProbe]:
+    """记录 with 块内（同一线程或协程）的 cached_text 调用是否命中缓存
+
+    缓存命中几乎不耗时，调用方据此避免把它当作一次真实提取来统计。
+    """
+    probe = CacheProbe()
+    token = _probe.set(probe)
+    try:
+        yield probe
+    finally:
+        _probe.reset(token)
+
+
+def cached_text(extractor: str):
+    """为 extract(url) 形式的函数/方法缓存提取结果（也支持协程函数）
+
+    命中时可由外层的 probe_cache() 得知。
+
+    Args:
+        extractor: 提取器名，参与缓存键
+    """
+
+    def lookup(args, kwargs):
+        url = kwargs.get("url") or next(arg for arg in args if isinstance(arg, str))
+        cache = get_page_cache()
+        text = cache.get_text(url, extractor) if cache is not None else None
+        if text is not None:
+            logger.debug(f"提取结果缓存命中: {extractor} {url}")
+            probe = _probe.get()
+            if probe is not None:
+                probe.hit = True
+        return url, cache, text
+
+    def store(url, cache, text):
+        if cache is not None and _is_valid(text):
+            cache.put_text(url, extractor, text)
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                url, cache, text = lookup(args, kwargs)
+                if text is not None:
+                    return text
+                text = await func(*args, **kwargs)
+                store(url, cache, text)
+                return text
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            url, cache, text = lookup(args, kwargs)
+            if text is not None:
+                return text
+            text = func(*args, **kwargs)
+            store(url, cache, text)
+            return text
+
+        return wrapper
+
+    return decorator
@@ -1,16 +1,38 @@
 """并发竞速提取器 - 同时运行多个提取器，返回最先成功的结果"""
 
+import asyncio
 import concurrent.futures
 import logging
 import os
 import threading
-from typing import Optional, List, Callable
+import time
+from typing import Optional, List, Callable, Dict, Tuple
 
 import requests
 
+from scripts.components import shared
+from scripts.extractors.page_cache import cached_text, fetch_html, probe_cache
+from scripts.extractors.routing import ExtractorRouter
+
 logger = logging.getLogger(__name__)
 
 
+def _download(url: str, headers: dict, timeout: float, proxies: dict, label: str) -> Optional[str]:
+    """GET 页面，200 且长度足够时返回 HTML，否则返回 None"""
+    response = requests.get(
+        url,
+        headers=headers,
+        timeout=timeout,
+        allow_redirects=True,
+        proxies=proxies if proxies else None,
+    )
+    if response.status_code == 200 and len(response.text) > 500:
+        return response.text
+    logger.debug(f"{label} 返回 {response.status_code}: {url}")
+    return None
+
+
+@cached_text("google-cache")
 def extract_from_google_cache(url: str, timeout: float = 10.0) -> Optional[str]:
     """
     从 Google Cache 提取内容
@@ -33,16 +55,11 @@ def extract_from_google_cache(url: str, timeout: float = 10.0) -> Optional[str]:
         if proxy:
             proxies = {"http": proxy, "https": proxy}
 
-        response = requests.get(
-            cache_url,
-            headers=headers,
-            timeout=timeout,
-            allow_redirects=True,
-            proxies=proxies if proxies else None,
+        text = fetch_html(
+            cache_url, lambda: _download(cache_url, headers, timeout, proxies, "Google Cache")
         )
 
-        if response.status_code == 200 and len(response.text) > 500:
-            text = response.text
+        if text:
             import re
 
             match = re.search(r"<pre[^>]*>(.*?)</pre>", text, re.DOTALL | re.IGNORECASE)
@@ -78,7 +95,7 @@ def extract_from_google_cache(url: str, timeout: float = 10.0) -> Optional[str]:
             logger.warning(f"Google Cache 内容过短: {url}")
             return None
 
-        logger.warning(f"Google Cache 返回 {response.status_code}: {url}")
+        logger.warning(f"Google Cache 无可用页面: {url}")
         return None
 
     except Exception as e:
@@ -86,6 +103,7 @@ def extract_from_google_cache(url: str, timeout: float = 10.0) -> Optional[str]:
         return None
 
 
+@cached_text("wayback")
 def extract_from_wayback(url: str, timeout: float = 10.0) -> Optional[str]:
     """
     从 Wayback Machine 提取内容
@@ -117,15 +135,12 @@ def extract_from_wayback(url: str, timeout: float = 10.0) -> Optional[str]:
             data = response.json()
             if data.get("archived_snapshots", {}).get("closest"):
                 snapshot_url = data["archived_snapshots"]["closest"]["url"]
-                # 获取 snapshot 内容
-                snap_response = requests.get(
+                # 获取 snapshot 内容（快照不会变化，优先读缓存）
+                text = fetch_html(
                     snapshot_url,
-                    headers=headers,
-                    timeout=timeout,
-                    proxies=proxies if proxies else None,
+                    lambda: _download(snapshot_url, headers, timeout, proxies, "Wayback"),
                 )
-                if snap_response.status_code == 200 and len(snap_response.text) > 500:
-                    text = snap_response.text
+                if text:
                     import re
 
                     # 尝试提取 article 或 main 内容
@@ -167,6 +182,7 @@ def extract_from_wayback(url: str, timeout: float = 10.0) -> Optional[str]:
         return None
 
 
+@cached_text("bypass")
 def extract_with_bypass(url: str, timeout: float = 10.0) -> Optional[str]:
     """
     尝试通过修改请求头绕过付费墙
@@ -196,15 +212,15 @@ def extract_with_bypass(url: str, timeout: float = 10.0) -> Optional[str]:
         if proxy:
             proxies = {"http": proxy, "https": proxy}
 
-        response = requests.get(
-            url, headers=headers, timeout=timeout, proxies=proxies if proxies else None
+        # 浏览器请求头/代理拿到的页面可能与 Trafilatura 的普通下载不同
+        # （后者被拦截时正是降级到这里），因此单独缓存
+        text = fetch_html(
+            url, lambda: _download(url, headers, timeout, proxies, "Bypass"), kind="html:bypass"
         )
 
-        if response.status_code == 200 and len(response.text) > 500:
+        if text:
             import re
 
-            text = response.text
-
             # 尝试提取 article/main/body 内容
             match = re.search(
                 r"<article[^>]*>(.*?)</article>", text, re.DOTALL | re.IGNORECASE
@@ -244,7 +260,7 @@ def extract_with_bypass(url: str, timeout: float = 10.0) -> Optional[str]:
                     logger.info(f"Bypass 提取成功: {url}")
                     return content
 
-        logger.debug(f"Bypass 返回 {response.status_code}: {url}")
+        logger.debug(f"Bypass 未提取到内容: {url}")
         return None
 
     except Exception as e:
@@ -252,93 +268,226 @@ def extract_with_bypass(url: str, timeout: float = 10.0) -> Optional[str]:
         return None
 
 
+_POOL_WORKERS = int(os.environ.get("RACE_EXTRACTOR_WORKERS", "32"))
+_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_engine_lock = threading.Lock()
+
+
+def _get_engine() -> Tuple[asyncio.AbstractEventLoop, concurrent.futures.ThreadPoolExecutor]:
+    """进程级竞速引擎：一个后台事件循环 + 一个所有 URL 共用的线程池"""
+    global _pool, _loop
+    with _engine_lock:
+        if _loop is None:
+            _pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_POOL_WORKERS, thread_name_prefix="race"
+            )
+            _loop = asyncio.new_event_loop()
+            _loop.set_default_executor(_pool)
+            threading.Thread(
+                target=_loop.run_forever, name="race-loop", daemon=True
+            ).start()
+        return _loop, _pool
+
+
+def _is_valid(content: Optional[str]) -> bool:
+    return bool(content) and content != "-1" and bool(content.strip())
+
+
 class RaceExtractor:
     """并发竞速提取器
 
     同时运行多个提取器，返回最先成功（非空）的结果。
     适用于：Trafilatura 和 Jina 并发竞争，谁先返回用谁。
+
+    竞速跑在进程级的后台事件循环和共享线程池上：第一个有效结果一到就
+    返回，其余提取器随即取消——提供 ``extract_async`` 协程的提取器会被
+    真正中断，同步提取器尚未开始的会被撤出队列，已在运行的结果被丢弃。
     """
 
     def __init__(self, extractors: List[Callable], timeout: float = 30.0):
         """
         Args:
             extractors: 提取器列表，每个提取器需要是 callable(url) -> Optional[str]
+                或带 extract(url) / extract_async(url) 方法的对象
             timeout: 最大等待时间（秒）
         """
         self.extractors = extractors
         self.timeout = timeout
-        self._result_lock = threading.Lock()
-        self._result = {"content": None, "method": None, "error": None}
+        self._local = threading.local()
+
+    def _start(self, extractor, url: str) -> asyncio.Future:
+        if hasattr(extractor, "extract_async"):
+            return asyncio.ensure_future(extractor.extract_async(url))
+        func = extractor.extract if hasattr(extractor, "extract") else extractor
+        return asyncio.get_running_loop().run_in_executor(None, func, url)
+
+    async def race_async(self, url: str) -> Tuple[Optional[str], Optional[int]]:
+        """在当前事件循环中竞速单个 URL
+
+        Returns:
+            (content, winner_idx)；全部失败或超时返回 (None, None)
+        """
+        pending = {
+            self._start(extractor, url): idx for idx, extractor in enumerate(self.extractors)
+        }
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    logger.warning(f"RaceExtractor 超时: {url}")
+                    break
+                done, _ = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    idx = pending.pop(future)
+                    try:
+                        content = future.result()
+                    except Exception as e:
+                        logger.debug(f"Extractor {idx} failed: {e}")
+                        continue
+                    if _is_valid(content):
+                        logger.debug(f"Extractor {idx} won the race for {url}")
+                        return content, idx
+            return None, None
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def race(self, url: str) -> Tuple[Optional[str], Optional[int]]:
+        """竞速单个 URL（线程安全，可被多个线程同时调用）"""
+        loop, _ = _get_engine()
+        return asyncio.run_coroutine_threadsafe(self.race_async(url), loop).result()
+
+    def race_many(
+        self, urls: List[str], max_concurrency: int = 16
+    ) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+        """同时竞速多个 URL
+
+        Args:
+            urls: URL 列表
+            max_concurrency: 同时进行的竞速数
+
+        Returns:
+            {url: (content, winner_idx)}
+        """
+        async def run_all():
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+            async def run_one(url: str):
+                async with semaphore:
+                    return url, await self.race_async(url)
+
+            return dict(await asyncio.gather(*(run_one(url) for url in urls)))
+
+        loop, _ = _get_engine()
+        return asyncio.run_coroutine_threadsafe(run_all(), loop).result()
 
     def extract(self, url: str) -> Optional[str]:
         """并发提取，返回最先成功的结果"""
-        self._result = {"content": None, "method": None, "error": None}
+        content, winner = self.race(url)
+        self._local.winner = winner
+        return content
 
-        def try_extractor(extractor, idx):
-            if self._result["content"] is not None:
-                return None
+    def get_winner_method(self) -> Optional[int]:
+        """当前线程上一次 extract 的获胜提取器序号"""
+        return getattr(self._local, "winner", None)
 
-            try:
-                result = (
-                    extractor.extract(url)
-                    if hasattr(extractor, "extract")
-                    else extractor(url)
-                )
 
-                with self._result_lock:
-                    if self._result["content"] is None and result:
-                        self._result["content"] = result
-                        self._result["method"] = idx
-                        logger.debug(f"Extractor {idx} won the race for {url}")
-                        return result
-            except Exception as e:
-                logger.debug(f"Extractor {idx} failed: {e}")
-                with self._result_lock:
-                    if self._result["error"] is None:
-                        self._result["error"] = str(e)
-                return None
-
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=len(self.extractors)
-        ) as executor:
-            futures = [
-                executor.submit(try_extractor, extractor, idx)
-                for idx, extractor in enumerate(self.extractors)
-            ]
+class _RecordedExtractor:
+    """FastExtractor 的提取器包装：吞掉异常，并把结果和耗时记入路由表
 
+    延迟加载的组件（如 Crawl4AI）加载失败时视为本次跳过该提取器。
+    被包装的提取器有 extract_async 时竞速走协程，输掉后请求被真正取消；
+    被取消的调用和命中提取结果缓存的调用不记入路由表。
+    """
+
+    def __init__(self, name: str, extractor, router: ExtractorRouter):
+        self.name = name
+        self.extractor = extractor
+        self.router = router
+
+    def _func(self) -> Optional[Callable[[str], Optional[str]]]:
+        # 对 Deferred 的首次属性访问会触发加载，失败时 hasattr 为假
+        func = self.extractor.extract if hasattr(self.extractor, "extract") else self.extractor
+        if not callable(func):
+            logger.debug(f"{self.name} unavailable, skipped")
+            return None
+        return func
+
+    def __call__(self, url: str) -> Optional[str]:
+        func = self._func()
+        if func is None:
+            return None
+        start = time.monotonic()
+        content = None
+        with probe_cache() as probe:
             try:
-                concurrent.futures.wait(futures, timeout=self.timeout)
+                content = func(url)
             except Exception as e:
-                logger.warning(f"RaceExtractor timeout/error: {e}")
-
-        return self._result["content"]
+                logger.debug(f"{self.name} failed: {e}")
+        self._record(url, content, time.monotonic() - start, probe.hit)
+        return content
+
+    async def extract_async(self, url: str) -> Optional[str]:
+        extract_async = getattr(self.extractor, "extract_async", None)
+        if extract_async is None:
+            return await asyncio.get_running_loop().run_in_executor(None, self, url)
+        start = time.monotonic()
+        content = None
+        with probe_cache() as probe:
+            try:
+                content = await extract_async(url)
+            except Exception as e:
+                logger.debug(f"{self.name} failed: {e}")
+        self._record(url, content, time.monotonic() - start, probe.hit)
+        return content
 
-    def get_winner_method(self) -> Optional[str]:
-        return self._result.get("method")
+    def _record(self, url: str, content: Optional[str], elapsed: float, cached: bool) -> None:
+        # 缓存命中的耗时接近 0，记下来会让昂贵的提取器（Jina、Wayback）显得最快
+        if cached:
+            logger.debug(f"{self.name} served from cache, not recorded")
+            return
+        self.router.record(url, self.name, content, elapsed)
 
 
 class FastExtractor:
-    """快速提取器 - Trafilatura 和 Jina 并发竞速
+    """快速提取器 - 按域名自适应路由的竞速提取
 
-    Trafilatura 和 Jina 并发竞速，都失败则降级到 Crawl4AI。
-    三个提取器都只执行一次，不重试。
+    候选提取器（Trafilatura、Jina、Crawl4AI、Google Cache、Wayback、Bypass）
+    由 ExtractorRouter 按该域名的历史成功率、耗时排序，一直失败的直接跳过。
+    排名第一的提取器足够可靠时单独执行，否则前两名竞速；之后按顺序降级。
+    没有历史数据时顺序与原来一致：Trafilatura 和 Jina 竞速，再依次降级。
+    每个提取器都只执行一次，不重试。
     """
 
-    def __init__(self, trafilatura_extractor, jina_extractor, crawl4ai_extractor=None):
+    def __init__(
+        self, trafilatura_extractor, jina_extractor, crawl4ai_extractor=None, router=None
+    ):
         self.trafilatura = trafilatura_extractor
         self.jina = jina_extractor
         self.crawl4ai = crawl4ai_extractor
         self.timeout = 8.0  # 竞速超时
+        self.router = router if router is not None else shared(ExtractorRouter)
 
-        # Trafilatura 和 Jina 竞速
-        self.race_extractor = RaceExtractor(
-            [trafilatura_extractor, jina_extractor], timeout=self.timeout
-        )
+        self.extractors = {"trafilatura": trafilatura_extractor, "jina": jina_extractor}
+        if crawl4ai_extractor:
+            self.extractors["crawl4ai"] = crawl4ai_extractor
+        self.extractors["google-cache"] = extract_from_google_cache
+        self.extractors["wayback"] = extract_from_wayback
+        self.extractors["bypass"] = extract_with_bypass
+
+    def _recorded(self, name: str) -> _RecordedExtractor:
+        """包装提取器：吞掉异常，并把结果和耗时记入路由表"""
+        return _RecordedExtractor(name, self.extractors[name], self.router)
 
     def extract(self, url: str, use_race: bool = True) -> tuple[Optional[str], str]:
         """
-        提取内容 - Trafilatura 和 Jina 竞速，都失败则降级到 Crawl4AI
-        三个提取器都只执行一次，不重试
+        提取内容 - 按路由顺序竞速/降级
+        每个提取器都只执行一次，不重试
 
         Args:
             url: 目标 URL
@@ -350,51 +499,27 @@ class FastExtractor:
         if not use_race:
             return None, "failed"
 
-        # 第一轮：Trafilatura 和 Jina 竞速
-        content = self.race_extractor.extract(url)
-        winner_idx = self.race_extractor.get_winner_method()
+        candidates = self.router.order(url, list(self.extractors))
+        if not candidates:
+            logger.info(f"路由表中没有可用的提取器: {url}")
+            return "-1", "failed"
 
+        # 第一轮：可靠的首选单独执行，否则前两名竞速
+        width = 1 if self.router.is_confident(url, candidates[0]) else 2
+        first, rest = candidates[:width], candidates[width:]
+        race = RaceExtractor([self._recorded(name) for name in first], timeout=self.timeout)
+        content, winner_idx = race.race(url)
         if content:
-            method = "trafilatura" if winner_idx == 0 else "jina"
+            method = first[winner_idx]
             logger.info(f"竞速模式 - {method} 获胜: {url}")
             return content, method
 
-        # 第二轮：降级到 Crawl4AI（只执行一次）
-        if self.crawl4ai:
-            try:
-                content = self.crawl4ai.extract(url)
-                if content:
-                    logger.info(f"Crawl4AI 提取成功: {url}")
-                    return content, "crawl4ai"
-            except Exception as e:
-                logger.debug(f"Crawl4AI failed: {e}")
-
-        # 第三轮：降级到 Google Cache
-        try:
-            content = extract_from_google_cache(url)
-            if content:
-                logger.info(f"Google Cache 提取成功: {url}")
-                return content, "google-cache"
-        except Exception as e:
-            logger.debug(f"Google Cache failed: {e}")
-
-        # 第四轮：降级到 Wayback Machine
-        try:
-            content = extract_from_wayback(url)
-            if content:
-                logger.info(f"Wayback Machine 提取成功: {url}")
-                return content, "wayback"
-        except Exception as e:
-            logger.debug(f"Wayback Machine failed: {e}")
-
-        # 第五轮：尝试绕过付费墙
-        try:
-            content = extract_with_bypass(url)
-            if content:
-                logger.info(f"Bypass 提取成功: {url}")
-                return content, "bypass"
-        except Exception as e:
-            logger.debug(f"Bypass failed: {e}")
+        # 之后按路由顺序逐个降级
+        for name in rest:
+            content = self._recorded(name)(url)
+            if _is_valid(content):
+                logger.info(f"{name} 提取成功: {url}")
+                return content, name
 
         logger.info(f"所有提取器失败: {url}")
         return "-1", "failed"
@@ -0,0 +1,189 @@
+"""按域名自适应的提取器路由
+
+为每个 (域名, 提取器) 记录尝试次数、成功次数、平均正文长度和平均耗时，
+持久化到 SQLite，跨运行累积。路由时按 "预期成功所需代价" 排序：
+
+    代价 = 平均耗时 × 配额权重 / 平滑成功率
+
+从没试过的提取器统一估价（不计权重），保持调用方给出的顺序；对某个域名
+一直失败的提取器在重试窗口内直接跳过，省掉无效的 HTTP 请求和 Jina 配额。
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTES_DB = ".ai_cache/extractor_routes.db"
+
+
+def domain_of(url: str) -> str:
+    """URL 的域名（小写，去掉 www. 前缀）"""
+    domain = (urlparse(url).hostname or "").lower()
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+@dataclass
+class RouteStats:
+    """某域名下某个提取器的累计表现"""
+
+    attempts: int = 0
+    successes: int = 0
+    total_length: int = 0
+    total_latency: float = 0.0
+    last_attempt: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        # 拉普拉斯平滑：没有数据时为 0.5
+        return (self.successes + 1) / (self.attempts + 2)
+
+    @property
+    def avg_latency(self) -> Optional[float]:
+        return self.total_latency / self.attempts if self.attempts else None
+
+    @property
+    def avg_length(self) -> float:
+        return self.total_length / self.successes if self.successes else 0.0
+
+
+class ExtractorRouter:
+    """域名级提取器路由表（线程安全）"""
+
+    DEFAULT_LATENCY = 5.0  # 未知提取器的估计耗时（秒）
+    SKIP_AFTER_FAILURES = 5  # 尝试这么多次仍零成功则跳过
+    RETRY_AFTER = 7 * 86400  # 被跳过的提取器多久后重新试探（秒）
+    CONFIDENT_RATE = 0.9  # 成功率高于此值时可以单独使用，不必竞速
+    WEIGHTS = {"jina": 2.0}  # Jina 按调用计费/限额，同等条件下代价加倍
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path: SQLite 文件路径，默认取 EXTRACTOR_ROUTES_DB 环境变量
+        """
+        self.path = Path(path or os.environ.get("EXTRACTOR_ROUTES_DB", DEFAULT_ROUTES_DB))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], RouteStats] = {}
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS routes (
+                domain TEXT NOT NULL,
+                extractor TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                successes INTEGER NOT NULL,
+                total_length INTEGER NOT NULL,
+                total_latency REAL NOT NULL,
+                last_attempt REAL NOT NULL,
+                PRIMARY KEY (domain, extractor)
+            )
+        """
+        )
+        self._conn.commit()
+        for domain, extractor, *values in self._conn.execute("SELECT * FROM routes"):
+            self._stats[(domain, extractor)] = RouteStats(*values)
+
+    def stats(self, url: str, extractor: str) -> RouteStats:
+        """某 URL 所在域名下提取器的统计（没有记录时为空统计）"""
+        with self._lock:
+            stats = self._stats.get((domain_of(url), extractor))
+            return RouteStats(**vars(stats)) if stats else RouteStats()
+
+    def record(self, url: str, extractor: str, content: Optional[str], latency: float) -> None:
+        """记录一次提取结果
+
+        Args:
+            url: 提取的 URL
+            extractor: 提取器名
+            content: 提取结果，空或 "-1" 视为失败
+            latency: 耗时（秒）
+        """
+        domain = domain_of(url)
+        if not domain:
+            return
+        success = bool(content) and content != "-1"
+        with self._lock:
+            stats = self._stats.setdefault((domain, extractor), RouteStats())
+            stats.attempts += 1
+            stats.successes += int(success)
+            stats.total_length += len(content) if success else 0
+            stats.total_latency += latency
+            stats.last_attempt = time.time()
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO routes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        domain,
+                        extractor,
+                        stats.attempts,
+                        stats.successes,
+                        stats.total_length,
+                        stats.total_latency,
+                        stats.last_attempt,
+                    ),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"保存提取器路由统计失败: {e}")
+
+    def _skipped(self, stats: RouteStats, now: float) -> bool:
+        return (
+            stats.successes == 0
+            and stats.attempts >= self.SKIP_AFTER_FAILURES
+            and now - stats.last_attempt < self.RETRY_AFTER
+        )
+
+    def _cost(self, stats: RouteStats, weight: float) -> float:
+        if not stats.attempts:
+            # 未知提取器统一估价，保持调用方给出的顺序
+            return self.DEFAULT_LATENCY / stats.success_rate
+        return max(stats.avg_latency, 0.01) * weight / stats.success_rate
+
+    def order(
+        self, url: str, candidates: List[str], weights: Dict[str, float] = None
+    ) -> List[str]:
+        """按预期代价排列候选提取器，并去掉对该域名一直失败的
+
+        Args:
+            url: 目标 URL
+            candidates: 候选提取器名，代价相同时保持此顺序
+            weights: 各提取器的代价权重，默认 WEIGHTS，未列出的为 1
+
+        Returns:
+            排好序的提取器名列表
+        """
+        weights = self.WEIGHTS if weights is None else weights
+        domain = domain_of(url)
+        now = time.time()
+        ranked = []
+        with self._lock:
+            for index, name in enumerate(candidates):
+                stats = self._stats.get((domain, name), RouteStats())
+                if self._skipped(stats, now):
+                    logger.debug(f"路由跳过 {name}（{domain} 上 {stats.attempts} 次全部失败）")
+                    continue
+                # 代价相同时，平均正文更长的优先
+                cost = self._cost(stats, weights.get(name, 1.0))
+                ranked.append((cost, -stats.avg_length, index, name))
+        ranked.sort()
+        return [name for *_, name in ranked]
+
+    def is_confident(self, url: str, extractor: str) -> bool:
+        """该提取器在此域名上是否足够可靠，可以不与其他提取器竞速"""
+        stats = self.stats(url, extractor)
+        return stats.attempts >= self.SKIP_AFTER_FAILURES and (
+            stats.successes / stats.attempts >= self.CONFIDENT_RATE
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -2,6 +2,7 @@ import typing
 import logging
 from typing import Optional
 
+from scripts.extractors.page_cache import cached_text, fetch_html
 from utils.retry import retry_with_exponential_backoff
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,7 @@ class TrafilaturaExtractor:
         except Exception:
             self._module = None
 
+    @cached_text("trafilatura")
     @retry_with_exponential_backoff(
         max_retries=3,
         initial_delay=1.0,
@@ -29,7 +31,7 @@ class TrafilaturaExtractor:
         if not self._module:
             return None
         try:
-            html = self._module.fetch_url(url)
+            html = fetch_html(url, lambda: self._module.fetch_url(url))
             if not html:
                 return None
             text = self._module.extract(
@@ -91,6 +91,7 @@ def summarize_articles(
         "failed": 0,
         "articles": [],
     }
+    pending = []
 
     for article in articles:
         art_dict = article.model_dump()
@@ -132,10 +133,26 @@ def summarize_articles(
             )
             continue
 
-        try:
-            # 生成摘要
-            summary = summarizer.summarize(article.content[:3000])
+        if not article.content:
+            results["failed"] += 1
+            results["articles"].append(
+                {
+                    "id": article.id,
+                    "title": article.title,
+                    "status": "failed",
+                    "error": "无正文",
+                }
+            )
+            print("  ❌ 失败: 无正文")
+            continue
 
+        pending.append(article)
+
+    # 并发生成摘要（相同正文只请求一次，已缓存的直接返回）
+    summaries = summarizer.summarize_many([article.content[:3000] for article in pending])
+
+    for article, summary in zip(pending, summaries):
+        try:
             # 更新文章
             article.summary = summary
             storage.upsert_article(article)
@@ -144,7 +161,7 @@ def summarize_articles(
             results["articles"].append(
                 {"id": article.id, "title": article.title, "status": "success"}
             )
-            print(f"  ✅ 摘要: {summary[:50]}...")
+            print(f"  ✅ {article.title} 摘要: {summary[:50]}...")
 
         except Exception as e:
             results["failed"] += 1
@@ -156,7 +173,7 @@ def summarize_articles(
                     "error": str(e),
                 }
             )
-            print(f"  ❌ 失败: {e}")
+            print(f"  ❌ {article.title} 失败: {e}")
 
     return results
 
@@ -1,16 +1,94 @@
 import requests
+import json
 import logging
-from typing import Optional
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 
+from requests.adapters import HTTPAdapter
+
+from scripts.summarizers.summary_cache import SummaryCache, default_summary_cache, summary_key
 from utils.retry import retry_with_fixed_interval
 
 logger = logging.getLogger(__name__)
 
+# 与 Ollama 服务端的 OLLAMA_NUM_PARALLEL 对齐：同时在途的请求数
+DEFAULT_PARALLEL = 4
+
+_SENTENCE_ENDS = "。！？!?"
+
+
+@dataclass
+class GenerationMetrics:
+    """单次流式生成的耗时统计"""
+
+    ttft: Optional[float] = None  # 首 token 延迟（秒）
+    tokens: int = 0
+    duration: float = 0.0  # 请求总耗时（秒）
+    stopped_early: bool = False
+
+    @property
+    def tokens_per_sec(self) -> float:
+        generating = self.duration - (self.ttft or 0.0)
+        return self.tokens / generating if self.tokens and generating > 0 else 0.0
+
+
+def early_stop(text: str, budget: int) -> Optional[str]:
+    """
+    判断流式生成是否可以结束
+
+    Args:
+        text: 目前已生成的文本（已去掉首尾空白）
+        budget: 摘要字数上限
+
+    Returns:
+        可以结束时返回最终摘要，否则返回 None
+    """
+    if "\n" in text:
+        # 摘要之后开始另起一段（解释、补充），第一段就是摘要；
+        # 太短的首行（如 "摘要："）不算，继续读
+        head = text.split("\n", 1)[0].strip()
+        if len(head) >= budget // 2:
+            return early_stop(head, budget) or head
+    if len(text) >= budget:
+        cut = text[:budget]
+        end = max(cut.rfind(c) for c in _SENTENCE_ENDS)
+        # 尽量停在句末，但不为此丢掉一半以上的内容
+        return cut[: end + 1] if end + 1 >= budget // 2 else cut
+    if len(text) >= budget // 2 and text[-1] in _SENTENCE_ENDS:
+        return text
+    return None
+
 
 class OllamaSummarizer:
-    """Ollama LLM 摘要生成器"""
+    """Ollama LLM 摘要生成器
+
+    所有请求复用同一个连接池；相同正文只请求一次（并发中的相同请求会等待
+    同一个结果），成功的摘要写入持久化缓存。默认流式读取生成结果，摘要
+    够长或到句末就断开，不必等模型生成到 num_predict。
+    """
 
-    def __init__(self, host: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        host: str = "http://localhost:11434",
+        parallel: int = None,
+        cache: SummaryCache = None,
+        timeout: float = 60,
+        stream: bool = None,
+        summary_chars: int = 50,
+    ):
+        """
+        Args:
+            host: Ollama 服务地址
+            parallel: 最大并发请求数，默认取 OLLAMA_NUM_PARALLEL 环境变量
+            cache: 摘要缓存，默认见 default_summary_cache
+            timeout: 单次请求超时（秒）
+            stream: 是否流式读取并提前结束生成，默认取 OLLAMA_STREAM（默认开启）
+            summary_chars: 摘要字数上限，流式模式下达到后立即停止生成
+        """
         self.host = host
         self.model = "qwen2.5:1.5b"
         self.prompt_template = """请用50字以内概括以下内容，突出核心信息：
@@ -23,6 +101,24 @@ class OllamaSummarizer:
 3. 直接输出摘要，不要前缀
 
 摘要："""
+        self.parallel = max(
+            1, parallel or int(os.environ.get("OLLAMA_NUM_PARALLEL", DEFAULT_PARALLEL))
+        )
+        self.timeout = timeout
+        if stream is None:
+            stream = os.environ.get("OLLAMA_STREAM", "1") != "0"
+        self.stream = stream
+        self.summary_chars = summary_chars
+        self.cache = cache if cache is not None else default_summary_cache()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.parallel)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._totals = dict.fromkeys(("calls", "stopped_early", "tokens", "ttft", "gen_time"), 0)
 
     @retry_with_fixed_interval(
         max_retries=2,
@@ -30,23 +126,160 @@ class OllamaSummarizer:
         exceptions=(requests.RequestException, TimeoutError, ConnectionError),
         on_retry=lambda e, n: logger.warning(f"Ollama 重试 {n}: {e}"),
     )
+    def _generate(self, text: str) -> Optional[str]:
+        """请求 Ollama 生成摘要，非 200 响应返回 None"""
+        payload = {
+            "model": self.model,
+            "prompt": self.prompt_template.format(text),
+            "stream": self.stream,
+            "options": {"temperature": 0.3, "num_predict": 100},
+        }
+        if self.stream:
+            return self._generate_stream(payload)
+
+        response = self._session.post(
+            f"{self.host}/api/generate", json=payload, timeout=self.timeout
+        )
+        if response.status_code == 200:
+            result = response.json()
+            return result.get("response", "").strip()
+        logger.warning(f"Ollama 返回状态码 {response.status_code}")
+        return None
+
+    def _generate_stream(self, payload: Dict) -> Optional[str]:
+        """逐行读取 NDJSON 输出，摘要达到字数上限或句末时断开连接
+
+        断开后 Ollama 会取消这次生成，及早释放服务端的并行槽位。
+        """
+        metrics = GenerationMetrics()
+        start = time.monotonic()
+        pieces: List[str] = []
+        summary = None
+        with self._session.post(
+            f"{self.host}/api/generate", json=payload, timeout=self.timeout, stream=True
+        ) as response:
+            if response.status_code != 200:
+                logger.warning(f"Ollama 返回状态码 {response.status_code}")
+                return None
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                token = chunk.get("response", "")
+                if token:
+                    if metrics.ttft is None:
+                        metrics.ttft = time.monotonic() - start
+                    metrics.tokens += 1
+                    pieces.append(token)
+                if chunk.get("done"):
+                    # 读完结束标记，连接可以放回连接池
+                    continue
+                summary = early_stop("".join(pieces).strip(), self.summary_chars)
+                if summary is not None:
+                    metrics.stopped_early = True
+                    break
+        metrics.duration = time.monotonic() - start
+        self._record(metrics)
+        return summary if summary is not None else "".join(pieces).strip()
+
+    def _record(self, metrics: GenerationMetrics) -> None:
+        self._local.last_metrics = metrics
+        with self._stats_lock:
+            self._totals["calls"] += 1
+            self._totals["stopped_early"] += int(metrics.stopped_early)
+            self._totals["tokens"] += metrics.tokens
+            self._totals["ttft"] += metrics.ttft or 0.0
+            self._totals["gen_time"] += metrics.duration - (metrics.ttft or 0.0)
+        ttft_ms = (metrics.ttft or 0.0) * 1000
+        logger.info(
+            f"Ollama 生成: 首 token {ttft_ms:.0f}ms, {metrics.tokens} tokens, "
+            f"{metrics.tokens_per_sec:.1f} tokens/s"
+            + ("（提前结束）" if metrics.stopped_early else "")
+        )
+
+    @property
+    def last_metrics(self) -> Optional[GenerationMetrics]:
+        """当前线程最近一次流式生成的统计"""
+        return getattr(self._local, "last_metrics", None)
+
+    def generation_stats(self) -> Dict[str, float]:
+        """流式生成的累计统计：调用次数、提前结束次数、平均首 token 延迟和生成速度"""
+        with self._stats_lock:
+            totals = dict(self._totals)
+        calls = totals["calls"]
+        return {
+            "calls": calls,
+            "stopped_early": totals["stopped_early"],
+            "avg_ttft_s": totals["ttft"] / calls if calls else 0.0,
+            "tokens_per_sec": (
+                totals["tokens"] / totals["gen_time"] if totals["gen_time"] > 0 else 0.0
+            ),
+        }
+
+    def _key(self, body: str) -> str:
+        # 字数上限和流式提前结束都会改变摘要内容
+        options = f"summary_chars={self.summary_chars};stream={int(self.stream)}"
+        return summary_key(body, self.model, self.prompt_template, options)
+
     def summarize(self, text: str) -> str:
-        try:
-            response = requests.post(
-                f"{self.host}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": self.prompt_template.format(text[:2000]),
-                    "stream": False,
-                    "options": {"temperature": 0.3, "num_predict": 100},
-                },
-                timeout=60,
-            )
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "").strip()
-            logger.warning(f"Ollama 返回状态码 {response.status_code}")
-            return text[:200]
-        except Exception as e:
-            logger.error(f"Ollama 摘要生成失败: {e}")
-            return text[:200]
+        """生成摘要；失败时返回正文前 200 字"""
+        body = text[:2000]
+        key = self._key(body)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        # 合并并发中的相同请求
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if owner:
+            try:
+                summary = self._generate(body)
+            except Exception as e:
+                logger.error(f"Ollama 摘要生成失败: {e}")
+                summary = None
+            if summary and self.cache is not None:
+                self.cache.put(key, self.model, summary)
+            with self._inflight_lock:
+                del self._inflight[key]
+            future.set_result(summary)
+        else:
+            summary = future.result()
+
+        return summary if summary is not None else text[:200]
+
+    def summarize_many(self, texts: List[str], parallel: int = None) -> List[str]:
+        """
+        批量生成摘要
+
+        相同正文只请求一次；缓存未命中的部分以 parallel 个并发请求发往
+        Ollama，吞吐随服务端的并行槽位数增长。
+
+        Args:
+            texts: 正文列表
+            parallel: 最大并发请求数，默认 self.parallel
+
+        Returns:
+            与 texts 一一对应的摘要列表
+        """
+        if not texts:
+            return []
+        keys = [self._key(text[:2000]) for text in texts]
+        unique: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            unique.setdefault(key, text)
+        if len(unique) < len(texts):
+            logger.info(f"摘要去重: {len(texts)} 篇 → {len(unique)} 个请求")
+
+        workers = min(parallel or self.parallel, len(unique))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ollama") as pool:
+            summaries = dict(zip(unique, pool.map(self.summarize, unique.values())))
+        return [summaries[key] for key in keys]
+
+    def close(self) -> None:
+        self._session.close()
@@ -0,0 +1,94 @@
+"""摘要结果的持久化缓存
+
+同一篇文章重跑、或不同来源转载了相同正文时，不再重复调用 LLM。
+缓存键由正文哈希、模型名和提示词模板哈希组成，换模型或改提示词后
+旧摘要自然失效。
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUMMARY_CACHE_DB = ".ai_cache/summaries.db"
+
+
+def summary_key(text: str, model: str, prompt_template: str, options: str = "") -> str:
+    """摘要缓存键：sha256(正文) + 模型 + sha256(提示词模板) [+ 生成选项]
+
+    options 描述会改变输出的生成设置（如字数上限、是否流式提前结束），
+    为空时不参与计算。
+    """
+    digest = hashlib.sha256()
+    parts = (text, model, prompt_template, options) if options else (text, model, prompt_template)
+    for part in parts:
+        digest.update(hashlib.sha256(part.encode("utf-8")).digest())
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """SQLite 摘要缓存（线程安全）"""
+
+    def __init__(self, path: str = DEFAULT_SUMMARY_CACHE_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, summary: str) -> None:
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?)",
+                    (key, model, summary, time.time()),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"保存摘要缓存失败: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def default_summary_cache() -> Optional[SummaryCache]:
+    """按环境变量创建摘要缓存；SUMMARY_CACHE_ENABLED=0 时返回 None
+
+    路径取 SUMMARY_CACHE_DB，默认 .ai_cache/summaries.db
+    """
+    if os.environ.get("SUMMARY_CACHE_ENABLED", "1") == "0":
+        return None
+    try:
+        return SummaryCache(os.environ.get("SUMMARY_CACHE_DB", DEFAULT_SUMMARY_CACHE_DB))
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"摘要缓存不可用: {e}")
+        return None
@@ -0,0 +1,33 @@
+"""Shared pytest fixtures"""
+
+import sys
+
+import pytest
+
+
+def _reset_shared_components():
+    """Drop the process-wide component instances and page cache, if loaded"""
+    components = sys.modules.get("scripts.components")
+    if components is not None:
+        components.registry.clear()
+    page_cache = sys.modules.get("scripts.extractors.page_cache")
+    if page_cache is not None:
+        page_cache._page_cache = None
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path, monkeypatch):
+    """Keep every test's on-disk caches in tmp_path instead of the repo's .ai_cache
+
+    Failed attempts that tests record in the real extractor routing table
+    would make later runs skip those extractors.
+    """
+    cache_dir = tmp_path / "ai_cache"
+    monkeypatch.setenv("EXTRACTOR_ROUTES_DB", str(cache_dir / "extractor_routes.db"))
+    monkeypatch.setenv("SUMMARY_CACHE_DB", str(cache_dir / "summaries.db"))
+    monkeypatch.setenv("PAGE_CACHE_DIR", str(cache_dir / "pages"))
+    monkeypatch.setenv("PROCESSED_URLS_DB", str(cache_dir / "processed_urls.db"))
+    monkeypatch.setenv("EMBEDDING_CACHE_DIR", str(cache_dir / "embeddings"))
+    _reset_shared_components()
+    yield
+    _reset_shared_components()
@@ -2,8 +2,47 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import json
+from email.message import Message
+
+
+def _response(body, status=200, url="https://example.com"):
+    """Build a shared-client Response for mocked http_get calls."""
+    from ingestor.scrapers.http_client import Response
+
+    return Response(status, Message(), body, url)
+
+
+class _FakeStream:
+    """Stand-in for http_stream(): a context manager yielding itself."""
+
+    def __init__(self, body, status=200, chunk_size=64, **headers):
+        self.status = status
+        self.headers = Message()
+        for key, value in headers.items():
+            self.headers[key] = value
+        self.url = "https://example.com"
+        self.complete = False
+        self.chunks_read = 0
+        self._body = body
+        self._chunk_size = chunk_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(self.status)
+
+    def iter_content(self):
+        for start in range(0, len(self._body), self._chunk_size):
+            self.chunks_read += 1
+            yield self._body[start : start + self._chunk_size]
+        self.complete = True
 
 
 def test_article_model_import():
@@ -41,12 +80,12 @@ class TestRSSScraper:
 
         assert callable(fetch_rss)
 
-    @patch("ingestor.scrapers.rss_scraper.urllib.request.urlopen")
-    def test_fetch_rss_rss20(self, mock_urlopen):
+    @patch("ingestor.scrapers.rss_scraper.http_stream")
+    def test_fetch_rss_rss20(self, mock_http_stream):
         from ingestor.scrapers.rss_scraper import fetch_rss
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"""<?xml version="1.0"?>
+        mock_http_stream.return_value = _FakeStream(
+            b"""<?xml version="1.0"?>
         <rss version="2.0">
             <channel>
                 <title>Test Feed</title>
@@ -58,37 +97,138 @@ class TestRSSScraper:
                 </item>
             </channel>
         </rss>"""
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        )
 
-        items = fetch_rss("https://example.com/feed.xml")
+        items = fetch_rss("https://example.com/feed.xml", use_cache=False)
 
         assert len(items) == 1
         assert items[0]["title"] == "Test Article"
         assert items[0]["url"] == "https://example.com/article"
 
 
+class TestFeedValidatorCache:
+    FEED = b"""<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>Feed</title>
+        <item><title>One</title><link>https://example.com/1</link></item>
+    </channel></rss>"""
+
+    def test_sends_validators_and_skips_not_modified(self, tmp_path):
+        from ingestor.scrapers.feed_cache import FeedValidatorCache
+        from ingestor.scrapers.rss_scraper import fetch_rss
+
+        cache = FeedValidatorCache(tmp_path / "feeds.json")
+        url = "https://example.com/feed.xml"
+        with patch("ingestor.scrapers.rss_scraper.get_feed_cache", return_value=cache), patch(
+            "ingestor.scrapers.rss_scraper.http_stream"
+        ) as mock_http_stream:
+            mock_http_stream.return_value = _FakeStream(self.FEED, ETag='"v1"')
+            assert len(fetch_rss(url)) == 1
+
+            mock_http_stream.return_value = _FakeStream(b"", status=304)
+            assert fetch_rss(url) == []
+
+        assert mock_http_stream.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        reloaded = FeedValidatorCache(tmp_path / "feeds.json")
+        assert reloaded.get(url)["etag"] == '"v1"'
+
+    def test_unchanged_body_yields_nothing(self, tmp_path):
+        from ingestor.scrapers.feed_cache import FeedValidatorCache
+        from ingestor.scrapers.rss_scraper import fetch_rss
+
+        cache = FeedValidatorCache(tmp_path / "feeds.json")
+        url = "https://example.com/feed.xml"
+        with patch("ingestor.scrapers.rss_scraper.get_feed_cache", return_value=cache), patch(
+            "ingestor.scrapers.rss_scraper.http_stream",
+            side_effect=lambda *a, **kw: _FakeStream(self.FEED),
+        ):
+            assert len(fetch_rss(url)) == 1
+            assert fetch_rss(url) == []
+
+    def test_pending_validators_are_not_stored_until_committed(self, tmp_path):
+        from ingestor.scrapers.feed_cache import FeedValidatorCache
+        from ingestor.scrapers.rss_scraper import fetch_rss
+
+        cache = FeedValidatorCache(tmp_path / "feeds.json")
+        url = "https://example.com/feed.xml"
+        pending = []
+        with patch("ingestor.scrapers.rss_scraper.get_feed_cache", return_value=cache), patch(
+            "ingestor.scrapers.rss_scraper.http_stream",
+            return_value=_FakeStream(self.FEED, ETag='"v1"'),
+        ):
+            assert len(fetch_rss(url, pending_validators=pending)) == 1
+
+        assert cache.get(url) is None
+        pending[0].commit()
+        assert cache.get(url)["etag"] == '"v1"'
+
+
+class TestStreamingFeedParser:
+    def _rss(self, count):
+        items = "".join(
+            f"<item><title>T{i}</title><link>https://example.com/{i}</link></item>"
+            for i in range(count)
+        )
+        feed = f"<rss><channel><title>Big</title>{items}</channel></rss>"
+        return feed.encode()
+
+    def test_yields_items_in_order(self):
+        from ingestor.scrapers.rss_scraper import iter_feed_items
+
+        items = list(iter_feed_items([self._rss(50)]))
+
+        assert [item["title"] for item in items] == [f"T{i}" for i in range(50)]
+        assert all(item["source"] == "Big" for item in items)
+
+    def test_stops_reading_at_max_items(self):
+        from ingestor.scrapers.rss_scraper import fetch_rss
+
+        stream = _FakeStream(self._rss(2000))
+        with patch("ingestor.scrapers.rss_scraper.http_stream", return_value=stream):
+            items = fetch_rss("https://example.com/feed.xml", use_cache=False, max_items=3)
+
+        assert [item["title"] for item in items] == ["T0", "T1", "T2"]
+        assert not stream.complete
+        assert stream.chunks_read < 10
+
+    def test_atom_entries(self):
+        from ingestor.scrapers.rss_scraper import iter_feed_items
+
+        feed = b"""<?xml version="1.0"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <title>Channel</title>
+            <entry><title>Video</title><link href="https://youtube.com/v/1"/>
+                <published>2024-01-01T00:00:00Z</published></entry>
+        </feed>"""
+
+        items = list(iter_feed_items([feed[i : i + 7] for i in range(0, len(feed), 7)]))
+
+        assert len(items) == 1
+        assert items[0]["url"] == "https://youtube.com/v/1"
+        assert items[0]["id"].startswith("atom-")
+
+
 class TestNewsNowScraper:
     def test_newsnow_scraper_import(self):
         from ingestor.scrapers.newsnow_scraper import fetch_newsnow
 
         assert callable(fetch_newsnow)
 
-    @patch("ingestor.scrapers.newsnow_scraper.urllib.request.urlopen")
-    def test_fetch_newsnow(self, mock_urlopen):
+    @patch("ingestor.scrapers.newsnow_scraper.http_get")
+    def test_fetch_newsnow(self, mock_http_get):
         from ingestor.scrapers.newsnow_scraper import fetch_newsnow
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            [
-                {
-                    "title": "AI News",
-                    "url": "https://example.com/ai-news",
-                    "summary": "AI summary",
-                    "pub_time": "2024-01-01T00:00:00Z",
-                }
-            ]
-        ).encode()
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_http_get.return_value = _response(
+            json.dumps(
+                [
+                    {
+                        "title": "AI News",
+                        "url": "https://example.com/ai-news",
+                        "summary": "AI summary",
+                        "pub_time": "2024-01-01T00:00:00Z",
+                    }
+                ]
+            ).encode()
+        )
 
         items = fetch_newsnow("toutiao", "AI", 24, 10)
 
@@ -102,34 +242,46 @@ class TestHackerNewsScraper:
 
         assert callable(fetch_hackernews)
 
-    @patch("ingestor.scrapers.hackernews_scraper.urllib.request.urlopen")
-    def test_fetch_hackernews(self, mock_urlopen):
+    @patch("ingestor.scrapers.hackernews_scraper._fetch_item")
+    @patch("ingestor.scrapers.hackernews_scraper.http_get")
+    def test_fetch_hackernews(self, mock_http_get, mock_fetch_item):
         from ingestor.scrapers.hackernews_scraper import fetch_hackernews
 
-        # First call for top stories
-        mock_response1 = MagicMock()
-        mock_response1.read.return_value = json.dumps([1, 2, 3]).encode()
-
-        # Second call for story details
-        mock_response2 = MagicMock()
-        mock_response2.read.return_value = json.dumps(
-            {
-                "id": 1,
-                "title": "AI Article",
-                "url": "https://example.com/ai",
-                "score": 100,
-                "time": 1704067200,
-            }
-        ).encode()
-
-        mock_urlopen.side_effect = [
-            mock_response1.__enter__.return_value,
-            mock_response2.__enter__.return_value,
-        ]
+        # Top stories IDs
+        mock_http_get.return_value = _response(json.dumps([1, 2, 3]).encode())
+
+        # Story details
+        mock_fetch_item.side_effect = lambda story_id: {
+            "id": story_id,
+            "title": "AI Article" if story_id != 2 else "Other",
+            "url": f"https://example.com/{story_id}",
+            "score": 100,
+            "time": 1704067200,
+        }
 
         items = fetch_hackernews("AI", 24, 10)
 
-        assert len(items) >= 0  # May be 0 if filtering doesn't match
+        assert [item["id"] for item in items] == ["hn-1", "hn-3"]
+
+    @patch("ingestor.scrapers.hackernews_scraper._fetch_item")
+    @patch("ingestor.scrapers.hackernews_scraper.http_get")
+    def test_fetch_hackernews_keeps_order_and_stops_early(self, mock_http_get, mock_fetch_item):
+        import time
+        from ingestor.scrapers.hackernews_scraper import fetch_hackernews
+
+        mock_http_get.return_value = _response(json.dumps(list(range(1, 41))).encode())
+
+        def fetch_item(story_id):
+            # Earlier stories finish last to exercise ordering
+            time.sleep(0.02 * (5 - story_id % 5))
+            return {"id": story_id, "title": f"Story {story_id}"}
+
+        mock_fetch_item.side_effect = fetch_item
+
+        items = fetch_hackernews("", 24, 5, max_workers=4)
+
+        assert [item["id"] for item in items] == [f"hn-{i}" for i in range(1, 6)]
+        assert mock_fetch_item.call_count < 10
 
 
 class TestDevToScraper:
@@ -138,24 +290,24 @@ class TestDevToScraper:
 
         assert callable(fetch_devto)
 
-    @patch("ingestor.scrapers.devto_scraper.urllib.request.urlopen")
-    def test_fetch_devto(self, mock_urlopen):
+    @patch("ingestor.scrapers.devto_scraper.http_get")
+    def test_fetch_devto(self, mock_http_get):
         from ingestor.scrapers.devto_scraper import fetch_devto
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            [
-                {
-                    "id": 123,
-                    "title": "AI Tutorial",
-                    "url": "https://dev.to/article",
-                    "description": "Learn AI",
-                    "published_at": "2024-01-01T00:00:00Z",
-                    "user": {"name": "Author"},
-                }
-            ]
-        ).encode()
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_http_get.return_value = _response(
+            json.dumps(
+                [
+                    {
+                        "id": 123,
+                        "title": "AI Tutorial",
+                        "url": "https://dev.to/article",
+                        "description": "Learn AI",
+                        "published_at": "2024-01-01T00:00:00Z",
+                        "user": {"name": "Author"},
+                    }
+                ]
+            ).encode()
+        )
 
         items = fetch_devto("AI", 10)
 
@@ -169,25 +321,25 @@ class TestV2EXScraper:
 
         assert callable(fetch_v2ex)
 
-    @patch("ingestor.scrapers.v2ex_scraper.urllib.request.urlopen")
-    def test_fetch_v2ex(self, mock_urlopen):
+    @patch("ingestor.scrapers.v2ex_scraper.http_get")
+    def test_fetch_v2ex(self, mock_http_get):
         from ingestor.scrapers.v2ex_scraper import fetch_v2ex
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            [
-                {
-                    "id": 123,
-                    "title": "AI Discussion",
-                    "url": "https://v2ex.com/t/123",
-                    "content": "Discussion content",
-                    "created": 1704067200,
-                    "member": {"username": "user"},
-                    "node": {"title": "AI"},
-                }
-            ]
-        ).encode()
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_http_get.return_value = _response(
+            json.dumps(
+                [
+                    {
+                        "id": 123,
+                        "title": "AI Discussion",
+                        "url": "https://v2ex.com/t/123",
+                        "content": "Discussion content",
+                        "created": 1704067200,
+                        "member": {"username": "user"},
+                        "node": {"title": "AI"},
+                    }
+                ]
+            ).encode()
+        )
 
         items = fetch_v2ex("AI", 10)
 
@@ -201,31 +353,31 @@ class TestRedditScraper:
 
         assert callable(fetch_reddit)
 
-    @patch("ingestor.scrapers.reddit_scraper.urllib.request.urlopen")
-    def test_fetch_reddit(self, mock_urlopen):
+    @patch("ingestor.scrapers.reddit_scraper.http_get")
+    def test_fetch_reddit(self, mock_http_get):
         from ingestor.scrapers.reddit_scraper import fetch_reddit
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {
-                "data": {
-                    "children": [
-                        {
-                            "data": {
-                                "id": "abc123",
-                                "title": "ML Paper",
-                                "url": "https://example.com/paper",
-                                "selftext": "Paper discussion",
-                                "author": "user",
-                                "score": 100,
-                                "num_comments": 50,
+        mock_http_get.return_value = _response(
+            json.dumps(
+                {
+                    "data": {
+                        "children": [
+                            {
+                                "data": {
+                                    "id": "abc123",
+                                    "title": "ML Paper",
+                                    "url": "https://example.com/paper",
+                                    "selftext": "Paper discussion",
+                                    "author": "user",
+                                    "score": 100,
+                                    "num_comments": 50,
+                                }
                             }
-                        }
-                    ]
+                        ]
+                    }
                 }
-            }
-        ).encode()
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+            ).encode()
+        )
 
         items = fetch_reddit("MachineLearning", "", 10)
 
@@ -239,12 +391,12 @@ class TestArXivScraper:
 
         assert callable(fetch_arxiv)
 
-    @patch("ingestor.scrapers.arxiv_scraper.urllib.request.urlopen")
-    def test_fetch_arxiv(self, mock_urlopen):
+    @patch("ingestor.scrapers.arxiv_scraper.http_stream")
+    def test_fetch_arxiv(self, mock_http_stream):
         from ingestor.scrapers.arxiv_scraper import fetch_arxiv
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = """<?xml version="1.0"?>
+        mock_http_stream.return_value = _FakeStream(
+            """<?xml version="1.0"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
             <entry>
                 <title>AI Paper</title>
@@ -255,13 +407,28 @@ class TestArXivScraper:
                 <category term="cs.AI"/>
             </entry>
         </feed>""".encode()
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        )
 
         items = fetch_arxiv("cat:cs.AI", 10)
 
         assert len(items) == 1
         assert items[0]["title"] == "AI Paper"
 
+    def test_iter_arxiv_entries_stops_early(self):
+        from ingestor.scrapers.arxiv_scraper import iter_arxiv_entries
+
+        entries = "".join(
+            f"<entry><title>Paper {i}</title><id>http://arxiv.org/abs/{i}</id></entry>"
+            for i in range(500)
+        )
+        feed = f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode()
+        stream = _FakeStream(feed)
+
+        items = list(iter_arxiv_entries(stream.iter_content(), max_entries=2))
+
+        assert [item["title"] for item in items] == ["Paper 0", "Paper 1"]
+        assert not stream.complete
+
 
 class TestStorageAdapter:
     def test_storage_adapter_import(self):
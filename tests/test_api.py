@@ -1,8 +1,10 @@
 """Tests for API endpoints"""
 
 import pytest
+import sqlite3
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -10,8 +12,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 # Mock dependencies before importing app
 sys.modules["config"] = Mock()
 sys.modules["config.config"] = Mock()
-sys.modules["api.storage"] = Mock()
-sys.modules["api.storage.dao"] = Mock()
 sys.modules["shared"] = Mock()
 sys.modules["shared.models"] = Mock()
 
@@ -172,5 +172,83 @@ class TestAPICors:
         assert "access-control-allow-origin" in response.headers
 
 
+@pytest.fixture
+def local_storage_app(tmp_path, monkeypatch):
+    """A fresh app on ``storage_lifespan`` whose provider is a LocalDBAdapter in tmp_path."""
+    pytest.importorskip("fastapi")
+    from fastapi import FastAPI
+    from api.storage import app_storage
+    from api.v2 import v2_router
+    from ingestor.storage.db import LocalDBAdapter
+
+    adapters = []
+
+    def local_adapter(config):
+        adapter = LocalDBAdapter(str(tmp_path / "api.db"))
+        adapters.append(adapter)
+        return adapter
+
+    local_config = SimpleNamespace(database=SimpleNamespace(provider="local"))
+    monkeypatch.setattr(app_storage, "load_config_from_env", lambda: local_config)
+    monkeypatch.setattr(app_storage, "get_storage_adapter", local_adapter)
+
+    app = FastAPI(lifespan=app_storage.storage_lifespan)
+    app.include_router(v2_router)
+    return app, adapters
+
+
+class TestAppStorage:
+    """Test the app-scoped storage lifespan"""
+
+    def test_creates_one_adapter_per_app(self, local_storage_app):
+        from fastapi.testclient import TestClient
+
+        app, adapters = local_storage_app
+        with TestClient(app) as client:
+            for path in ["/api/v2/articles", "/api/v2/stats", "/api/v2/sources"] * 3:
+                assert client.get(path).status_code == 200
+            assert client.get("/api/v2/crawl-stats").json()["total_crawls"] == 0
+
+            assert len(adapters) == 1
+            assert app.state.storage.storage is adapters[0]
+            assert app.state.storage.dao.storage is adapters[0]
+
+    def test_closes_adapter_at_shutdown(self, local_storage_app):
+        from fastapi.testclient import TestClient
+
+        app, adapters = local_storage_app
+        with TestClient(app) as client:
+            assert client.get("/api/v2/stats").status_code == 200
+            conn = adapters[0]._get_connection()
+
+        assert app.state.storage is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+        # A restarted app gets a new adapter
+        with TestClient(app) as client:
+            assert client.get("/api/v2/stats").status_code == 200
+        assert len(adapters) == 2
+
+    def test_misconfigured_provider_returns_503(self, local_storage_app, monkeypatch):
+        from fastapi.testclient import TestClient
+        from api.storage import app_storage
+
+        app, adapters = local_storage_app
+
+        def missing_settings(config):
+            raise ValueError("D1 provider requires CF_ACCOUNT_ID")
+
+        monkeypatch.setattr(app_storage, "get_storage_adapter", missing_settings)
+        with TestClient(app) as client:
+            response = client.get("/api/v2/articles")
+            assert response.status_code == 503
+            assert "CF_ACCOUNT_ID" in response.json()["detail"]
+
+            health = client.get("/api/v2/health").json()
+            assert health["status"] == "unhealthy"
+            assert "Storage unavailable" in health["database"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""Tests for scripts/classifiers/bge_classifier.py"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+np = pytest.importorskip("numpy")
+
+
+class FakeModel:
+    """Deterministic encoder: one dimension per category keyword."""
+
+    AXES = ["突发", "热", "新", "深度"]
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False, **kwargs):
+        self.calls.append(len(texts))
+        embs = np.array(
+            [[1.0 if axis in text else 0.01 for axis in self.AXES] for text in texts],
+            dtype=np.float32,
+        )
+        if normalize_embeddings:
+            embs /= np.linalg.norm(embs, axis=1, keepdims=True)
+        return embs
+
+
+def _make_classifier(**kwargs):
+    from scripts.classifiers import bge_classifier
+
+    with patch.object(bge_classifier, "SentenceTransformer", lambda name: FakeModel()):
+        return bge_classifier.BGEClassifier(batch_size=8, **kwargs)
+
+
+@pytest.fixture
+def classifier(monkeypatch):
+    monkeypatch.setenv("EMBEDDING_CACHE_ENABLED", "0")
+    clf = _make_classifier()
+    clf.model.calls.clear()
+    return clf
+
+
+class TestClassifyMany:
+    """Test BGEClassifier.classify_many"""
+
+    def test_single_encode_for_all_texts(self, classifier):
+        """Test the whole batch is encoded in one call"""
+        texts = ["深度解析 GPT 大模型", "热门 Agent 工作流", "", "突发快讯"]
+        results = classifier.classify_many(texts)
+
+        assert classifier.model.calls == [3]
+        assert [r["category"] for r in results] == ["deep", "hot", "new", "breaking"]
+        assert results[0]["tags"] == ["LLM"]
+        assert results[2] == {"category": "new", "tags": [], "scores": {}}
+
+    def test_matches_single_classify(self, classifier):
+        """Test classify() is classify_many() on one text"""
+        text = "深度技术解读：Claude 论文"
+
+        assert classifier.classify(text) == classifier.classify_many([text])[0]
+
+    def test_without_model_returns_defaults(self, classifier):
+        """Test fallback when the model could not be loaded"""
+        classifier.model = None
+
+        assert classifier.classify_many(["深度"]) == [
+            {"category": "new", "tags": [], "scores": {}}
+        ]
+
+
+class TestEmbeddingCache:
+    """Test the content-addressed embedding cache"""
+
+    def test_round_trip_through_disk(self, tmp_path):
+        """Test vectors survive a reopen as float16 and are looked up by text"""
+        from scripts.classifiers.embedding_cache import EmbeddingCache
+
+        cache = EmbeddingCache("model-a", str(tmp_path), max_memory_items=1)
+        vectors = np.array([[0.6, 0.8], [1.0, 0.0]], dtype=np.float32)
+        cache.put_many(["a", "b"], vectors)
+        cache.close()
+
+        reopened = EmbeddingCache("model-a", str(tmp_path))
+        found = reopened.get_many(["b", "missing", "a"])
+
+        assert sorted(found) == [0, 2]
+        np.testing.assert_allclose(found[0], [1.0, 0.0], atol=1e-3)
+        np.testing.assert_allclose(found[2], [0.6, 0.8], atol=1e-3)
+
+    def test_key_includes_model_name(self, tmp_path):
+        """Test another model never reads these vectors"""
+        from scripts.classifiers.embedding_cache import EmbeddingCache
+
+        EmbeddingCache("model-a", str(tmp_path)).put_many(["a"], np.ones((1, 2)))
+
+        assert EmbeddingCache("model-b", str(tmp_path)).get_many(["a"]) == {}
+
+    def test_warm_start_skips_encoder(self, tmp_path):
+        """Test templates and seen texts are not re-encoded by a new classifier"""
+        from scripts.classifiers.embedding_cache import EmbeddingCache
+
+        first = _make_classifier(embedding_cache=EmbeddingCache("bge", str(tmp_path)))
+        expected = first.classify_many(["深度解析", "热门话题"])
+
+        second = _make_classifier(embedding_cache=EmbeddingCache("bge", str(tmp_path)))
+        results = second.classify_many(["深度解析", "热门话题"])
+
+        assert second.model.calls == []
+        assert [r["category"] for r in results] == [r["category"] for r in expected]
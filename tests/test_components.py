@@ -0,0 +1,89 @@
+"""Tests for scripts/components.py"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from scripts.components import ComponentRegistry, Deferred, LazyClass
+
+
+class TestComponentRegistry:
+    def test_returns_one_instance_per_factory_and_args(self):
+        registry = ComponentRegistry()
+
+        assert registry.get(list) is registry.get(list)
+        assert registry.get(dict, a=1) is not registry.get(dict, a=2)
+        assert registry.loaded(list)
+        assert not registry.loaded(set)
+
+    def test_concurrent_first_use_constructs_once(self):
+        registry = ComponentRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get(factory)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len({id(r) for r in results}) == 1
+
+    def test_clear_drops_instances(self):
+        registry = ComponentRegistry()
+        first = registry.get(list)
+        registry.clear()
+
+        assert registry.get(list) is not first
+
+
+class TestLazyClass:
+    def test_imports_module_on_first_call(self):
+        sys.modules.pop("fractions", None)
+        lazy = LazyClass("fractions", "Fraction")
+
+        assert "fractions" not in sys.modules
+        assert lazy(1, 2) == 0.5
+        assert "fractions" in sys.modules
+        assert lazy.load().__name__ == "Fraction"
+
+
+class TestDeferred:
+    def test_creates_component_on_attribute_access(self):
+        created = []
+
+        def loader():
+            created.append(1)
+            return "value"
+
+        proxy = Deferred(loader)
+        assert proxy
+        assert not created
+        assert proxy.upper() == "VALUE"
+        assert created == [1]
+
+    def test_failed_load_makes_proxy_unavailable(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            raise ImportError("crawl4ai")
+
+        proxy = Deferred(loader)
+        assert proxy
+        assert not hasattr(proxy, "extract")
+        assert not proxy
+        with pytest.raises(AttributeError):
+            proxy.extract
+        assert calls == [1]
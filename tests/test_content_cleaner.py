@@ -0,0 +1,128 @@
+"""Tests for scripts/extractors/content_cleaner.py"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("requests")  # scripts.extractors imports the Jina extractor
+
+from scripts.benchmark_content_cleaner import legacy_clean, load_pages  # noqa: E402
+from scripts.extractors.content_cleaner import (  # noqa: E402
+    ContentCleaner,
+    RuleSet,
+    markdown_cleaner,
+    text_cleaner,
+)
+
+SAMPLES = Path(__file__).parent.parent / "ai" / "articles" / "original"
+
+BODY = "这是一段足够长的正文内容，用来确认清理之后正文仍然完整保留。"
+
+PAGE = f"""[](https://36kr.com/usercenter/account) 账号设置 我的关注 退出登录
+登录 搜索
+* [首页](https://36kr.com/)
+* [快讯](https://36kr.com/newsflashes)
+* [资讯](https://36kr.com/information/web_news)
+![logo](https://img.36krcdn.com/logo.png)
+
+{BODY}
+
+36kr
+ok
+京ICP备12345678号
+"""
+
+
+class TestContentCleaner:
+    def test_removes_block_and_line_noise(self):
+        assert markdown_cleaner.clean(PAGE, "https://36kr.com/p/1") == BODY
+
+    def test_site_rules_only_apply_to_their_domain(self):
+        text = f"{BODY}\n京ICP备12345678号 雷锋网 编辑部"
+
+        assert markdown_cleaner.clean(text, "https://36kr.com/p/1") == f"{BODY}\n 雷锋网 编辑部"
+        assert markdown_cleaner.clean(text, "https://www.leiphone.com/a") == (
+            f"{BODY}\n京ICP备12345678号  编辑部"
+        )
+        assert markdown_cleaner.clean(text, "https://example.com/a") == text
+
+    def test_without_url_applies_all_rules(self):
+        text = f"{BODY}\n京ICP备12345678号 雷锋网版权 正文继续写完"
+
+        assert markdown_cleaner.clean(text) == f"{BODY}\n  正文继续写完"
+
+    def test_subdomain_matches_site_rules(self):
+        text = f"{BODY}\n爱搞机 今日更新内容"
+
+        assert markdown_cleaner.clean(text, "https://m.leiphone.com/a") == f"{BODY}\n 今日更新内容"
+
+    def test_longer_rule_wins_over_its_prefix(self):
+        assert text_cleaner.clean("正文。雷锋网版权所有", "https://leiphone.com/a") == "正文。所有"
+
+    def test_text_cleaner_keeps_short_lines(self):
+        text = "标题\n\n\n\n正文第一段\nok"
+
+        assert text_cleaner.clean(text, "https://example.com/a") == "标题\n\n正文第一段\nok"
+
+    def test_short_lines_with_site_tokens_are_dropped(self):
+        text = f"{BODY}\n  36kr 首页\n36kr 今天发布了一篇很长很长的报道"
+
+        assert markdown_cleaner.clean(text, "https://36kr.com/p/1") == (
+            f"{BODY}\n36kr 今天发布了一篇很长很长的报道"
+        )
+
+    def test_site_tokens_are_case_sensitive(self):
+        text = f"{BODY}\n标题: 36Kr测试文章"
+
+        assert markdown_cleaner.clean(text, "https://36kr.com/p/1") == text
+
+    def test_reprint_notices_only_removed_from_text(self):
+        text = f"{BODY}\n未经授权禁止转载"
+
+        assert text_cleaner.clean(text) == BODY
+        assert markdown_cleaner.clean(text) == text
+
+    @pytest.mark.parametrize("path", sorted(SAMPLES.glob("*.md")), ids=lambda p: p.name)
+    def test_matches_legacy_cleaner_on_samples(self, path):
+        sample = path.read_text(encoding="utf-8")
+
+        assert markdown_cleaner.clean(sample) == legacy_clean(sample)
+
+    def test_matches_legacy_cleaner_on_sample_pages(self):
+        pages = load_pages(SAMPLES, scale=3)
+
+        assert pages
+        for url, page in pages:
+            assert markdown_cleaner.clean(page) == legacy_clean(page, url)
+
+    def test_rule_sets_are_compiled_once_per_combination(self):
+        cleaner = ContentCleaner()
+        cleaner.clean(BODY, "https://example.com/a")
+        cleaner.clean(BODY, "https://other.org/b")
+        cleaner.clean(BODY, "https://36kr.com/c")
+
+        assert len(cleaner._compiled) == 2
+        assert cleaner._patterns("https://example.com/x") is cleaner._patterns(
+            "https://other.org/y"
+        )
+
+    def test_custom_rule_sets(self):
+        cleaner = ContentCleaner(
+            [RuleSet("ads", (r"广告",)), RuleSet("site", (r"订阅",), domains=("ex.com",))],
+            filter_lines=False,
+        )
+
+        assert cleaner.clean("正文广告订阅", "https://ex.com/a") == "正文"
+        assert cleaner.clean("正文广告订阅", "https://other.com/a") == "正文订阅"
+
+    def test_unterminated_noise_prefix_is_linear(self):
+        line = "账号设置 " * 20000
+
+        start = time.perf_counter()
+        markdown_cleaner.clean(line, "https://36kr.com/p/1")
+        assert time.perf_counter() - start < 1.0
+
+    def test_empty_text(self):
+        assert markdown_cleaner.clean("") == ""
+        assert text_cleaner.clean(None) is None
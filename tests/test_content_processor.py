@@ -2,7 +2,6 @@
 
 import pytest
 import json
-import tempfile
 import sys
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -106,24 +105,23 @@ class TestContentProcessor:
 
         assert results == []
 
-    def test_seen_urls_persistence(self):
-        """Test seen URLs are loaded and saved"""
+    def test_seen_urls_persistence(self, tmp_path):
+        """Test seen URLs are persisted in the SeenIndex database"""
         from scripts.content_processor import ContentProcessor
+        from ingestor.storage.seen_index import SeenIndex, normalize_url
 
-        # Create temp file for testing
-        with tempfile.TemporaryDirectory() as tmpdir:
-            processor = ContentProcessor()
-            processor._seen_path = Path(tmpdir) / "test_urls.json"
+        seen_db = tmp_path / "processed_urls.db"
+        processor = ContentProcessor(seen_db_path=str(seen_db))
 
-            # Add URL
-            processor._seen_urls.add("https://example.com/1")
-            processor._save_seen()
+        # Add URL
+        processor._seen_urls.add(normalize_url("https://example.com/1"))
 
-            # Create new processor - should load
-            processor2 = ContentProcessor()
-            processor2._seen_path = Path(tmpdir) / "test_urls.json"
+        # Create new processor - should load
+        processor2 = ContentProcessor(seen_db_path=str(seen_db))
 
-            assert "https://example.com/1" in processor2._seen_urls
+        assert processor2._is_seen("https://example.com/1")
+        assert not processor2._is_seen("https://example.com/2")
+        assert normalize_url("https://example.com/1") in SeenIndex(seen_db)
 
 
 class TestDataContract:
@@ -215,5 +213,190 @@ class TestErrorHandling:
                             assert result["content"] == "Fallback Title"
 
 
+class TestLazyComponents:
+    """Heavy components are created on first use and shared process-wide"""
+
+    def test_extract_only_does_not_import_heavy_modules(self, tmp_path):
+        import os
+        import subprocess
+
+        script = (
+            "import sys\n"
+            "from scripts.content_processor import ContentProcessor\n"
+            "processor = ContentProcessor(mode='extract-only')\n"
+            "processor.process_batch([{'url': 'https://ex.com/a', 'title': 'A'}])\n"
+            "heavy = ['sentence_transformers', 'crawl4ai', 'scripts.classifiers',\n"
+            "         'scripts.extractors.crawl4ai_extractor']\n"
+            "print([name for name in heavy if name in sys.modules])\n"
+        )
+        root = Path(__file__).parent.parent
+        env = dict(os.environ, DRY_RUN="1", PYTHONPATH=str(root))
+        proc = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode and "ModuleNotFoundError" in proc.stderr:
+            pytest.skip(proc.stderr.strip().splitlines()[-1])
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_components_are_shared_between_processors(self):
+        pytest.importorskip("requests")
+        from scripts.content_processor import ContentProcessor
+
+        with patch("scripts.content_processor.BGEClassifier") as mock_clf:
+            with patch("scripts.content_processor.OllamaSummarizer") as mock_sum:
+                first = ContentProcessor(max_articles=1)
+                second = ContentProcessor(max_articles=1)
+
+                assert not mock_clf.called and not mock_sum.called
+                assert first.classifier is second.classifier
+                assert first.summarizer is second.summarizer
+                assert mock_clf.call_count == 1
+                assert mock_sum.call_count == 1
+
+
+class TestStagedBatch:
+    """process_batch runs extract -> summarize -> classify -> persist concurrently"""
+
+    def test_batch_is_summarized_classified_and_persisted(self, tmp_path):
+        pytest.importorskip("requests")
+        from scripts.content_processor import ContentProcessor
+
+        processor = ContentProcessor(max_articles=10, extract_workers=3, summarize_workers=2)
+        processor._seen_path = tmp_path / "seen.json"
+        processor._seen_urls = set()
+        processor._emit_metrics = Mock()
+        processor.fast_extractor = Mock()
+        processor.fast_extractor.extract.side_effect = lambda url: (f"正文 {url}", "trafilatura")
+        processor.summarizer = Mock()
+        processor.summarizer.summarize.side_effect = lambda text: text[:8]
+        processor.classifier = Mock()
+        processor.classifier.classify_many.side_effect = lambda texts: [
+            {"category": "tech", "tags": ["t"]} for _ in texts
+        ]
+        processor.d1_adapter = Mock()
+
+        articles = [
+            {"url": f"https://ex.com/{i}", "title": f"T{i}", "id": str(i)} for i in range(6)
+        ]
+        articles.append({"url": "", "title": "no url"})
+        results, errors = processor.process_batch(articles)
+
+        assert errors == []
+        assert [r["id"] for r in results] == [str(i) for i in range(6)]
+        assert all(r["category"] == "tech" and r["summary"] for r in results)
+        assert processor.d1_adapter.update_article_content.call_count == 6
+        assert processor._seen_urls == {f"https://ex.com/{i}" for i in range(6)}
+
+    def test_unclassified_results_have_no_category(self, tmp_path):
+        pytest.importorskip("requests")
+        from scripts.content_processor import ContentProcessor
+
+        processor = ContentProcessor(max_articles=10, mode="extract-only")
+        processor._seen_path = tmp_path / "seen.json"
+        processor._seen_urls = set()
+        processor._emit_metrics = Mock()
+        processor.fast_extractor = Mock()
+        processor.fast_extractor.extract.return_value = ("正文", "jina")
+
+        results, errors = processor.process_batch([{"url": "https://ex.com/a", "title": "A"}])
+
+        assert errors == []
+        assert [(r["category"], r["tags"]) for r in results] == [(None, [])]
+
+    def test_repeated_urls_are_processed_once(self, tmp_path):
+        pytest.importorskip("requests")
+        from scripts.content_processor import ContentProcessor
+
+        processor = ContentProcessor(max_articles=10, mode="extract-only")
+        processor._seen_path = tmp_path / "seen.json"
+        processor._seen_urls = set()
+        processor._emit_metrics = Mock()
+        processor.fast_extractor = Mock()
+        processor.fast_extractor.extract.return_value = ("正文", "jina")
+
+        results, errors = processor.process_batch(
+            [
+                {"url": "https://ex.com/a", "title": "A", "id": "1"},
+                {"url": "https://ex.com/a", "title": "A again", "id": "2"},
+            ]
+        )
+
+        assert [r["id"] for r in results] == ["1"]
+        assert processor.fast_extractor.extract.call_count == 1
+
+    def test_failing_article_is_reported(self, tmp_path):
+        pytest.importorskip("requests")
+        from scripts.content_processor import ContentProcessor
+
+        processor = ContentProcessor(max_articles=10, mode="summarize-only")
+        processor._seen_path = tmp_path / "seen.json"
+        processor._seen_urls = set()
+        processor._emit_metrics = Mock()
+        processor.fast_extractor = Mock()
+        processor.fast_extractor.extract.return_value = ("正文", "jina")
+        processor.summarizer = Mock()
+        processor.summarizer.summarize.side_effect = RuntimeError("ollama down")
+
+        results, errors = processor.process_batch([{"url": "https://ex.com/a", "title": "A"}])
+
+        assert results == []
+        assert errors == [{"url": "https://ex.com/a", "error": "ollama down", "title": "A"}]
+
+    def test_crawl4ai_batch_streams_into_summarize(self, tmp_path):
+        pytest.importorskip("requests")
+        import threading
+
+        from scripts.content_processor import ContentProcessor
+
+        processor = ContentProcessor(max_articles=10, use_crawl4ai_batch=True)
+        processor._seen_path = tmp_path / "seen.json"
+        processor._seen_urls = set()
+        processor._emit_metrics = Mock()
+        processor.fast_extractor = Mock()
+        processor.fast_extractor.extract.return_value = ("逐篇正文", "trafilatura")
+        processor.classifier = Mock()
+        processor.classifier.classify_many.side_effect = lambda texts: [
+            {"category": "tech", "tags": []} for _ in texts
+        ]
+        first_summarized = threading.Event()
+        processor.summarizer = Mock()
+
+        def summarize(text):
+            first_summarized.set()
+            return text[:4]
+
+        processor.summarizer.summarize.side_effect = summarize
+        urls = [f"https://ex.com/{i}" for i in range(3)]
+
+        def iter_many(batch, callback=None):
+            # Later URLs finish first; the rest of the crawl waits until the
+            # first result has already been summarized
+            yield urls[2], "批量正文 2"
+            assert first_summarized.wait(5)
+            yield urls[0], None
+
+        processor.crawl4ai = Mock()
+        processor.crawl4ai.iter_many.side_effect = iter_many
+
+        results, errors = processor.process_batch(
+            [{"url": url, "title": url, "id": url} for url in urls]
+        )
+
+        assert errors == []
+        assert [r["url"] for r in results] == urls
+        methods = {r["url"]: r["extraction_method"] for r in results}
+        assert methods == {
+            urls[0]: "trafilatura",
+            urls[1]: "trafilatura",
+            urls[2]: "crawl4ai-batch",
+        }
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,116 @@
+"""Tests for the streaming batch API of scripts/extractors/crawl4ai_extractor.py"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("requests")  # scripts.extractors imports the Jina extractor
+
+from scripts.extractors import crawl4ai_extractor, page_cache  # noqa: E402
+from scripts.extractors.crawl4ai_extractor import Crawl4AIExtractor  # noqa: E402
+
+BODY = "This paragraph is long enough to survive the noise cleaner in the extractor. " * 3
+
+
+class FakeResult:
+    def __init__(self, url, success=True, markdown=BODY):
+        self.url = url
+        self.success = success
+        self.markdown = markdown
+        self.fit_markdown = None
+        self.error = None if success else "timeout"
+
+
+class FakeCrawler:
+    """Streams results in reverse order, like a crawl where later URLs finish first"""
+
+    def __init__(self, fail=(), drop=()):
+        self.fail = set(fail)
+        self.drop = set(drop)
+        self.produced = 0
+        self.requested = []
+
+    async def arun_many(self, urls, config, dispatcher):
+        self.requested.append(list(urls))
+
+        async def stream():
+            for url in reversed(urls):
+                if url in self.drop:
+                    continue
+                await asyncio.sleep(0.01)
+                self.produced += 1
+                yield FakeResult(url, success=url not in self.fail)
+
+        return stream()
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    monkeypatch.setenv("PAGE_CACHE_DIR", str(tmp_path / "pages"))
+    monkeypatch.delenv("PAGE_CACHE_ENABLED", raising=False)
+    monkeypatch.setattr(page_cache, "_page_cache", None)
+    fake = FakeCrawler()
+    monkeypatch.setattr(crawl4ai_extractor, "_init_crawler", lambda: fake)
+    monkeypatch.setattr(
+        crawl4ai_extractor,
+        "_crawler_config",
+        {"crawl": None, "crawl_stream": None, "dispatcher": None},
+    )
+    yield fake
+    page_cache.get_page_cache().close()
+
+
+URLS = [f"https://ex.com/{i}" for i in range(4)]
+
+
+class TestIterMany:
+    def test_yields_in_completion_order(self, crawler):
+        results = list(Crawl4AIExtractor().iter_many(URLS))
+
+        assert [url for url, _ in results] == list(reversed(URLS))
+        assert all(text and "long enough" in text for _, text in results)
+
+    def test_failed_and_missing_urls_yield_none_once(self, crawler):
+        crawler.fail = {URLS[1]}
+        crawler.drop = {URLS[2]}
+
+        results = list(Crawl4AIExtractor().iter_many(URLS))
+
+        assert sorted(url for url, _ in results) == URLS
+        assert dict(results)[URLS[1]] is None
+        assert results[-1] == (URLS[2], None)
+
+    def test_crawl_advances_only_as_results_are_consumed(self, crawler):
+        stream = Crawl4AIExtractor().iter_many(URLS)
+
+        next(stream)
+        assert crawler.produced == 1
+        next(stream)
+        assert crawler.produced == 2
+        stream.close()
+
+    def test_cached_urls_are_yielded_first_without_crawling(self, crawler):
+        page_cache.get_page_cache().put_text(URLS[3], "crawl4ai", "cached body")
+
+        results = list(Crawl4AIExtractor().iter_many(URLS))
+
+        assert results[0] == (URLS[3], "cached body")
+        assert crawler.requested == [URLS[:3]]
+
+    def test_successful_results_are_cached(self, crawler):
+        list(Crawl4AIExtractor().iter_many(URLS))
+
+        assert list(Crawl4AIExtractor().iter_many(URLS[:1]))[0][1]
+        assert len(crawler.requested) == 1
+
+    def test_extract_many_returns_dict(self, crawler):
+        crawler.fail = {URLS[0]}
+        progress = []
+
+        results = Crawl4AIExtractor().extract_many(
+            URLS, callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert set(results) == set(URLS)
+        assert results[URLS[0]] is None
+        assert progress[-1] == (4, 4)
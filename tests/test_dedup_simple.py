@@ -3,10 +3,15 @@
 import sys
 from pathlib import Path
 
-# Mock the dependencies before importing
-sys.modules['requests'] = type(sys)('requests')
-sys.modules['feedparser'] = type(sys)('feedparser')
-sys.modules['numpy'] = type(sys)('numpy')
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _stub_dependencies(monkeypatch):
+    """Mock the dependencies for these tests only, so other test modules keep the real ones"""
+    for name in ('requests', 'feedparser', 'numpy'):
+        monkeypatch.setitem(sys.modules, name, type(sys)(name))
+
 
 def test_dedup_articles():
     """测试文章去重逻辑"""
@@ -0,0 +1,78 @@
+"""Tests for scripts/extractors/routing.py"""
+
+import time
+
+import pytest
+
+pytest.importorskip("requests")  # scripts.extractors imports the Jina extractor
+
+from scripts.extractors.routing import ExtractorRouter, domain_of  # noqa: E402
+
+
+def _record(router, url, name, ok, latency, times=1):
+    for _ in range(times):
+        router.record(url, name, "x" * 500 if ok else None, latency)
+
+
+class TestExtractorRouter:
+    def test_domain_of_strips_www(self):
+        assert domain_of("https://WWW.Example.com/a?b=1") == "example.com"
+
+    def test_unknown_domain_keeps_given_order(self, tmp_path):
+        router = ExtractorRouter(tmp_path / "routes.db")
+
+        assert router.order("https://new.example/a", ["b", "a", "jina", "c"]) == [
+            "b",
+            "a",
+            "jina",
+            "c",
+        ]
+
+    def test_prefers_fast_reliable_extractor(self, tmp_path):
+        router = ExtractorRouter(tmp_path / "routes.db")
+        url = "https://site.example/post"
+        _record(router, url, "trafilatura", False, 3.0, times=3)
+        _record(router, url, "jina", True, 1.0, times=3)
+
+        assert router.order(url, ["trafilatura", "jina", "wayback"]) == [
+            "jina",
+            "wayback",
+            "trafilatura",
+        ]
+
+    def test_skips_extractor_that_always_fails(self, tmp_path):
+        router = ExtractorRouter(tmp_path / "routes.db")
+        url = "https://paywall.example/a"
+        _record(router, url, "trafilatura", False, 0.5, times=ExtractorRouter.SKIP_AFTER_FAILURES)
+
+        assert router.order(url, ["trafilatura", "jina"]) == ["jina"]
+        assert router.order("https://other.example/a", ["trafilatura", "jina"])[0] == "trafilatura"
+
+    def test_failed_extractor_is_retried_after_window(self, tmp_path, monkeypatch):
+        router = ExtractorRouter(tmp_path / "routes.db")
+        url = "https://paywall.example/a"
+        _record(router, url, "trafilatura", False, 0.5, times=ExtractorRouter.SKIP_AFTER_FAILURES)
+        later = time.time() + ExtractorRouter.RETRY_AFTER + 1
+        monkeypatch.setattr("scripts.extractors.routing.time.time", lambda: later)
+
+        assert "trafilatura" in router.order(url, ["trafilatura", "jina"])
+
+    def test_jina_quota_weight(self, tmp_path):
+        router = ExtractorRouter(tmp_path / "routes.db")
+        url = "https://site.example/post"
+        _record(router, url, "trafilatura", True, 1.5, times=5)
+        _record(router, url, "jina", True, 1.0, times=5)
+
+        assert router.order(url, ["jina", "trafilatura"]) == ["trafilatura", "jina"]
+
+    def test_confidence_and_persistence(self, tmp_path):
+        url = "https://site.example/post"
+        router = ExtractorRouter(tmp_path / "routes.db")
+        _record(router, url, "trafilatura", True, 0.5, times=5)
+        router.close()
+
+        reopened = ExtractorRouter(tmp_path / "routes.db")
+        stats = reopened.stats(url, "trafilatura")
+        assert (stats.attempts, stats.successes, stats.avg_length) == (5, 5, 500)
+        assert reopened.is_confident(url, "trafilatura")
+        assert not reopened.is_confident(url, "jina")
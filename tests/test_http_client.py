@@ -0,0 +1,149 @@
+"""Tests for ingestor/scrapers/http_client.py"""
+
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ingestor.scrapers.http_client import HTTPClient, HTTPStatusError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.ports.add(self.client_address[1])
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            if self.path == "/gzip":
+                self._send(200, gzip.compress(b"compressed"), {"Content-Encoding": "gzip"})
+            elif self.path == "/redirect":
+                self._send(302, b"", {"Location": "/plain"})
+            elif self.path == "/missing":
+                self._send(404, b"not found")
+            elif self.path == "/slow":
+                time.sleep(0.1)
+                self._send(200, b"slow")
+            else:
+                self._send(200, b'{"ok": true}', {"Content-Type": "application/json"})
+        finally:
+            with server.lock:
+                server.active -= 1
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.ports = set()
+    httpd.active = 0
+    httpd.peak = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _client(**kwargs):
+    client = HTTPClient(**kwargs)
+    client._proxies = {}
+    return client
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+class TestHTTPClient:
+    def test_reuses_keep_alive_connection(self, server):
+        client = _client()
+        for _ in range(5):
+            assert client.get(_url(server, "/plain")).json() == {"ok": True}
+
+        assert len(server.ports) == 1, "Sequential requests should share one connection"
+        client.close()
+
+    def test_decodes_gzip(self, server):
+        client = _client()
+        assert client.get(_url(server, "/gzip")).content == b"compressed"
+        client.close()
+
+    def test_follows_redirects(self, server):
+        client = _client()
+        response = client.get(_url(server, "/redirect"))
+
+        assert response.status == 200
+        assert response.url.endswith("/plain")
+        client.close()
+
+    def test_error_status_is_returned_then_raised(self, server):
+        client = _client()
+        response = client.get(_url(server, "/missing"))
+
+        assert response.status == 404
+        with pytest.raises(HTTPStatusError):
+            response.raise_for_status()
+        client.close()
+
+    def test_caps_connections_per_host(self, server):
+        client = _client(max_connections_per_host=2)
+        threads = [
+            threading.Thread(target=client.get, args=(_url(server, "/slow"),))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert server.peak <= 2
+        assert len(server.ports) <= 2
+        client.close()
+
+    def test_stream_decodes_gzip_incrementally(self, server):
+        client = _client()
+        with client.stream(_url(server, "/gzip")) as response:
+            body = b"".join(response.iter_content(chunk_size=4))
+
+        assert body == b"compressed"
+        assert response.complete
+        client.close()
+
+    def test_unfinished_stream_is_not_pooled(self, server):
+        client = _client()
+        with client.stream(_url(server, "/plain")) as response:
+            assert response.status == 200
+
+        assert not response.complete
+        assert client.get(_url(server, "/plain")).json() == {"ok": True}
+        assert len(server.ports) == 2, "Partially read connection must be discarded"
+        client.close()
+
+    def test_expired_idle_connection_is_replaced(self, server):
+        client = _client(keepalive_expiry=0.05)
+        client.get(_url(server, "/plain"))
+        client.get(_url(server, "/plain"))
+        assert len(server.ports) == 1
+
+        time.sleep(0.1)
+        client.get(_url(server, "/plain"))
+
+        assert len(server.ports) == 2, "Connections idle past the expiry must not be reused"
+        client.close()
@@ -0,0 +1,303 @@
+"""Tests for ingestor/main.py"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from unittest.mock import patch
+
+import pytest
+
+from ingestor import main as ingest_main
+from ingestor.storage.near_duplicates import NearDuplicateIndex
+from ingestor.storage.seen_index import SeenIndex
+
+
+class FakeStorage:
+    """In-memory storage recording upserts and crawl logs."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.articles = []
+        self.batches = []
+        self.crawl_logs = []
+
+    def upsert_article(self, article):
+        with self.lock:
+            self.articles.append(article)
+
+    def upsert_articles(self, articles):
+        articles = list(articles)
+        with self.lock:
+            self.batches.append(len(articles))
+            self.articles.extend(articles)
+        return len(articles)
+
+    def write_crawl_log(self, **kwargs):
+        with self.lock:
+            self.crawl_logs.append(kwargs)
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger("test_ingestor_main")
+
+
+@pytest.fixture(autouse=True)
+def plain_articles():
+    """Keep articles as plain dicts, independent of the pydantic install."""
+    with patch.object(ingest_main, "ArticleModel", dict), patch.object(
+        ingest_main, "transform", side_effect=dict
+    ):
+        yield
+
+
+def _source(name, url, **extra):
+    src = {"name": name, "type": "rss", "url": url}
+    src.update(extra)
+    return src
+
+
+class TestSourceHost:
+    def test_host_from_url(self):
+        assert ingest_main._source_host(_source("a", "https://Example.com/feed")) == "example.com"
+
+    def test_host_from_type(self):
+        assert ingest_main._source_host({"type": "hackernews"}) == "hacker-news.firebaseio.com"
+
+
+class TestIngestSources:
+    def test_runs_sources_in_parallel(self, logger):
+        sources = [_source(f"s{i}", f"https://host{i}.example/feed") for i in range(6)]
+
+        def slow_fetch(src, **kwargs):
+            time.sleep(0.2)
+            return [{"id": src["name"], "title": "t", "url": src["url"]}]
+
+        storage = FakeStorage()
+        with patch.object(ingest_main, "_fetch_from_source", side_effect=slow_fetch):
+            start = time.time()
+            results = ingest_main._ingest_sources(
+                sources, storage, False, logger, concurrency=6, per_host_limit=1
+            )
+            elapsed = time.time() - start
+
+        assert elapsed < 0.8, "Sources should not be fetched one after another"
+        assert results == [(1, 0, 0, None)] * 6
+        assert len(storage.articles) == 6
+        assert sorted(log["source_name"] for log in storage.crawl_logs) == [
+            f"s{i}" for i in range(6)
+        ]
+
+    def test_respects_per_host_limit(self, logger):
+        sources = [_source(f"s{i}", "https://same.example/feed") for i in range(4)]
+        active = defaultdict(int)
+        peak = defaultdict(int)
+        lock = threading.Lock()
+
+        def tracking_fetch(src, **kwargs):
+            with lock:
+                active["same"] += 1
+                peak["same"] = max(peak["same"], active["same"])
+            time.sleep(0.05)
+            with lock:
+                active["same"] -= 1
+            return []
+
+        with patch.object(ingest_main, "_fetch_from_source", side_effect=tracking_fetch):
+            ingest_main._ingest_sources(
+                sources, FakeStorage(), False, logger, concurrency=8, per_host_limit=2
+            )
+
+        assert peak["same"] == 2
+
+    def test_failures_keep_source_order(self, logger):
+        sources = [_source(f"s{i}", f"https://host{i}.example/feed") for i in range(3)]
+
+        def flaky_fetch(src, **kwargs):
+            if src["name"] == "s1":
+                raise RuntimeError("boom")
+            return [{"id": src["name"], "title": "t", "url": src["url"]}]
+
+        storage = FakeStorage()
+        with patch.object(ingest_main, "_fetch_from_source", side_effect=flaky_fetch):
+            results = ingest_main._ingest_sources(
+                sources, storage, False, logger, concurrency=3, per_host_limit=1
+            )
+
+        assert [result.written for result in results] == [1, 0, 1]
+        assert results[1].error is not None
+        failed = [log for log in storage.crawl_logs if log["status"] == "failed"]
+        assert [log["source_name"] for log in failed] == ["s1"]
+
+    def test_dry_run_writes_nothing(self, logger):
+        sources = [_source("s0", "https://host.example/feed")]
+        storage = FakeStorage()
+        with patch.object(
+            ingest_main, "_fetch_from_source", return_value=[{"id": "x", "title": "t"}]
+        ):
+            results = ingest_main._ingest_sources(sources, storage, True, logger, concurrency=4)
+
+        assert results == [(0, 0, 0, None)]
+        assert storage.articles == []
+        assert storage.crawl_logs == []
+
+
+class TestBatchedWrites:
+    def test_articles_flushed_in_batches(self, logger):
+        sources = [_source("s0", "https://host.example/feed")]
+        items = [{"id": str(i), "title": "t"} for i in range(25)]
+        storage = FakeStorage()
+        with patch.object(ingest_main, "_fetch_from_source", return_value=items):
+            results = ingest_main._ingest_sources(sources, storage, False, logger, batch_size=10)
+
+        assert results == [(25, 0, 0, None)]
+        assert storage.batches == [10, 10, 5]
+
+    def test_failed_batch_falls_back_to_single_upserts(self, logger):
+        storage = FakeStorage()
+        with patch.object(storage, "upsert_articles", side_effect=RuntimeError("too big")):
+            written = ingest_main._flush_articles(storage, [{"id": "a"}, {"id": "b"}], logger)
+
+        assert written == 2
+        assert storage.articles == [{"id": "a"}, {"id": "b"}]
+
+
+class TestFeedValidatorCommit:
+    def _fetch_with_validators(self, committed):
+        class Validators:
+            def commit(self):
+                committed.append(True)
+
+        def fetch(src, pending_validators=None, **kwargs):
+            pending_validators.append(Validators())
+            return [{"id": "a", "title": "t"}, {"id": "b", "title": "t"}]
+
+        return fetch
+
+    def test_committed_after_articles_are_stored(self, logger):
+        committed = []
+        storage = FakeStorage()
+        with patch.object(
+            ingest_main, "_fetch_from_source", side_effect=self._fetch_with_validators(committed)
+        ):
+            ingest_main._ingest_sources(
+                [_source("s0", "https://a.example/feed")], storage, False, logger
+            )
+
+        assert committed == [True]
+        assert len(storage.articles) == 2
+
+    def test_not_committed_when_a_write_fails(self, logger):
+        committed = []
+        storage = FakeStorage()
+        down = RuntimeError("down")
+        with patch.object(
+            ingest_main, "_fetch_from_source", side_effect=self._fetch_with_validators(committed)
+        ), patch.object(storage, "upsert_articles", side_effect=down), patch.object(
+            storage, "upsert_article", side_effect=down
+        ):
+            ingest_main._ingest_sources(
+                [_source("s0", "https://a.example/feed")], storage, False, logger
+            )
+
+        assert committed == []
+
+
+class TestSeenIndexSkipping:
+    def test_second_run_skips_stored_articles(self, logger, tmp_path):
+        sources = [_source("s0", "https://host.example/feed")]
+        items = [
+            {"id": str(i), "title": f"t{i}", "url": f"https://a.example/{i}"} for i in range(3)
+        ]
+        seen = SeenIndex(tmp_path / "seen.db")
+        storage = FakeStorage()
+
+        with patch.object(ingest_main, "_fetch_from_source", return_value=items):
+            first = ingest_main._ingest_sources(sources, storage, False, logger, seen_index=seen)
+            second = ingest_main._ingest_sources(sources, storage, False, logger, seen_index=seen)
+
+        assert first == [(3, 0, 0, None)]
+        assert second == [(0, 3, 0, None)]
+        assert len(storage.articles) == 3
+
+    def test_changed_title_is_ingested_again(self, logger, tmp_path):
+        sources = [_source("s0", "https://host.example/feed")]
+        seen = SeenIndex(tmp_path / "seen.db")
+        seen.add_many([("https://a.example/1", "1", "old title")])
+
+        with patch.object(
+            ingest_main,
+            "_fetch_from_source",
+            return_value=[{"id": "1", "title": "new title", "url": "https://a.example/1"}],
+        ):
+            results = ingest_main._ingest_sources(
+                sources, FakeStorage(), False, logger, seen_index=seen
+            )
+
+        assert results == [(1, 0, 0, None)]
+
+    def test_failed_writes_are_not_marked_seen(self, logger, tmp_path):
+        seen = SeenIndex(tmp_path / "seen.db")
+        storage = FakeStorage()
+        down = RuntimeError("down")
+        with patch.object(storage, "upsert_articles", side_effect=down), patch.object(
+            storage, "upsert_article", side_effect=down
+        ):
+            ingest_main._flush_articles(
+                storage,
+                [{"id": "a", "url": "https://a.example/a", "title": "t"}],
+                logger,
+                lambda articles: ingest_main._record_written(articles, seen, None),
+            )
+
+        assert len(seen) == 0
+
+
+class TestNearDuplicateCollapsing:
+    def test_same_story_from_two_sources_is_written_once(self, logger, tmp_path):
+        sources = [
+            _source("hn", "https://hn.example/feed"),
+            _source("reddit", "https://reddit.example/feed"),
+        ]
+
+        def fetch(src, **kwargs):
+            title = "OpenAI releases GPT-5 with improved reasoning"
+            if src["name"] == "reddit":
+                title += " abilities"
+            return [{"id": src["name"], "title": title, "url": f"{src['url']}/gpt5"}]
+
+        near_duplicates = NearDuplicateIndex(tmp_path / "near.db")
+        storage = FakeStorage()
+        with patch.object(ingest_main, "_fetch_from_source", side_effect=fetch):
+            results = ingest_main._ingest_sources(
+                sources, storage, False, logger, near_duplicates=near_duplicates
+            )
+
+        assert results == [(1, 0, 0, None), (0, 0, 1, None)]
+        assert [article["id"] for article in storage.articles] == ["hn"]
+        assert near_duplicates.aliases_of("https://hn.example/feed/gpt5") == [
+            "https://reddit.example/feed/gpt5"
+        ]
+
+    def test_failed_write_releases_the_claim(self, logger, tmp_path):
+        title = "OpenAI releases GPT-5 with improved reasoning"
+        near_duplicates = NearDuplicateIndex(tmp_path / "near.db")
+        storage = FakeStorage()
+        down = RuntimeError("down")
+        with patch.object(
+            ingest_main,
+            "_fetch_from_source",
+            return_value=[{"id": "hn", "title": title, "url": "https://hn.example/gpt5"}],
+        ), patch.object(storage, "upsert_articles", side_effect=down), patch.object(
+            storage, "upsert_article", side_effect=down
+        ):
+            ingest_main._ingest_sources(
+                [_source("hn", "https://hn.example/feed")],
+                storage,
+                False,
+                logger,
+                near_duplicates=near_duplicates,
+            )
+
+        assert near_duplicates.find(title) is None
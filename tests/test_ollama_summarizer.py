@@ -0,0 +1,263 @@
+"""Tests for scripts/summarizers/ollama_summarizer.py against a local stub server"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests.adapters")
+
+from scripts.summarizers.ollama_summarizer import OllamaSummarizer, early_stop  # noqa: E402
+from scripts.summarizers.summary_cache import SummaryCache  # noqa: E402
+
+
+class StubOllama(ThreadingHTTPServer):
+    """Answers /api/generate after a delay, recording concurrency and connections
+
+    Streaming requests get the reply as NDJSON, two characters per token.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, delay=0.1, status=200):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.delay = delay
+        self.status = status
+        self.reply = None  # defaults to "摘要:<text>"
+        self.token_delay = 0.005
+        self.tokens_sent = 0
+        self.aborted = threading.Event()
+        self.prompts = []
+        self.clients = set()
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.prompts.append(payload["prompt"])
+            server.clients.add(self.client_address)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(server.delay)
+
+        text = payload["prompt"].split("\n\n")[1]
+        reply = server.reply if server.reply is not None else f" 摘要:{text} "
+        if payload.get("stream", True) and server.status == 200:
+            self._stream(reply)
+            return
+        self._finish()
+        body = json.dumps({"response": reply}).encode("utf-8")
+        self.send_response(server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _finish(self):
+        # Counted as done before the last bytes go out, so the client's next
+        # request never overlaps with this one
+        with self.server.lock:
+            self.server.active -= 1
+
+    def _stream(self, reply):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        tokens = [reply[i : i + 2] for i in range(0, len(reply), 2)]
+        chunks = [{"response": token, "done": False} for token in tokens]
+        chunks.append({"response": "", "done": True, "eval_count": len(tokens)})
+        try:
+            for chunk in chunks:
+                if chunk["done"]:
+                    self._finish()
+                line = json.dumps(chunk).encode("utf-8") + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.flush()
+                if not chunk["done"]:
+                    self.server.tokens_sent += 1
+                    time.sleep(self.server.token_delay)
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading: Ollama cancels the generation here
+            if not chunk["done"]:
+                self._finish()
+            self.server.aborted.set()
+            self.close_connection = True
+
+
+@pytest.fixture
+def server():
+    stub = StubOllama()
+    thread = threading.Thread(target=stub.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SummaryCache(str(tmp_path / "summaries.db"))
+    yield cache
+    cache.close()
+
+
+class TestSummarizeMany:
+    def test_results_follow_input_order(self, server, cache):
+        summarizer = OllamaSummarizer(server.url, parallel=4, cache=cache)
+
+        assert summarizer.summarize_many(["a", "b", "c"]) == ["摘要:a", "摘要:b", "摘要:c"]
+        assert summarizer.summarize_many([]) == []
+
+    def test_identical_texts_are_requested_once(self, server, cache):
+        summarizer = OllamaSummarizer(server.url, parallel=4, cache=cache)
+
+        summaries = summarizer.summarize_many(["same", "other", "same", "same"])
+
+        assert summaries == ["摘要:same", "摘要:other", "摘要:same", "摘要:same"]
+        assert len(server.prompts) == 2
+
+    def test_requests_run_in_parallel_up_to_the_limit(self, server, cache):
+        summarizer = OllamaSummarizer(server.url, parallel=4, cache=cache)
+        texts = [f"article {i}" for i in range(12)]
+
+        start = time.monotonic()
+        summarizer.summarize_many(texts)
+        elapsed = time.monotonic() - start
+
+        assert server.max_active == 4
+        assert elapsed < 12 * server.delay / 2
+        # Connections are pooled: at most one per parallel slot
+        assert len(server.clients) <= 4
+
+    def test_cache_survives_new_instances(self, server, tmp_path):
+        path = str(tmp_path / "summaries.db")
+        OllamaSummarizer(server.url, cache=SummaryCache(path)).summarize_many(["a", "b"])
+
+        fresh = OllamaSummarizer(server.url, cache=SummaryCache(path))
+        assert fresh.summarize_many(["a", "b"]) == ["摘要:a", "摘要:b"]
+        assert len(server.prompts) == 2
+
+        # A different model (or prompt) is a different cache key
+        fresh.model = "other-model"
+        fresh.summarize("a")
+        assert len(server.prompts) == 3
+
+        # So are the summary length and the streaming mode
+        fresh.summary_chars = 80
+        fresh.summarize("a")
+        fresh.stream = not fresh.stream
+        fresh.summarize("a")
+        assert len(server.prompts) == 5
+
+    def test_failures_fall_back_and_are_not_cached(self, server, cache):
+        server.status = 500
+        summarizer = OllamaSummarizer(server.url, cache=cache)
+        text = "正文" * 200
+
+        assert summarizer.summarize_many([text]) == [text[:200]]
+        assert len(cache) == 0
+
+
+class TestStreaming:
+    def test_stops_at_the_summary_budget(self, server, cache):
+        server.reply = "这是一段没有标点的很长的摘要" * 30
+        summarizer = OllamaSummarizer(server.url, cache=cache, summary_chars=50)
+
+        summary = summarizer.summarize("正文")
+
+        assert summary == server.reply[:50]
+        assert summarizer.last_metrics.stopped_early
+        assert server.aborted.wait(5)
+        assert server.tokens_sent < len(server.reply) // 2
+
+    def test_stops_at_a_sentence_boundary(self, server, cache):
+        first = "大模型推理成本下降，团队纷纷将长文本摘要部署到生产环境。"
+        server.reply = first + "此外还有很多补充说明" * 20
+        summarizer = OllamaSummarizer(server.url, cache=cache, summary_chars=50)
+
+        assert summarizer.summarize("正文") == first
+        assert summarizer.last_metrics.stopped_early
+
+    def test_short_reply_is_read_to_the_end(self, server, cache):
+        summarizer = OllamaSummarizer(server.url, cache=cache)
+
+        assert summarizer.summarize("短文") == "摘要:短文"
+        assert not summarizer.last_metrics.stopped_early
+
+    def test_reports_ttft_and_tokens_per_sec(self, server, cache):
+        server.reply = "这是一段没有标点的很长的摘要" * 30
+        summarizer = OllamaSummarizer(server.url, cache=cache, summary_chars=50)
+
+        summarizer.summarize_many(["a", "b"])
+        summarizer.summarize("c")
+        metrics = summarizer.last_metrics
+        stats = summarizer.generation_stats()
+
+        assert metrics.ttft >= server.delay
+        assert metrics.tokens == 25
+        assert metrics.tokens_per_sec > 0
+        assert stats["calls"] == 3 and stats["stopped_early"] == 3
+        assert stats["avg_ttft_s"] >= server.delay
+        assert stats["tokens_per_sec"] > 0
+
+    def test_blocking_mode_still_supported(self, server, cache):
+        summarizer = OllamaSummarizer(server.url, cache=cache, stream=False)
+
+        assert summarizer.summarize("a") == "摘要:a"
+        assert summarizer.last_metrics is None
+
+
+class TestEarlyStop:
+    def test_waits_for_more_text(self):
+        assert early_stop("还没写完", 50) is None
+        assert early_stop("短句。", 50) is None
+
+    def test_budget_prefers_last_sentence_end(self):
+        text = "第一句写得足够长" + "足够长" * 6 + "。第二句" + "还在继续" * 10
+
+        assert early_stop(text, 50) == text[: text.index("。") + 1]
+
+    def test_new_paragraph_ends_the_summary(self):
+        head = "摘要内容" * 7
+
+        assert early_stop(f"{head}\n\n说明：", 50) == head
+
+    def test_short_head_line_is_not_the_summary(self):
+        assert early_stop("摘要：\n大模型推理", 50) is None
+
+
+class TestSummarizeCoalescing:
+    def test_concurrent_identical_requests_share_one_call(self, server, cache):
+        summarizer = OllamaSummarizer(server.url, parallel=8, cache=cache)
+        results = []
+
+        def worker():
+            results.append(summarizer.summarize("shared text"))
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["摘要:shared text"] * 6
+        assert len(server.prompts) == 1
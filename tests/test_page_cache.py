@@ -0,0 +1,162 @@
+"""Tests for scripts/extractors/page_cache.py"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+pytest.importorskip("requests")  # scripts.extractors imports the Jina extractor
+
+from scripts.extractors import page_cache  # noqa: E402
+from scripts.extractors.page_cache import (  # noqa: E402
+    PageCache,
+    cached_text,
+    fetch_html,
+    probe_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PAGE_CACHE_DIR", str(tmp_path / "pages"))
+    monkeypatch.delenv("PAGE_CACHE_ENABLED", raising=False)
+    monkeypatch.setattr(page_cache, "_page_cache", None)
+    yield page_cache.get_page_cache()
+    page_cache.get_page_cache().close()
+
+
+def _blobs(cache):
+    return [p for p in cache.blob_dir.rglob("*.z")]
+
+
+class TestPageCache:
+    def test_round_trip_is_compressed(self, tmp_path):
+        cache = PageCache(tmp_path)
+        html = "<html>" + "内容" * 5000 + "</html>"
+        cache.put_html("https://ex.com/a", html)
+
+        assert cache.get_html("https://ex.com/a") == html
+        assert cache.get_html("https://ex.com/b") is None
+        assert cache.total_bytes < len(html.encode("utf-8")) / 10
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        cache = PageCache(tmp_path)
+        cache.put_html("https://ex.com/a", "same page " * 100)
+        cache.put_text("https://ex.com/a", "jina", "same page " * 100)
+
+        assert len(_blobs(cache)) == 1
+        assert cache.get_text("https://ex.com/a", "jina") == "same page " * 100
+
+    def test_expired_entries_miss(self, tmp_path):
+        cache = PageCache(tmp_path, ttl=0.05)
+        cache.put_html("https://ex.com/a", "page")
+        time.sleep(0.1)
+
+        assert cache.get_html("https://ex.com/a") is None
+        assert _blobs(cache) == []
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        page = os.urandom(1000).hex()  # ~1KB once compressed
+        cache = PageCache(tmp_path, max_bytes=3500)
+        cache.put_html("https://ex.com/1", page + "1")
+        cache.put_html("https://ex.com/2", page + "2")
+        cache.put_html("https://ex.com/3", page + "3")
+        assert cache.get_html("https://ex.com/1")  # 1 is now more recent than 2
+        cache.put_html("https://ex.com/4", page + "4")
+
+        assert cache.get_html("https://ex.com/2") is None
+        assert cache.get_html("https://ex.com/1") and cache.get_html("https://ex.com/4")
+        assert cache.total_bytes <= 3500
+
+    def test_persists_across_instances(self, tmp_path):
+        PageCache(tmp_path).put_text("https://ex.com/a", "trafilatura", "article")
+
+        reopened = PageCache(tmp_path)
+        assert reopened.get_text("https://ex.com/a", "trafilatura") == "article"
+        assert reopened.total_bytes > 0
+
+
+class TestCachedHelpers:
+    def test_fetch_html_downloads_once(self, cache):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return "<html>page</html>"
+
+        assert fetch_html("https://ex.com/a", fetch) == "<html>page</html>"
+        assert fetch_html("https://ex.com/a", fetch) == "<html>page</html>"
+        assert len(calls) == 1
+
+    def test_fetch_html_kinds_are_cached_separately(self, cache):
+        fetch_html("https://ex.com/a", lambda: "<html>blocked</html>")
+
+        html = fetch_html("https://ex.com/a", lambda: "<html>page</html>", kind="html:bypass")
+
+        assert html == "<html>page</html>"
+        assert fetch_html("https://ex.com/a", lambda: None) == "<html>blocked</html>"
+
+    def test_cached_text_skips_repeat_extraction(self, cache):
+        calls = []
+
+        class Extractor:
+            @cached_text("demo")
+            def extract(self, url):
+                calls.append(url)
+                return None if url.endswith("fail") else f"text of {url}"
+
+        extractor = Extractor()
+        assert extractor.extract("https://ex.com/a") == "text of https://ex.com/a"
+        assert extractor.extract("https://ex.com/a") == "text of https://ex.com/a"
+        assert extractor.extract("https://ex.com/fail") is None
+        assert extractor.extract("https://ex.com/fail") is None
+        assert calls == ["https://ex.com/a", "https://ex.com/fail", "https://ex.com/fail"]
+
+    def test_cached_text_wraps_coroutines(self, cache):
+        calls = []
+
+        @cached_text("demo")
+        async def extract(url):
+            calls.append(url)
+            return f"text of {url}"
+
+        for _ in range(2):
+            assert asyncio.run(extract("https://ex.com/a")) == "text of https://ex.com/a"
+        assert calls == ["https://ex.com/a"]
+
+    def test_probe_cache_reports_hits(self, cache):
+        @cached_text("demo")
+        def extract(url):
+            return f"text of {url}"
+
+        @cached_text("demo")
+        async def extract_async(url):
+            return f"text of {url}"
+
+        async def probed_async(url):
+            with probe_cache() as probe:
+                await extract_async(url)
+            return probe.hit
+
+        hits = []
+        for _ in range(2):
+            with probe_cache() as probe:
+                extract("https://ex.com/a")
+            hits.append(probe.hit)
+            hits.append(asyncio.run(probed_async("https://ex.com/b")))
+
+        assert hits == [False, False, True, True]
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setenv("PAGE_CACHE_ENABLED", "0")
+        calls = []
+
+        @cached_text("demo")
+        def extract(url):
+            calls.append(url)
+            return "text"
+
+        extract("https://ex.com/a")
+        extract("https://ex.com/a")
+        assert len(calls) == 2
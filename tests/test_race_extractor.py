@@ -0,0 +1,228 @@
+"""Tests for scripts/extractors/race_extractor.py"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+
+from scripts.extractors.race_extractor import RaceExtractor  # noqa: E402
+
+
+def _sleeper(delay, result):
+    def extract(url):
+        time.sleep(delay)
+        return result
+
+    return extract
+
+
+class _AsyncExtractor:
+    def __init__(self, delay, result):
+        self.delay = delay
+        self.result = result
+        self.cancelled = threading.Event()
+
+    async def extract_async(self, url):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        return self.result
+
+
+class TestRaceExtractor:
+    def test_returns_fastest_without_waiting_for_losers(self):
+        race = RaceExtractor([_sleeper(1.0, "slow"), _sleeper(0.05, "fast")], timeout=5)
+
+        start = time.time()
+        content, winner = race.race("https://ex.com")
+
+        assert (content, winner) == ("fast", 1)
+        assert time.time() - start < 0.5
+
+    def test_skips_invalid_results(self):
+        race = RaceExtractor([_sleeper(0.01, ""), _sleeper(0.01, "-1"), _sleeper(0.1, "ok")])
+
+        assert race.race("https://ex.com") == ("ok", 2)
+
+    def test_errors_and_timeout_return_none(self):
+        def boom(url):
+            raise RuntimeError("down")
+
+        race = RaceExtractor([boom, _sleeper(1.0, "late")], timeout=0.1)
+
+        assert race.race("https://ex.com") == (None, None)
+
+    def test_cancels_async_losers(self):
+        slow = _AsyncExtractor(5, "slow")
+        race = RaceExtractor([slow, _AsyncExtractor(0.01, "fast")])
+
+        assert race.race("https://ex.com") == ("fast", 1)
+        assert slow.cancelled.wait(1)
+
+    def test_races_many_urls_concurrently(self):
+        race = RaceExtractor([lambda url: (time.sleep(0.1), url.upper())[1]])
+        urls = [f"https://ex.com/{i}" for i in range(10)]
+
+        start = time.time()
+        results = race.race_many(urls, max_concurrency=10)
+
+        assert {url: content for url, (content, _) in results.items()} == {
+            url: url.upper() for url in urls
+        }
+        assert time.time() - start < 0.6
+
+    def test_winner_is_tracked_per_thread(self):
+        race = RaceExtractor([_sleeper(0.01, "a")])
+
+        assert race.extract("https://ex.com") == "a"
+        assert race.get_winner_method() == 0
+
+
+class TestFastExtractorRouting:
+    def _fast(self, tmp_path, trafilatura, jina):
+        from scripts.extractors.race_extractor import FastExtractor
+        from scripts.extractors.routing import ExtractorRouter
+
+        fast = FastExtractor(trafilatura, jina, router=ExtractorRouter(tmp_path / "r.db"))
+        for name in ("google-cache", "wayback", "bypass"):
+            fast.extractors[name] = lambda url: None
+        return fast
+
+    def test_cold_start_races_trafilatura_and_jina(self, tmp_path):
+        calls = []
+
+        def trafilatura(url):
+            calls.append("trafilatura")
+            return "article"
+
+        def jina(url):
+            calls.append("jina")
+            time.sleep(0.05)
+            return None
+
+        fast = self._fast(tmp_path, trafilatura, jina)
+
+        assert fast.extract("https://site.example/a") == ("article", "trafilatura")
+        time.sleep(0.1)
+        assert sorted(calls) == ["jina", "trafilatura"]
+
+    def test_reliable_extractor_runs_alone(self, tmp_path):
+        calls = []
+
+        def trafilatura(url):
+            calls.append("trafilatura")
+            return "article"
+
+        def jina(url):
+            calls.append("jina")
+            return "article"
+
+        fast = self._fast(tmp_path, trafilatura, jina)
+        for _ in range(fast.router.SKIP_AFTER_FAILURES):
+            fast.router.record("https://site.example/x", "trafilatura", "article", 0.1)
+
+        assert fast.extract("https://site.example/a") == ("article", "trafilatura")
+        time.sleep(0.05)
+        assert calls == ["trafilatura"]
+
+    def test_failures_are_recorded_and_fallback_used(self, tmp_path):
+        fast = self._fast(tmp_path, lambda url: None, lambda url: None)
+        fast.extractors["wayback"] = lambda url: "archived"
+
+        assert fast.extract("https://site.example/a") == ("archived", "wayback")
+        time.sleep(0.05)
+        assert fast.router.stats("https://site.example/a", "trafilatura").attempts == 1
+        assert fast.router.stats("https://site.example/a", "wayback").successes == 1
+
+    def test_component_that_fails_to_load_is_skipped(self, tmp_path):
+        from scripts.components import Deferred
+        from scripts.extractors.race_extractor import FastExtractor
+        from scripts.extractors.routing import ExtractorRouter
+
+        def load_crawl4ai():
+            raise ValueError("signal only works in main thread")
+
+        fast = FastExtractor(
+            lambda url: None,
+            lambda url: None,
+            Deferred(load_crawl4ai),
+            router=ExtractorRouter(tmp_path / "r.db"),
+        )
+        for name in ("google-cache", "bypass"):
+            fast.extractors[name] = lambda url: None
+        fast.extractors["wayback"] = lambda url: "archived"
+
+        assert fast.extract("https://site.example/a") == ("archived", "wayback")
+
+    def test_async_loser_is_cancelled_and_not_recorded(self, tmp_path):
+        loser = _AsyncExtractor(5, "late article")
+        fast = self._fast(tmp_path, lambda url: "article", loser)
+
+        assert fast.extract("https://site.example/a") == ("article", "trafilatura")
+        assert loser.cancelled.wait(1)
+        assert fast.router.stats("https://site.example/a", "jina").attempts == 0
+
+    def test_cache_hits_are_not_recorded(self, tmp_path):
+        from scripts.extractors.page_cache import cached_text
+
+        @cached_text("trafilatura")
+        def trafilatura(url):
+            time.sleep(0.05)
+            return "article"
+
+        fast = self._fast(tmp_path, trafilatura, lambda url: None)
+
+        for _ in range(3):
+            assert fast.extract("https://site.example/a") == ("article", "trafilatura")
+        time.sleep(0.05)
+        stats = fast.router.stats("https://site.example/a", "trafilatura")
+        assert stats.attempts == 1
+        assert stats.avg_latency >= 0.05
+
+
+class TestJinaExtractAsync:
+    def _jina(self, monkeypatch, handler):
+        httpx = pytest.importorskip("httpx")
+        from scripts.extractors import jina_extractor
+
+        monkeypatch.setenv("PAGE_CACHE_ENABLED", "0")
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(jina_extractor, "_get_async_client", lambda: client)
+        return jina_extractor.JinaExtractor(api_key="key")
+
+    def test_parses_json_response(self, monkeypatch):
+        httpx = pytest.importorskip("httpx")
+
+        async def handler(request):
+            assert request.headers["Authorization"] == "Bearer key"
+            return httpx.Response(200, json={"code": 200, "data": {"content": "正文" * 100}})
+
+        jina = self._jina(monkeypatch, handler)
+
+        assert asyncio.run(jina.extract_async("https://site.example/a")) == "正文" * 100
+
+    def test_cancellation_interrupts_request(self, monkeypatch):
+        started = threading.Event()
+
+        async def handler(request):
+            started.set()
+            await asyncio.sleep(5)
+
+        jina = self._jina(monkeypatch, handler)
+
+        async def race():
+            task = asyncio.ensure_future(jina.extract_async("https://site.example/a"))
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        start = time.monotonic()
+        asyncio.run(race())
+        assert time.monotonic() - start < 1
@@ -0,0 +1,707 @@
+"""Tests for ingestor/storage adapters"""
+
+import asyncio
+import gc
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from ingestor.storage.d1_adapter import D1StorageAdapter, get_d1_http_client
+from ingestor.storage.db import LocalDBAdapter
+from ingestor.storage.near_duplicates import NearDuplicateIndex, minhash, similarity
+from ingestor.storage.seen_index import BloomFilter, SeenIndex, normalize_url
+
+
+def _article(i):
+    return {
+        "id": f"article-{i}",
+        "title": f"Article {i}",
+        "content": "",
+        "url": f"https://example.com/{i}",
+        "published_at": None,
+        "source": "test",
+        "categories": [],
+        "tags": [],
+        "summary": None,
+        "raw_markdown": None,
+        "ingested_at": datetime(2024, 1, 1, 0, 0, i % 60),
+    }
+
+
+class _AttrArticle(dict):
+    """Dict that also exposes keys as attributes, like ArticleModel."""
+
+    __getattr__ = dict.get
+
+
+@pytest.fixture
+def local_db(tmp_path):
+    return LocalDBAdapter(str(tmp_path / "test.db"))
+
+
+@pytest.fixture
+def d1_adapter():
+    return D1StorageAdapter("account", "database", "token")
+
+
+class TestLocalDBUpsertArticles:
+    def test_writes_all_rows_in_one_transaction(self, local_db):
+        articles = [_AttrArticle(_article(i)) for i in range(250)]
+
+        assert local_db.upsert_articles(articles) == 250
+
+        with local_db._get_connection() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        assert total == 250
+
+    def test_replaces_existing_rows(self, local_db):
+        local_db.upsert_articles([_AttrArticle(_article(1))])
+        updated = _AttrArticle(_article(1), title="Updated")
+        local_db.upsert_articles([updated])
+
+        with local_db._get_connection() as conn:
+            rows = conn.execute("SELECT title FROM articles").fetchall()
+        assert [row["title"] for row in rows] == ["Updated"]
+
+    def test_empty_input(self, local_db):
+        assert local_db.upsert_articles([]) == 0
+
+
+class TestLocalDBConnections:
+    def test_reuses_one_connection_per_thread(self, local_db):
+        conn = local_db._get_connection()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(local_db._get_connection()))
+        thread.start()
+        thread.join()
+
+        assert local_db._get_connection() is conn
+        assert other[0] is not conn
+        assert local_db.get_stats()["total"] == 0
+
+    def test_closes_connection_when_thread_exits(self, local_db):
+        local_db._get_connection()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(local_db._get_connection()))
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            other[0].execute("SELECT 1")
+        assert sum(f.alive for f in local_db._finalizers) == 1
+
+    def test_close_releases_connections(self, local_db):
+        conn = local_db._get_connection()
+        local_db.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        # The adapter reconnects on next use
+        local_db.upsert_articles([_AttrArticle(_article(1))])
+        assert local_db.get_stats()["total"] == 1
+
+
+class TestD1UpsertArticles:
+    def test_packs_rows_into_few_requests(self, d1_adapter):
+        articles = [_article(i) for i in range(300)]
+
+        def answer(payload):
+            return {"success": True, "result": [{"results": []} for _ in payload["batch"]]}
+
+        with patch.object(d1_adapter, "_post_query", side_effect=answer) as post:
+            assert d1_adapter.upsert_articles(articles) == 300
+
+        statements = [stmt for call in post.call_args_list for stmt in call.args[0]["batch"]]
+        per_statement = D1StorageAdapter.UPSERT_ROWS_PER_STATEMENT
+        assert len(statements) == -(-300 // per_statement)
+        assert post.call_count == -(-len(statements) // D1StorageAdapter.STATEMENTS_PER_REQUEST)
+        assert all(len(stmt["params"]) <= 100 for stmt in statements)
+        assert sum(len(stmt["params"]) for stmt in statements) == 300 * 12
+
+    def test_empty_input_makes_no_request(self, d1_adapter):
+        with patch.object(d1_adapter, "_post_query") as post:
+            assert d1_adapter.upsert_articles([]) == 0
+        post.assert_not_called()
+
+
+class _MockD1Handler(BaseHTTPRequestHandler):
+    """Minimal Cloudflare D1 /query endpoint backed by canned results"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append((self.path, self.headers["Authorization"], payload))
+            server.ports.add(self.client_address[1])
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+
+        statements = payload.get("batch", [payload])
+        entries = [self._answer(statement["sql"]) for statement in statements]
+        if any(entry == "FAIL" for entry in entries):
+            status, body = 200, {"success": False, "errors": [{"message": "no such table"}]}
+        elif any(entry == "BOOM" for entry in entries):
+            status, body = 500, {"success": False}
+        else:
+            status, body = 200, {"success": True, "result": entries[: server.max_results]}
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _answer(self, sql):
+        if "FAIL" in sql or "BOOM" in sql:
+            return "FAIL" if "FAIL" in sql else "BOOM"
+        if "GROUP BY source" in sql:
+            rows = [{"source": "rss", "count": 7}]
+        elif "GROUP BY status" in sql:
+            rows = [{"status": "success", "count": 5}, {"status": "failed", "count": 2}]
+        elif "pragma_table_info" in sql:
+            rows = [{"present": int(self.server.has_column)}]
+        elif "FROM articles WHERE" in sql:
+            row = dict(_article(1), categories="[]", tags="[]", ingested_at="2024-01-01T00:00:01")
+            rows = [row] if self.server.has_articles else []
+        else:
+            rows = [{"total": 7}]
+        return {"results": rows, "success": True, "meta": {}}
+
+
+class _MockD1Server(ThreadingHTTPServer):
+    # Room for every concurrent test connection in the accept queue
+    request_queue_size = 64
+    daemon_threads = True
+
+
+@pytest.fixture
+def mock_d1():
+    httpd = _MockD1Server(("127.0.0.1", 0), _MockD1Handler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.ports = set()
+    httpd.active = 0
+    httpd.peak = 0
+    httpd.delay = 0
+    httpd.has_column = True
+    httpd.has_articles = True
+    httpd.max_results = None
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _mock_d1_adapter(server, adapter_class=D1StorageAdapter, **kwargs):
+    kwargs.setdefault("pool_size", 4)
+    adapter = adapter_class(
+        "account",
+        "database",
+        "token",
+        base_url=f"http://127.0.0.1:{server.server_address[1]}/client/v4",
+        **kwargs,
+    )
+    if adapter_class is D1StorageAdapter:
+        adapter._http._proxies = {}
+    return adapter
+
+
+class TestD1Connection:
+    def test_queries_reuse_one_keep_alive_connection(self, mock_d1):
+        adapter = _mock_d1_adapter(mock_d1)
+
+        for _ in range(5):
+            assert adapter.get_stats()["total"] == 7
+
+        assert len(mock_d1.requests) == 5
+        assert len(mock_d1.ports) == 1
+        path, auth, payload = mock_d1.requests[0]
+        assert path == "/client/v4/accounts/account/d1/database/database/query"
+        assert auth == "Bearer token"
+        assert payload["batch"][0] == {
+            "sql": "SELECT COUNT(*) as total FROM articles",
+            "params": [],
+        }
+        adapter.close()
+
+    def test_pool_size_caps_concurrent_connections(self, mock_d1):
+        mock_d1.delay = 0.05
+        adapter = _mock_d1_adapter(mock_d1, pool_size=2)
+        threads = [
+            threading.Thread(target=adapter._execute_sql, args=("SELECT 1",)) for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_d1.peak == 2
+        assert len(mock_d1.ports) == 2
+        adapter.close()
+
+    def test_api_and_http_errors_are_raised(self, mock_d1):
+        adapter = _mock_d1_adapter(mock_d1)
+
+        with pytest.raises(Exception, match="D1 API error: no such table"):
+            adapter._execute_sql("SELECT FAIL")
+        with pytest.raises(Exception, match="D1 HTTP error 500"):
+            adapter._execute_sql("SELECT BOOM")
+        # The connection is still usable after errors
+        assert adapter._execute_sql("SELECT 1")["success"]
+        assert len(mock_d1.ports) == 1
+        adapter.close()
+
+    def test_timeout_applies_to_requests(self, mock_d1):
+        mock_d1.delay = 0.5
+        adapter = _mock_d1_adapter(mock_d1, timeout=0.1)
+
+        with pytest.raises(OSError):
+            adapter._execute_sql("SELECT 1")
+        adapter.close()
+
+    def test_records_response_times(self, mock_d1):
+        mock_d1.delay = 0.02
+        adapter = _mock_d1_adapter(mock_d1)
+
+        adapter._execute_sql("SELECT 1")
+        adapter._execute_batch([("SELECT 1", []), ("SELECT 2", [])])
+        with pytest.raises(Exception):
+            adapter._execute_sql("SELECT FAIL")
+        stats = adapter.query_stats()
+
+        assert stats["requests"] == 3
+        assert stats["statements"] == 4
+        assert stats["errors"] == 1
+        assert stats["avg_ms"] >= 20
+        assert stats["max_ms"] >= stats["p95_ms"] >= stats["p50_ms"] >= 20
+        adapter.close()
+
+    def test_default_adapters_share_the_process_pool(self):
+        first = D1StorageAdapter("account", "database", "token")
+        second = D1StorageAdapter("other", "database", "token")
+
+        assert first._http is second._http is get_d1_http_client()
+        # Closing one adapter must not tear down the shared pool
+        with patch.object(first._http, "close") as close:
+            first.close()
+        close.assert_not_called()
+
+
+class TestD1Batch:
+    def test_results_are_split_per_statement(self, mock_d1):
+        adapter = _mock_d1_adapter(mock_d1)
+
+        results = adapter.batch(
+            [("SELECT COUNT(*) as total FROM articles", None), ("SELECT ? GROUP BY source", [1])]
+        )
+
+        assert [result["results"] for result in results] == [
+            [{"total": 7}],
+            [{"source": "rss", "count": 7}],
+        ]
+        assert mock_d1.requests[0][2]["batch"][1]["params"] == [1]
+        assert adapter.batch([]) == []
+        assert len(mock_d1.requests) == 1
+        adapter.close()
+
+    def test_large_batches_are_chunked(self, mock_d1):
+        adapter = _mock_d1_adapter(mock_d1)
+
+        results = adapter.batch([(f"SELECT {i}", None) for i in range(60)])
+
+        assert len(results) == 60
+        assert [len(request[2]["batch"]) for request in mock_d1.requests] == [25, 25, 10]
+        adapter.close()
+
+    def test_errors_and_missing_results_are_raised(self, mock_d1):
+        adapter = _mock_d1_adapter(mock_d1)
+
+        with pytest.raises(Exception, match="D1 API error"):
+            adapter.batch([("SELECT 1", None), ("SELECT FAIL", None)])
+        mock_d1.max_results = 1
+        with pytest.raises(Exception, match="1 results for 2 statements"):
+            adapter.batch([("SELECT 1", None), ("SELECT 2", None)])
+        adapter.close()
+
+    def test_stats_take_one_request(self, mock_d1):
+        adapter = _mock_d1_adapter(mock_d1)
+
+        assert adapter.get_stats() == {"total": 7, "sources": {"rss": 7}}
+        crawl_stats = adapter.get_crawl_stats()
+
+        assert crawl_stats["total_crawls"] == 7
+        assert crawl_stats["status_counts"] == {"success": 5, "failed": 2}
+        assert len(mock_d1.requests) == 2
+        assert len(mock_d1.requests[1][2]["batch"]) == 4
+        adapter.close()
+
+    def test_ensure_schema_takes_one_request(self, mock_d1):
+        adapter = _mock_d1_adapter(mock_d1)
+
+        adapter.ensure_schema()
+
+        assert len(mock_d1.requests) == 1
+        assert len(mock_d1.requests[0][2]["batch"]) == 6
+        adapter.close()
+
+    def test_ensure_schema_adds_missing_column(self, mock_d1):
+        mock_d1.has_column = False
+        adapter = _mock_d1_adapter(mock_d1)
+
+        adapter.ensure_schema()
+
+        assert len(mock_d1.requests) == 2
+        assert mock_d1.requests[1][2]["sql"].startswith("ALTER TABLE articles")
+        adapter.close()
+
+
+class TestAsyncD1Adapter:
+    @pytest.fixture(autouse=True)
+    def _requires_httpx(self):
+        pytest.importorskip("httpx")
+
+    def _adapter(self, server, **kwargs):
+        from ingestor.storage.async_d1_adapter import AsyncD1StorageAdapter
+
+        return _mock_d1_adapter(server, AsyncD1StorageAdapter, **kwargs)
+
+    def test_matches_the_sync_adapter(self, mock_d1):
+        sync_adapter = _mock_d1_adapter(mock_d1)
+
+        async def run():
+            adapter = self._adapter(mock_d1)
+            results = (
+                await adapter.get_stats(),
+                await adapter.get_crawl_stats(),
+                await adapter.get_crawl_logs(limit=5),
+                len(await adapter.fetch_articles({"source": "test"})),
+            )
+            await adapter.aclose()
+            return results
+
+        assert asyncio.run(run()) == (
+            sync_adapter.get_stats(),
+            sync_adapter.get_crawl_stats(),
+            sync_adapter.get_crawl_logs(limit=5),
+            len(sync_adapter.fetch_articles({"source": "test"})),
+        )
+        sync_adapter.close()
+
+    def test_concurrent_queries_do_not_block_each_other(self, mock_d1):
+        mock_d1.delay = 0.2
+
+        async def run():
+            adapter = self._adapter(mock_d1, pool_size=10)
+            start = time.monotonic()
+            results = await asyncio.gather(*(adapter.get_stats() for _ in range(10)))
+            elapsed = time.monotonic() - start
+            await adapter.aclose()
+            return results, elapsed, adapter.query_stats()
+
+        results, elapsed, stats = asyncio.run(run())
+
+        assert all(result["total"] == 7 for result in results)
+        assert mock_d1.peak >= 5
+        assert elapsed < 1.0, "Ten queries on one event loop should overlap"
+        assert stats["requests"] == 10 and stats["statements"] == 20
+
+    def test_keeps_connections_alive_and_raises_errors(self, mock_d1):
+        async def run():
+            adapter = self._adapter(mock_d1)
+            for _ in range(3):
+                await adapter.get_crawl_logs()
+            with pytest.raises(Exception, match="D1 API error: no such table"):
+                await adapter._execute_sql("SELECT FAIL")
+            with pytest.raises(Exception, match="D1 HTTP error 500"):
+                await adapter._execute_sql("SELECT BOOM")
+            await adapter.aclose()
+
+        asyncio.run(run())
+
+        assert len(mock_d1.requests) == 5
+        assert len(mock_d1.ports) == 1
+
+    def test_default_adapters_share_the_loop_pool(self):
+        from ingestor.storage.async_d1_adapter import (
+            AsyncD1StorageAdapter,
+            get_async_d1_http_client,
+        )
+
+        async def run():
+            first = AsyncD1StorageAdapter("account", "database", "token")
+            second = AsyncD1StorageAdapter("other", "database", "token")
+            return first._client(), second._client(), get_async_d1_http_client()
+
+        first, second, shared = asyncio.run(run())
+
+        assert first is second is shared
+        assert asyncio.run(run())[0] is not first, "Each event loop gets its own pool"
+
+
+class TestAsyncRoutes:
+    """The v2 and daily routes served on one event loop over the stub D1 server"""
+
+    @pytest.fixture
+    def d1_app(self, mock_d1, monkeypatch):
+        pytest.importorskip("fastapi")
+        pytest.importorskip("httpx")
+        from fastapi import FastAPI
+        from api.storage import app_storage
+        from api.v2 import daily_router, v2_router
+        from ingestor.storage.async_d1_adapter import AsyncD1StorageAdapter
+
+        d1_config = SimpleNamespace(database=SimpleNamespace(provider="d1"))
+        monkeypatch.setattr(app_storage, "load_config_from_env", lambda: d1_config)
+        monkeypatch.setattr(
+            app_storage, "get_storage_adapter", lambda config: _mock_d1_adapter(mock_d1)
+        )
+        monkeypatch.setattr(
+            app_storage,
+            "get_async_storage_adapter",
+            lambda config, dedicated_pool=False: _mock_d1_adapter(
+                mock_d1, AsyncD1StorageAdapter, pool_size=20
+            ),
+        )
+        mock_d1.has_articles = False
+
+        app = FastAPI(lifespan=app_storage.storage_lifespan)
+        app.include_router(v2_router)
+        app.include_router(daily_router)
+        return app
+
+    def _get_all(self, app, paths):
+        """GET the paths concurrently from one event loop; return (responses, seconds)"""
+        import httpx
+
+        async def run():
+            async with app.router.lifespan_context(app):
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://api") as client:
+                    start = time.monotonic()
+                    responses = await asyncio.gather(*(client.get(path) for path in paths))
+                    return responses, time.monotonic() - start
+
+        return asyncio.run(run())
+
+    def test_concurrent_requests_overlap(self, d1_app, mock_d1):
+        mock_d1.delay = 0.2
+
+        responses, elapsed = self._get_all(d1_app, ["/api/v2/stats"] * 10)
+
+        assert [response.status_code for response in responses] == [200] * 10
+        assert all(response.json()["total_articles"] == 7 for response in responses)
+        assert mock_d1.peak >= 5
+        assert elapsed < 1.0, "Ten requests on one worker should overlap"
+
+    def test_articles_fetches_page_and_stats_together(self, d1_app, mock_d1):
+        mock_d1.delay = 0.1
+
+        (response,), elapsed = self._get_all(d1_app, ["/api/v2/articles?source=rss"])
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 7
+        assert len(mock_d1.requests) == 2
+        assert mock_d1.peak == 2
+        assert elapsed < 0.2
+
+    def test_daily_and_crawl_routes(self, d1_app, mock_d1):
+        responses, _ = self._get_all(
+            d1_app, ["/api/v2/daily/latest", "/api/v2/crawl-logs", "/api/v2/crawl-stats"]
+        )
+
+        assert [response.status_code for response in responses] == [200] * 3
+        assert responses[0].json()["hotspots"] == []
+        assert responses[2].json()["status_counts"] == {"success": 5, "failed": 2}
+
+    def test_unsupported_crawl_logs_return_501(self, d1_app):
+        from api.storage.app_storage import get_article_dao
+        from api.storage.dao import AsyncArticleDAO
+
+        async def get_stats():
+            return {"total": 0, "sources": {}}
+
+        dao = AsyncArticleDAO(SimpleNamespace(get_stats=get_stats))
+        d1_app.dependency_overrides[get_article_dao] = lambda: dao
+
+        responses, _ = self._get_all(
+            d1_app, ["/api/v2/crawl-logs", "/api/v2/crawl-stats", "/api/v2/stats"]
+        )
+
+        assert [response.status_code for response in responses] == [501, 501, 200]
+
+    def test_blocking_adapter_runs_in_threads(self, local_db):
+        from api.storage.dao import AsyncArticleDAO
+
+        get_stats = local_db.get_stats
+
+        def slow_stats():
+            time.sleep(0.1)
+            return get_stats()
+
+        local_db.get_stats = slow_stats
+        dao = AsyncArticleDAO(local_db)
+
+        async def run():
+            start = time.monotonic()
+            results = await asyncio.gather(*(dao.get_stats() for _ in range(5)))
+            return results, time.monotonic() - start
+
+        results, elapsed = asyncio.run(run())
+
+        assert [result["total"] for result in results] == [0] * 5
+        assert elapsed < 0.3, "Blocking queries should run in worker threads"
+
+
+class TestNormalizeUrl:
+    def test_strips_tracking_fragment_and_trailing_slash(self):
+        assert (
+            normalize_url("HTTPS://Example.com:443/Post/?utm_source=x&b=2&a=1#comments")
+            == "https://example.com/Post?a=1&b=2"
+        )
+
+    def test_keeps_non_default_port(self):
+        assert normalize_url("http://example.com:8080/a") == "http://example.com:8080/a"
+
+
+class TestSeenIndex:
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        keys = [f"https://example.com/{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+        false_positives = sum(f"https://other.com/{i}" in bloom for i in range(1000))
+        assert false_positives < 50
+
+    def test_filter_new_skips_seen_urls(self, tmp_path):
+        index = SeenIndex(tmp_path / "seen.db")
+        index.add_many([("https://example.com/1?utm_medium=rss", "a1", "Title")])
+
+        new, skipped = index.filter_new(
+            [
+                {"url": "https://example.com/1", "title": "Title"},
+                {"url": "https://example.com/2", "title": "Other"},
+            ]
+        )
+
+        assert skipped == 1
+        assert [item["url"] for item in new] == ["https://example.com/2"]
+
+    def test_persists_across_instances(self, tmp_path):
+        SeenIndex(tmp_path / "seen.db").add_many([(None, "id-only", "Title")])
+
+        reopened = SeenIndex(tmp_path / "seen.db")
+        assert reopened.is_seen("id:id-only")
+
+    def test_warms_from_local_db(self, tmp_path, local_db):
+        local_db.upsert_articles([_AttrArticle(_article(i)) for i in range(5)])
+        index = SeenIndex(tmp_path / "seen.db")
+
+        assert index.warm_from_storage(local_db) == 5
+        assert index.warm_from_storage(local_db) == 0
+        _, skipped = index.filter_new([{"url": "https://example.com/3", "title": "Article 3"}])
+        assert skipped == 1
+
+    def test_set_interface(self, tmp_path):
+        index = SeenIndex(tmp_path / "seen.db")
+        index.add("https://example.com/a")
+
+        assert "https://example.com/a" in index
+        assert "https://example.com/b" not in index
+        assert "https://example.com/a" in SeenIndex(tmp_path / "seen.db")
+
+    def test_ttl_expires_entries(self, tmp_path):
+        index = SeenIndex(tmp_path / "seen.db", ttl=3600)
+        index.add("https://example.com/new")
+        index._conn.execute(
+            "INSERT INTO seen (key, fingerprint, seen_at) VALUES (?, NULL, ?)",
+            ("https://example.com/old", "2000-01-01T00:00:00"),
+        )
+        index._conn.commit()
+        index._filter.add("https://example.com/old")
+
+        assert "https://example.com/old" not in index
+        assert "https://example.com/new" in index
+        assert index.expire() == 1
+        assert len(index) == 1
+
+
+class TestNearDuplicateIndex:
+    def test_similar_titles_score_high(self):
+        a = minhash("Meta open-sources Llama 4 models")
+        b = minhash("Meta open sources Llama 4 models today")
+        c = minhash("Python 3.13 released with free-threading")
+
+        assert similarity(a, b) >= 0.7
+        assert similarity(a, c) < 0.3
+
+    def test_cjk_titles_use_bigrams(self):
+        a = minhash("OpenAI 发布 GPT-5 推理能力大幅提升")
+        b = minhash("OpenAI发布GPT-5：推理能力大幅提升")
+
+        assert similarity(a, b) >= 0.9
+
+    def test_short_titles_are_not_clustered(self):
+        assert minhash("AI news") is None
+
+    def test_collapses_and_persists(self, tmp_path):
+        index = NearDuplicateIndex(tmp_path / "near.db")
+        index.add_many([("https://a.example/1", "Google DeepMind unveils Gemini 2 model", None)])
+
+        items = [
+            {"url": "https://b.example/x", "title": "Google DeepMind unveils Gemini 2 model!"},
+            {"url": "https://b.example/y", "title": "Rust 1.80 brings new async features"},
+        ]
+        distinct, collapsed = index.filter_new(items, lambda item: item["url"])
+
+        assert collapsed == 1
+        assert [item["url"] for item in distinct] == ["https://b.example/y"]
+        reopened = NearDuplicateIndex(tmp_path / "near.db")
+        assert reopened.find("Google DeepMind unveils Gemini 2 model") == "https://a.example/1"
+        assert reopened.aliases_of("https://a.example/1") == ["https://b.example/x"]
+
+    def test_release_frees_claims_of_unstored_items(self, tmp_path):
+        index = NearDuplicateIndex(tmp_path / "near.db")
+        title = "Google DeepMind unveils Gemini 2 model"
+        key_of = lambda item: item["url"]  # noqa: E731
+        index.filter_new([{"url": "https://a.example/1", "title": title}], key_of)
+        _, collapsed = index.filter_new([{"url": "https://b.example/1", "title": title}], key_of)
+        assert collapsed == 1
+
+        index.release(["https://a.example/1"])
+
+        assert len(index) == 0
+        assert index.find(title) is None
+        assert index.aliases_of("https://a.example/1") == []
+
+    def test_release_keeps_stored_articles(self, tmp_path):
+        index = NearDuplicateIndex(tmp_path / "near.db")
+        title = "Google DeepMind unveils Gemini 2 model"
+        index.filter_new([{"url": "https://a.example/1", "title": title}], lambda i: i["url"])
+        index.add_many([("https://a.example/1", title, None)])
+
+        index.release(["https://a.example/1"])
+
+        assert index.find(title) == "https://a.example/1"
+
+    def test_threshold_is_validated(self, tmp_path):
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(tmp_path / "near.db", threshold=0)
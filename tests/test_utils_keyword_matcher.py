@@ -0,0 +1,102 @@
+"""Tests for utils/keyword_matcher.py"""
+
+from utils.keyword_matcher import KeywordMatcher, get_matcher, rules_version
+from api.classifier import CATEGORY_RULES, TAG_RULES, classify
+
+
+def _naive_count(table, text):
+    text_lower = text.lower()
+    scores = {}
+    for label, keywords in table.items():
+        score = sum(1 for kw in keywords if kw.lower() in text_lower)
+        if score:
+            scores[label] = score
+    return scores
+
+
+class TestKeywordMatcher:
+    """Test KeywordMatcher class"""
+
+    def test_counts_overlapping_keywords(self):
+        """Test keywords nested in other keywords are all counted"""
+        matcher = KeywordMatcher({"model": ["GPT", "GPT-4", "PT-4o"], "chip": ["GPU"]})
+
+        (scores,) = matcher.count("New gpt-4o release")
+        assert scores == {"model": 3}
+
+    def test_case_insensitive(self):
+        """Test matching ignores case like str.lower()"""
+        matcher = KeywordMatcher({"ai": ["OpenAI"]})
+
+        assert matcher.count("OPENAI ships") == [{"ai": 1}]
+        assert matcher.find("openai ships") == ["openai"]
+
+    def test_duplicate_keywords_keep_weight(self):
+        """Test keywords listed twice count twice, as in the naive scan"""
+        matcher = KeywordMatcher({"产品": ["发布", "新品", "发布"]})
+
+        assert matcher.count("阿里发布新品") == [{"产品": 3}]
+
+    def test_multiple_tables_in_one_pass(self):
+        """Test category and tag tables are matched together in label order"""
+        matcher = KeywordMatcher({"b": ["芯片"], "a": ["芯片"]}, {"tag": ["GPU"]})
+
+        scores, tags = matcher.count("GPU 芯片")
+        assert list(scores) == ["b", "a"]
+        assert tags == {"tag": 1}
+
+    def test_matches_naive_scan(self):
+        """Test results agree with the per-keyword substring scan"""
+        matcher = KeywordMatcher(CATEGORY_RULES, TAG_RULES)
+        texts = [
+            "马斯克发布新款特斯拉AI芯片",
+            "阿里云发布新一代大模型，GPT-4 对比",
+            "腾讯财报营收增长20%，融资上市",
+            "研究人员提出新的NLP算法，数据泄露引发安全担忧",
+            "",
+        ]
+
+        for text in texts:
+            assert matcher.count(text) == [
+                _naive_count(CATEGORY_RULES, text),
+                _naive_count(TAG_RULES, text),
+            ]
+
+
+class TestMatcherCache:
+    """Test get_matcher caching"""
+
+    def test_same_rules_compile_once(self):
+        """Test equal rule sets share a compiled matcher"""
+        first = get_matcher({"x": ["alpha", "beta"]})
+        second = get_matcher({"x": ["alpha", "beta"]})
+
+        assert first is second
+
+    def test_changed_rules_recompile(self):
+        """Test editing the rules changes the version and the matcher"""
+        rules = {"x": ["alpha"]}
+        version = rules_version(rules)
+        first = get_matcher(rules)
+        rules["x"].append("beta")
+
+        assert rules_version(rules) != version
+        assert get_matcher(rules) is not first
+
+
+class TestClassifier:
+    """Test api/classifier.classify on top of the matcher"""
+
+    def test_classify_default_rules(self):
+        """Test category and tags come from a single scan"""
+        result = classify("阿里云发布新一代大模型")
+
+        assert result["category"] == "产品"
+        assert result["tags"] == ["AI", "大模型", "产品发布"]
+
+    def test_classify_custom_rules(self):
+        """Test custom rules are compiled and used"""
+        result = classify("Rust release", {"lang": ["rust"]}, {"oss": ["release"]})
+
+        assert result["category"] == "lang"
+        assert result["tags"] == ["oss"]
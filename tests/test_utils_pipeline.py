@@ -0,0 +1,103 @@
+"""Tests for utils/pipeline.py"""
+
+import threading
+import time
+
+import pytest
+
+from utils.pipeline import Stage, StagedPipeline
+
+
+class TestStagedPipeline:
+    def test_items_flow_through_stages_in_input_order(self):
+        pipeline = StagedPipeline(
+            [
+                Stage("double", lambda x: x * 2, workers=4),
+                Stage("inc", lambda x: x + 1, workers=2),
+            ]
+        )
+
+        assert pipeline.run(list(range(20))) == [x * 2 + 1 for x in range(20)]
+
+    def test_stages_overlap(self):
+        # 两个各 0.05s 的阶段处理 6 个条目：串行约 0.6s，流水线约 0.35s
+        def slow(x):
+            time.sleep(0.05)
+            return x
+
+        pipeline = StagedPipeline([Stage("a", slow), Stage("b", slow)])
+        start = time.time()
+        assert pipeline.run(list(range(6))) == list(range(6))
+        assert time.time() - start < 0.5
+
+    def test_workers_run_concurrently(self):
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def work(x):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return x
+
+        StagedPipeline([Stage("work", work, workers=3)]).run(list(range(9)))
+        assert peak[0] == 3
+
+    def test_errors_drop_item_and_call_handler(self):
+        failures = []
+
+        def check(x):
+            if x == 2:
+                raise ValueError("bad")
+            return x
+
+        pipeline = StagedPipeline(
+            [Stage("check", check), Stage("keep", lambda x: x)],
+            on_error=lambda item, stage, e: failures.append((item, stage, str(e))),
+        )
+
+        assert pipeline.run([1, 2, 3]) == [1, 3]
+        assert failures == [(2, "check", "bad")]
+
+    def test_none_drops_item(self):
+        pipeline = StagedPipeline([Stage("odd", lambda x: x if x % 2 else None)])
+        assert pipeline.run(list(range(5))) == [1, 3]
+
+    def test_batch_stage_receives_lists(self):
+        batches = []
+
+        def batch(items):
+            batches.append(len(items))
+            return [x * 10 for x in items]
+
+        def slow(x):
+            time.sleep(0.01)
+            return x
+
+        pipeline = StagedPipeline(
+            [Stage("slow", slow, workers=4), Stage("batch", batch, batch_size=8)]
+        )
+
+        assert pipeline.run(list(range(12))) == [x * 10 for x in range(12)]
+        assert sum(batches) == 12
+        assert max(batches) <= 8
+
+    def test_failing_input_stops_workers_and_propagates(self):
+        def items():
+            yield 1
+            raise RuntimeError("feed broke")
+
+        done = []
+        pipeline = StagedPipeline([Stage("a", done.append, workers=2)])
+        with pytest.raises(RuntimeError, match="feed broke"):
+            pipeline.run(items())
+        assert done == [1]
+        assert not [t for t in threading.enumerate() if t.name.startswith("a-")]
+
+    def test_requires_stages(self):
+        with pytest.raises(ValueError):
+            StagedPipeline([])
@@ -16,6 +16,11 @@ from .rate_limit import (
     rate_limited,
     concurrent_limited,
 )
+from .keyword_matcher import (
+    KeywordMatcher,
+    get_matcher,
+    rules_version,
+)
 from .audit import (
     AuditLogger,
     AuditEvent,
@@ -39,6 +44,9 @@ __all__ = [
     "SemaphoreLimiter",
     "rate_limited",
     "concurrent_limited",
+    "KeywordMatcher",
+    "get_matcher",
+    "rules_version",
     "AuditLogger",
     "AuditEvent",
     "audit_log",
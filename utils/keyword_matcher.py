@@ -0,0 +1,161 @@
+"""关键词匹配模块 - 基于 Aho–Corasick 自动机的多模式匹配
+
+把若干张 "标签 -> 关键词列表" 规则表编译成一个自动机，一次扫描文本
+即可得到每张表中每个标签的命中数，取代逐个关键词 ``kw.lower() in text``
+的做法。编译结果按规则内容哈希缓存，同一套规则只编译一次。
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+RuleTable = Mapping[str, Sequence[str]]
+
+
+class KeywordMatcher:
+    """多张规则表共用的 Aho–Corasick 自动机
+
+    匹配不区分大小写，语义与 ``kw.lower() in text.lower()`` 一致：
+    每个关键词出现即算命中一次（同一表内重复列出的关键词按出现次数计分），
+    返回结果按规则表中标签的原始顺序排列。
+    """
+
+    def __init__(self, *tables: RuleTable):
+        """编译规则表
+
+        Args:
+            *tables: 一张或多张 "标签 -> 关键词列表" 规则表
+        """
+        self._labels: List[List[str]] = [list(table) for table in tables]
+        self._always: List[Dict[str, int]] = [{} for _ in tables]
+
+        # 关键词 -> [(表序号, 标签, 次数)]
+        keyword_hits: Dict[str, Dict[Tuple[int, str], int]] = {}
+        for index, table in enumerate(tables):
+            for label, keywords in table.items():
+                for keyword in keywords:
+                    keyword = keyword.lower()
+                    if not keyword:
+                        # 空串总是 "in" 任意文本
+                        self._always[index][label] = self._always[index].get(label, 0) + 1
+                        continue
+                    hits = keyword_hits.setdefault(keyword, {})
+                    hits[(index, label)] = hits.get((index, label), 0) + 1
+
+        self.keywords: List[str] = list(keyword_hits)
+        self._hits: List[List[Tuple[int, str, int]]] = [
+            [(index, label, count) for (index, label), count in keyword_hits[kw].items()]
+            for kw in self.keywords
+        ]
+        self._build(self.keywords)
+
+    def _build(self, keywords: List[str]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+        for keyword_id, keyword in enumerate(keywords):
+            node = 0
+            for char in keyword:
+                nxt = goto[node].get(char)
+                if nxt is None:
+                    goto.append({})
+                    outputs.append(())
+                    nxt = len(goto) - 1
+                    goto[node][char] = nxt
+                node = nxt
+            outputs[node] += (keyword_id,)
+
+        # 广度优先计算失败指针，并沿失败链合并输出
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, nxt in goto[node].items():
+                queue.append(nxt)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(char, 0)
+                fail[nxt] = target if target != nxt else 0
+                outputs[nxt] += outputs[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def find(self, text: str) -> List[str]:
+        """返回文本中出现的关键词（小写，按编译顺序）"""
+        found = self._scan(text)
+        return [self.keywords[keyword_id] for keyword_id in sorted(found)]
+
+    def _scan(self, text: str) -> set:
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found = set()
+        node = 0
+        for char in (text or "").lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                found.update(outputs[node])
+        return found
+
+    def count(self, text: str) -> List[Dict[str, int]]:
+        """一次扫描统计每张表中各标签的命中数
+
+        Args:
+            text: 待匹配文本
+
+        Returns:
+            与规则表一一对应的 {标签: 命中数} 列表，只包含命中的标签，
+            顺序与规则表一致
+        """
+        totals: List[Dict[str, int]] = [dict(always) for always in self._always]
+        for keyword_id in self._scan(text):
+            for index, label, hits in self._hits[keyword_id]:
+                totals[index][label] = totals[index].get(label, 0) + hits
+
+        return [
+            {label: table_totals[label] for label in labels if label in table_totals}
+            for labels, table_totals in zip(self._labels, totals)
+        ]
+
+
+def rules_version(*tables: RuleTable) -> str:
+    """规则表内容（含顺序）的哈希，用作编译缓存的键"""
+    payload = json.dumps(
+        [[[label, list(keywords)] for label, keywords in table.items()] for table in tables],
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+_MAX_CACHED_MATCHERS = 32
+_matchers: "OrderedDict[str, KeywordMatcher]" = OrderedDict()
+_matchers_lock = threading.Lock()
+
+
+def get_matcher(*tables: RuleTable, version: str = None) -> KeywordMatcher:
+    """获取规则表对应的已编译匹配器
+
+    Args:
+        *tables: 规则表
+        version: 规则版本号；不传则按规则内容哈希
+
+    Returns:
+        KeywordMatcher 实例（同一版本的规则只编译一次）
+    """
+    key = version or rules_version(*tables)
+    with _matchers_lock:
+        matcher = _matchers.get(key)
+        if matcher is not None:
+            _matchers.move_to_end(key)
+            return matcher
+
+    matcher = KeywordMatcher(*tables)
+    with _matchers_lock:
+        _matchers[key] = matcher
+        while len(_matchers) > _MAX_CACHED_MATCHERS:
+            _matchers.popitem(last=False)
+    return matcher
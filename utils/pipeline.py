@@ -0,0 +1,173 @@
+"""分阶段流水线 - 每个阶段独立的线程池、有界队列和限流
+
+条目依次流经各阶段（如 提取 → 摘要 → 分类 → 写入），相邻阶段之间是
+有界队列：慢阶段只会让上游在队列满时暂停，而不会让所有条目串行等待，
+整体吞吐取决于最慢的阶段而不是各阶段耗时之和。
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from .rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """流水线中的一个阶段
+
+    Attributes:
+        name: 阶段名（用于日志和错误回调）
+        func: 处理函数；batch_size == 1 时为 func(item) -> item，返回 None 表示
+            丢弃该条目；否则为 func(items) -> items，返回与输入等长的列表
+        workers: 工作线程数
+        queue_size: 输入队列容量，满时上游阻塞
+        rate_limiter: 每次调用 func 前获取令牌（批处理阶段按批计）
+        batch_size: 大于 1 时把队列中已就绪的条目攒成一批再处理
+    """
+
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: int = 0
+    rate_limiter: Optional[RateLimiter] = None
+    batch_size: int = 1
+
+
+class StagedPipeline:
+    """按阶段并发执行的流水线
+
+    单个条目在某阶段抛出的异常交给 on_error(item, stage_name, exc) 处理，
+    该条目随即被丢弃，不影响其他条目。
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        on_error: Optional[Callable[[Any, str, Exception], None]] = None,
+    ):
+        if not stages:
+            raise ValueError("流水线至少需要一个阶段")
+        self.stages = stages
+        self.on_error = on_error
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """处理所有条目
+
+        Args:
+            items: 输入条目；可以是生成器，边产出边处理，第一个队列满时
+                暂停消费
+
+        Returns:
+            走完全部阶段的条目，按输入（产出）顺序排列
+        """
+        queues = [
+            queue.Queue(maxsize=max(stage.queue_size, stage.workers))
+            for stage in self.stages
+        ]
+        results: List[Tuple[int, Any]] = []
+        results_lock = threading.Lock()
+        remaining = [stage.workers for stage in self.stages]
+        remaining_lock = threading.Lock()
+
+        def emit(index: int, position: int, item: Any) -> None:
+            if index + 1 < len(self.stages):
+                queues[index + 1].put((position, item))
+            else:
+                with results_lock:
+                    results.append((position, item))
+
+        def worker(index: int) -> None:
+            stage = self.stages[index]
+            inbox = queues[index]
+            finished = False
+            while not finished:
+                batch = []
+                first = inbox.get()
+                if first is _DONE:
+                    finished = True
+                else:
+                    batch.append(first)
+                    # 批处理阶段：顺带取走队列里已就绪的条目
+                    while len(batch) < stage.batch_size:
+                        try:
+                            entry = inbox.get_nowait()
+                        except queue.Empty:
+                            break
+                        if entry is _DONE:
+                            finished = True
+                            break
+                        batch.append(entry)
+                if batch:
+                    self._process(index, batch, emit)
+
+            # 本阶段最后一个退出的线程通知下游结束
+            with remaining_lock:
+                remaining[index] -= 1
+                last = remaining[index] == 0
+            if last and index + 1 < len(self.stages):
+                for _ in range(self.stages[index + 1].workers):
+                    queues[index + 1].put(_DONE)
+
+        threads = []
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=worker, args=(index,), name=f"{stage.name}-{n}", daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        try:
+            for position, item in enumerate(items):
+                queues[0].put((position, item))
+        finally:
+            # 输入生成器抛出异常时也要通知各阶段结束，否则工作线程永远阻塞
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+
+        results.sort(key=lambda entry: entry[0])
+        return [item for _, item in results]
+
+    def _process(self, index: int, batch: List[Tuple[int, Any]], emit) -> None:
+        stage = self.stages[index]
+        if stage.rate_limiter is not None:
+            stage.rate_limiter.wait_and_acquire()
+
+        if stage.batch_size > 1:
+            try:
+                outputs = stage.func([item for _, item in batch])
+            except Exception as e:
+                for _, item in batch:
+                    self._fail(item, stage, e)
+                return
+            for (position, _), output in zip(batch, outputs):
+                if output is not None:
+                    emit(index, position, output)
+            return
+
+        position, item = batch[0]
+        try:
+            output = stage.func(item)
+        except Exception as e:
+            self._fail(item, stage, e)
+            return
+        if output is not None:
+            emit(index, position, output)
+
+    def _fail(self, item: Any, stage: Stage, error: Exception) -> None:
+        if self.on_error is None:
+            logger.error(f"阶段 {stage.name} 处理失败: {error}")
+            return
+        try:
+            self.on_error(item, stage.name, error)
+        except Exception as e:
+            logger.error(f"阶段 {stage.name} 错误回调失败: {e}")